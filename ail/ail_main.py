@@ -5,6 +5,7 @@ import sys
 from importlib import import_module
 from .core import shared
 from .core import aconfig
+from .core import aimporttime
 from .core.astate import MAIN_INTERPRETER_STATE
 from .core.avmsig import WHY_HANDLING_ERR, WHY_ERROR
 from .core.abuiltins import init_builtins
@@ -30,6 +31,9 @@ class _Option:
         self.filename = ''
         self.rest_args = []
         self.source = False
+        self.watch = False
+        self.import_time = False
+        self.import_time_json = None
 
 
 class ArgParser:
@@ -86,10 +90,33 @@ class ArgParser:
 
     _do_d = _do_debug
 
+    def _do_X(self, opt: _Option):
+        n = self.__next_arg()
+        if n == 'importtime':
+            opt.import_time = True
+        elif n is not None and n.startswith('importtime='):
+            opt.import_time = True
+            opt.import_time_json = n[len('importtime='):]
+        elif n == 'poolstats':
+            aconfig.REPORT_POOL_STATS = True
+        else:
+            print('-X: invalid option')
+            self.__ok = False
+            return
+        self.__ok = True
+
     def _do_old(self, _):
         aconfig.OLD_PRINT = True
         self.__ok = True
 
+    def _do_preload(self, _):
+        aconfig.PRELOAD_IMPORTS = True
+        self.__ok = True
+
+    def _do_watch(self, opt: _Option):
+        opt.watch = True
+        self.__ok = True
+
     def parse(self, arg_list: list) -> _Option:
         option = _Option()
         self.__now_arg_list = arg_list
@@ -152,12 +179,17 @@ def _launch_main(argv: list, pyc_mode: bool = True) -> int:
     init_builtins()
 
     option = ArgParser().parse(argv)
+
+    if option is None:
+        return 1
+
     option.rest_args.insert(0, option.filename)
     shared.GLOBAL_SHARED_DATA.prog_argv = option.rest_args
     sys.argv = option.rest_args
 
-    if option is None:
-        return 1
+    if option.import_time:
+        aimporttime.enable_import_profiler(
+            option.filename, option.import_time_json)
 
     if option.shell_mode:
         from .core import ashell
@@ -181,6 +213,11 @@ def _launch_main(argv: list, pyc_mode: bool = True) -> int:
 
         if pyc_mode and not source_mode:
             MAIN_INTERPRETER_STATE.global_interpreter = InterpreterWrapper()
+
+            if option.watch:
+                from .core.awatch import watch_main
+                return watch_main(file_path)
+
             return exec_pyc_main(source, file_path, dict())
 
         ast = Parser().parse(Lex().lex(source), source, file_path, source_mode)
@@ -216,11 +253,25 @@ def _launch_main(argv: list, pyc_mode: bool = True) -> int:
         return 1
 
 
+def _report_pool_stats():
+    from .objects.integer import INTEGER_POOL
+    from .objects.string import STRING_INTERN_TABLE
+
+    for name, pool in (('integer pool', INTEGER_POOL),
+                       ('string intern table', STRING_INTERN_TABLE)):
+        print('%s: %s' % (name, ', '.join(
+            '%s=%s' % kv for kv in pool.stats().items())), file=sys.stderr)
+
+
 def launch_main(argv: list, pyc_mode: bool = True):
     try:
         return _launch_main(argv, pyc_mode)
     except SystemExit:
         return 0
+    finally:
+        aimporttime.report_import_time()
+        if aconfig.REPORT_POOL_STATS:
+            _report_pool_stats()
 
 
 if __name__ == '__main__':
@@ -21,6 +21,7 @@ from ..objects.float import FLOAT_TYPE
 
 from ..objects.function import (
     FUNCTION_TYPE,
+    accepts_py_natives as function_accepts_py_natives,
     convert_to_func_wrapper as _convert_to_func_wrapper
 )
 
@@ -59,6 +60,7 @@ __all__ = [
     'null', 'object_convert_to_ail_object', 'object_unpack_ailobj', 'object_get_type',
     'AILObject', 'AILObjectType',
     'object_call_object',
+    'function_accepts_py_natives',
     'integer_convert_to_interger',
     'struct_new_struct_object', 'struct_object_setattr', 'struct_object_getattr'
 ]
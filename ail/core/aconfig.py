@@ -19,3 +19,22 @@ PY_RUNTIME_IMPORT_NAME = 'ail.py_runtime'
 
 RENAME_PY_RUNTIME = True
 
+PRELOAD_IMPORTS = False
+
+# bound methods cached by each object of legacy classes, the oldest one is
+# dropped when it is full. 0 caches them by weak references, which never
+# keep them alive.
+BOUND_METHOD_CACHE_SIZE = 8
+
+# integers in [min, max) are shared objects of the legacy object model, the
+# range grows toward integers which are created often, up to the limit.
+INTEGER_POOL_RANGE = (-5, 257)
+INTEGER_POOL_ADAPTIVE = True
+INTEGER_POOL_LIMIT = 1 << 16
+
+# strings not longer than this are interned by convert_to_ail_object()
+STRING_INTERN_MAX_LENGTH = 20
+STRING_INTERN_LIMIT = 1 << 16
+
+# print the hit rates of INTEGER_POOL and STRING_INTERN_TABLE at exit
+REPORT_POOL_STATS = False
@@ -0,0 +1,172 @@
+# import time profiler (ail -X importtime)
+
+import json
+import sys
+
+from functools import wraps
+from time import perf_counter
+
+
+_PHASES = ('search', 'lex', 'parse', 'convert', 'compile', 'exec')
+
+_PROFILER = None
+
+
+class _ImportRecord:
+    __slots__ = ('name', 'phases', 'children', 'cumulative', 'child_time')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.phases = dict()  # phase name -> seconds (exclude child imports)
+        self.children = []
+        self.cumulative = 0
+        self.child_time = 0  # the cumulative time of child imports
+
+    @property
+    def self_time(self) -> float:
+        return self.cumulative - self.child_time
+
+    def to_dict(self) -> dict:
+        return {
+            'module': self.name,
+            'self_us': int(self.self_time * 1e6),
+            'cumulative_us': int(self.cumulative * 1e6),
+            'phases_us': {k: int(v * 1e6) for k, v in self.phases.items()},
+            'imports': [c.to_dict() for c in self.children],
+        }
+
+
+class _Phase:
+    __slots__ = ('record', 'name', 'start', 'child_time')
+
+    def __init__(self, record: _ImportRecord, name: str):
+        self.record = record
+        self.name = name
+
+    def __enter__(self):
+        self.child_time = self.record.child_time
+        self.start = perf_counter()
+
+    def __exit__(self, *_):
+        record = self.record
+        t = perf_counter() - self.start - \
+            (record.child_time - self.child_time)
+        record.phases[self.name] = record.phases.get(self.name, 0) + t
+
+
+class _NullPhase:
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *_):
+        pass
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class ImportProfiler:
+    def __init__(self, main_name: str, json_path: str = None):
+        self.root = _ImportRecord(main_name)
+        self.json_path = json_path
+
+        self.__stack = [self.root]
+        self.__start = perf_counter()
+
+    def phase(self, name: str) -> _Phase:
+        return _Phase(self.__stack[-1], name)
+
+    def profile(self, func, get_name):
+        """
+        :return: a wrapper of func which records an import named
+                 get_name(*args) while func running
+        """
+        stack = self.__stack
+
+        @wraps(func)
+        def profiled(*args, **kwargs):
+            record = _ImportRecord(get_name(*args))
+            parent = stack[-1]
+            stack.append(record)
+            start = perf_counter()
+
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record.cumulative = perf_counter() - start
+                stack.pop()
+
+                # a module which has been loaded is not an import
+                if 'exec' in record.phases:
+                    parent.children.append(record)
+                    parent.child_time += record.cumulative
+
+        return profiled
+
+    def finish(self):
+        self.root.cumulative = perf_counter() - self.__start
+
+    def print_tree(self, file=sys.stderr):
+        file.write('import time: %10s | %10s | %s | imported module\n' % (
+            'self [us]', 'cumulative',
+            ' | '.join('%8s' % p for p in _PHASES)))
+        self.__print_record(self.root, 0, file)
+
+    def __print_record(self, record: _ImportRecord, level: int, file):
+        phases = record.phases
+
+        file.write('import time: %10d | %10d | %s | %s%s\n' % (
+            record.self_time * 1e6, record.cumulative * 1e6,
+            ' | '.join('%8d' % (phases.get(p, 0) * 1e6) for p in _PHASES),
+            '  ' * level, record.name))
+
+        for child in record.children:
+            self.__print_record(child, level + 1, file)
+
+    def dump_json(self, path: str):
+        with open(path, 'w', encoding='UTF-8') as f:
+            json.dump(self.root.to_dict(), f, indent=2)
+
+
+def import_phase(name: str):
+    """
+    :return: a context which records the time of an import phase
+             to the importing module, do nothing if profiler disabled
+    """
+    if _PROFILER is None:
+        return _NULL_PHASE
+    return _PROFILER.phase(name)
+
+
+def enable_import_profiler(
+        main_name: str, json_path: str = None) -> ImportProfiler:
+    global _PROFILER
+
+    from .aloader import ModuleLoader
+    from ..py_runtime.objects import AILImporter
+
+    if _PROFILER is not None:
+        return _PROFILER
+
+    _PROFILER = ImportProfiler(main_name, json_path)
+
+    AILImporter.import_module = _PROFILER.profile(
+        AILImporter.import_module, lambda _, mode, name, *args: name)
+    ModuleLoader.load_namespace = _PROFILER.profile(
+        ModuleLoader.load_namespace, lambda _, name, *args: name)
+
+    return _PROFILER
+
+
+def report_import_time():
+    """
+    print the import time tree to stderr, and write JSON if required
+    """
+    if _PROFILER is None:
+        return
+
+    _PROFILER.finish()
+    _PROFILER.print_tree()
+
+    if _PROFILER.json_path:
+        _PROFILER.dump_json(_PROFILER.json_path)
@@ -1,7 +1,12 @@
 # module loader
 
 import os.path
+import re
+import sys
 
+from importlib import import_module
+from importlib.machinery import SourceFileLoader
+from importlib.util import module_from_spec, spec_from_file_location
 from inspect import isfunction
 from os import chdir, getcwd
 from traceback import format_exc
@@ -10,14 +15,20 @@ from typing import Tuple, Union
 from .alex import Lex
 from .aparser import Parser
 from .acompiler import Compiler
+from .aimporttime import import_phase
 from .astate import MAIN_INTERPRETER_STATE
 from .avmsig import WHY_HANDLING_ERR, WHY_ERROR
 
 from . import aobjects as objs, error
 from . import shared
 
+from .._config import BUILTINS_MODULE_PATH
+
 _ALLOW_FILE_TYPE = ('ail', 'py', 'ailp')
 
+_BUILTINS_PY_PACKAGE = 'ail.modules'
+_PY_MODULE_NAME_PREFIX = '__ail_py_module__'
+
 '''
 如果你想要创建一个 AIL 的 Python 模块
 请务必在模块中定义一个 '_AIL_NAMESPACE_' 字典
@@ -37,6 +48,52 @@ def _trim_path(path: str) -> str:
     return path
 
 
+def _get_py_module_name(pypath: str) -> str:
+    """
+    :return: the name in sys.modules of an AIL Python module
+    """
+    mod_dir, mod_file = os.path.split(pypath)
+    name, ext = os.path.splitext(mod_file)
+
+    if ext == '.py' and os.path.normcase(mod_dir) == \
+            os.path.normcase(os.path.abspath(BUILTINS_MODULE_PATH)):
+        return '%s.%s' % (_BUILTINS_PY_PACKAGE, name)
+
+    return _PY_MODULE_NAME_PREFIX + re.sub(
+        r'\W', '_', os.path.normcase(pypath))
+
+
+def _import_py_module(pypath: str):
+    """
+    import an AIL Python module through importlib, so that the module
+    gets cached bytecode and is shared through sys.modules.
+    """
+    name = _get_py_module_name(pypath)
+
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    if name.startswith(_BUILTINS_PY_PACKAGE + '.'):
+        with import_phase('exec'):
+            return import_module(name)
+
+    # '.ailp' is not a Python source suffix, so give the loader explicitly
+    loader = SourceFileLoader(name, pypath)
+    spec = spec_from_file_location(name, pypath, loader=loader)
+    module = module_from_spec(spec)
+
+    sys.modules[name] = module
+    try:
+        with import_phase('exec'):
+            loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(name, None)
+        raise
+
+    return module
+
+
 class ModuleLoader:
     def __init__(self):
         self.__loaded = {}
@@ -46,31 +103,32 @@ class ModuleLoader:
     def __load_path(self):
         return shared.GLOBAL_SHARED_DATA.find_path
 
-    def __search_module(self, name: str) -> str:
+    def __search_module(self, name: str, work_dir: str = None) -> str:
         """
+        :param work_dir: the directory which relative find paths based on,
+                         current working directory if None
         :return: module path if found else None
         """
         maybe_file = ['%s.%s' % (name, x) for x in _ALLOW_FILE_TYPE]
 
-        for mfp in maybe_file:
-            for sp in self.__load_path:
-                absfp = os.path.abspath(sp)
-                jfp = os.path.join(absfp, mfp)
-                jfp = _trim_path(jfp)
-                if os.path.exists(jfp) and os.path.isfile(jfp):
-                    return jfp
+        with import_phase('search'):
+            for mfp in maybe_file:
+                for sp in self.__load_path:
+                    if work_dir is not None:
+                        sp = os.path.join(work_dir, sp)
+                    absfp = os.path.abspath(sp)
+                    jfp = os.path.join(absfp, mfp)
+                    jfp = _trim_path(jfp)
+                    if os.path.exists(jfp) and os.path.isfile(jfp):
+                        return jfp
 
         return None
 
     search_module = __search_module
 
     def __load_py_namespace(self, pypath, convert: bool = True, pyc_mode=False):
-        v = {}
-
         try:
-            cobj = compile(
-                    open(pypath, encoding='UTF-8').read(), pypath, 'exec')
-            exec(cobj, v)
+            v = vars(_import_py_module(pypath))
         except Exception as e:
             excs = format_exc()
             return error.AILRuntimeError(
@@ -91,7 +149,9 @@ class ModuleLoader:
                 '%s is not an AIL MODULE!' % pypath, 'LoadError')
 
         if '_AIL_NAMESPACE_' in v:
-            nsp = v['_AIL_NAMESPACE_']
+            # the module is shared through sys.modules, never modify
+            # its namespace in place
+            nsp = dict(v['_AIL_NAMESPACE_'])
 
             # convert all objects to AILObject
             for k, v in nsp.items():
@@ -184,15 +244,20 @@ class ModuleLoader:
 
         elif self.__get_type(p) == 'ail':
             source = open(p).read()
-            ast = Parser().parse(Lex().lex(source), source, p)
-            cobj = Compiler(filename=p, name=p).compile(ast).code_object
+            with import_phase('lex'):
+                ts = Lex().lex(source)
+            with import_phase('parse'):
+                ast = Parser().parse(ts, source, p)
+            with import_phase('compile'):
+                cobj = Compiler(filename=p, name=p).compile(ast).code_object
 
             frame = Frame(cobj, cobj.varnames, cobj.consts)
 
             namespace = dict()
             interpreter = MAIN_INTERPRETER_STATE.global_interpreter
-            why = interpreter.exec_for_import(
-                    cobj, frame, globals=namespace)
+            with import_phase('exec'):
+                why = interpreter.exec_for_import(
+                        cobj, frame, globals=namespace)
 
             remove_path(p)
             chdir(cwd)
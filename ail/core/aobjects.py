@@ -80,21 +80,96 @@ class AILCodeObject:
     __repr__ = __str__
 
 
+# hash target of objects hashed by identity
+_IDENTITY_HASH = object()
+
+
 class AILObject:
-    """Base object, do noting..."""
+    """
+    Base object, do noting...
+
+    value, cls and hash are the '__value__', '__class__' and the hash target
+    of the object, other attributes are stored in properties, which is
+    created at the first write. value is unset if the object has no value.
+    """
+
+    __slots__ = ('value', 'cls', 'hash', 'hash_handler', 'reference',
+                 '_properties', '__dict__', '__weakref__')
 
     def __init__(self, **ps):
-        self.__hash_target = object()  # hash
+        self.cls = ps.pop('__class__', None)
+        if '__value__' in ps:
+            self.value = ps.pop('__value__')
 
+        self.hash = _IDENTITY_HASH
         self.hash_handler = None
-        self.properties = ps
+        self._properties = ps if ps else None
         self.reference = 0
 
+    @property
+    def properties(self) -> dict:
+        props = self._properties
+        if props is None:
+            props = self._properties = dict()
+        return props
+
+    @properties.setter
+    def properties(self, props: dict):
+        self._properties = props
+
     def __getitem__(self, key: str):
-        return self.properties.get(key)
+        if key == '__value__':
+            try:
+                return self.value
+            except AttributeError:
+                return None
+        elif key == '__class__':
+            return self.cls
+
+        props = self._properties
+        if props is not None and key in props:
+            return props[key]
+
+        obj_type = self.cls
+        if isinstance(obj_type, AILObjectType):
+            return obj_type.lookup(self, key)
+        return None
 
     def __setitem__(self, key: str, value):
-        self.properties[key] = value
+        if key == '__value__':
+            self.value = value
+        elif key == '__class__':
+            self.cls = value
+        else:
+            self.properties[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        if key == '__value__':
+            return hasattr(self, 'value')
+        elif key == '__class__':
+            return self.cls is not None
+
+        props = self._properties
+        if props is not None and key in props:
+            return True
+
+        obj_type = self.cls
+        return isinstance(obj_type, AILObjectType) and obj_type.provides(key)
+
+    def __copy__(self):
+        # a copy shares the properties with the object
+        o = AILObject.__new__(AILObject)
+        o.cls = self.cls
+        o.hash = self.hash
+        o.hash_handler = self.hash_handler
+        o.reference = self.reference
+        o._properties = self.properties
+
+        if hasattr(self, 'value'):
+            o.value = self.value
+        o.__dict__.update(self.__dict__)
+
+        return o
 
     def __str__(self):
         s = self['__str__'](self)
@@ -139,13 +214,15 @@ class AILObject:
 
     def __hash__(self) -> int:
         if self.hash_handler is None:
-            return hash(self.__hash_target)
+            if self.hash is _IDENTITY_HASH:
+                return object.__hash__(self)
+            return hash(self.hash)
         hash_val = check_object(self.hash_handler(self), not_convert=True)
 
         return hash_val
     
     def set_hash_target(self, hash_target: object):
-        self.__hash_target = hash_target
+        self.hash = hash_target
 
 
 class AILObjectType:
@@ -159,6 +236,59 @@ class AILObjectType:
         self.otype = types.I_TYPE_TYPE if otype is None else otype
         self.methods = methods if methods is not None else dict()
 
+        # shared by all objects of this type, built by the first new_object()
+        self.vtable = None  # name -> required attribute
+        self.method_table = None  # name -> method, bound on access
+
+    def build_vtable(self, normal: dict):
+        """
+        build the tables looked up by objects which have not set the name,
+        methods override the required attributes, and the normal
+        attributes override methods unless the type requires them.
+        """
+        vtable = dict(self.required)
+        method_table = {mn: mo for mn, mo in self.methods.items()
+                        if not isinstance(mo, AILObject)}
+
+        for mn in method_table:
+            vtable.pop(mn, None)
+
+        for name, default in normal.items():
+            if name in self.required:
+                continue
+            vtable[name] = default
+            method_table.pop(name, None)
+
+        self.method_table = method_table
+        self.vtable = vtable
+
+    def lookup(self, obj: AILObject, name: str):
+        """
+        :return: the attribute of this type for obj, a method is bound to obj
+                 and stored in obj at the first access
+        """
+        vtable = self.vtable
+        if vtable is None:
+            return None
+
+        v = vtable.get(name)
+        if v is not None:
+            return v
+
+        mo = self.method_table.get(name)
+        if mo is None:
+            return None
+
+        f = ObjectCreater._to_wrapper(mo)
+        f.properties['__this__'] = obj  # bound self to __this__
+        obj.properties[name] = f
+
+        return f
+
+    def provides(self, name: str) -> bool:
+        return self.vtable is not None and (
+            name in self.vtable or name in self.method_table)
+
     def __str__(self):
         return '<AIL Type \'%s\'>' % self.name
 
@@ -168,7 +298,7 @@ class AILObjectType:
 class ObjectCreater:
     from ..objects import ailobject as __aobj
     from ..objects.function import \
-        convert_to_func_wrapper as __to_wrapper
+        convert_to_func_wrapper as _to_wrapper
 
     __required_normal = {
         '__str__': __aobj.obj_func_str,
@@ -186,30 +316,15 @@ class ObjectCreater:
         :return : obj_type 创建的对象，并将 *args 作为初始化参数
         """
 
-        obj = AILObject()  # create an object
-        obj.properties['__class__'] = obj_type
-
-        for k, v in obj_type.required.items():
-            obj.properties[k] = v
-
-        if obj_type.methods is not None:
-            for mn, mo in obj_type.methods.items():
-                if not isinstance(mo, AILObject):
-                    f = ObjectCreater.__to_wrapper(mo)
+        if obj_type.vtable is None:
+            obj_type.build_vtable(ObjectCreater.__required_normal)
 
-                    f.properties['__this__'] = obj  # bound self to __this__
-                    obj.properties[mn] = f
-
-        # check normal required
-        t_req_keys = set(obj_type.required.keys())
-
-        for name, default in ObjectCreater.__required_normal.items():
-            if name in t_req_keys:
-                continue
-            obj.properties[name] = default
+        # required attributes and methods are looked up in obj_type
+        obj = AILObject()  # create an object
+        obj.cls = obj_type
 
         # call init method
-        init_mthd = obj.properties['__init__']
+        init_mthd = obj_type.vtable['__init__']
         r = init_mthd(obj, *args)
 
         if isinstance(r, error.AILRuntimeError):
@@ -232,6 +347,8 @@ _WRAPPER_TYPE = None
 _PY_FUNCTION_TYPE = None
 _BYTES_TYPE = None
 _null = None
+_INTEGER_POOL = None
+_STRING_INTERN_TABLE = None
 _not_loaded = True
 
 
@@ -247,6 +364,8 @@ def convert_to_ail_object(pyobj: object) -> AILObject:
     global _PY_FUNCTION_TYPE
     global _BYTES_TYPE
     global _null
+    global _INTEGER_POOL
+    global _STRING_INTERN_TABLE
 
     if isinstance(pyobj, AILObject):
         return pyobj
@@ -262,6 +381,8 @@ def convert_to_ail_object(pyobj: object) -> AILObject:
         from ..objects.function import PY_FUNCTION_TYPE as _PY_FUNCTION_TYPE
         from ..objects.bytes import BYTES_TYPE as _BYTES_TYPE
         from ..objects.null import null as _null
+        from ..objects.integer import INTEGER_POOL as _INTEGER_POOL
+        from ..objects.string import STRING_INTERN_TABLE as _STRING_INTERN_TABLE
         _not_loaded = False
 
     if pyobj is None:
@@ -271,13 +392,13 @@ def convert_to_ail_object(pyobj: object) -> AILObject:
     ail_t = _WRAPPER_TYPE
 
     if py_t is int:
-        ail_t = _INTEGER_TYPE
+        return _INTEGER_POOL.get(pyobj)
     elif py_t is float:
         ail_t  = _FLOAT_TYPE
     elif py_t is complex:
         ail_t = _COMPLEX_TYPE
     elif py_t is str:
-        ail_t = _STRING_TYPE
+        return _STRING_INTERN_TABLE.get(pyobj)
     elif py_t is bytes:
         ail_t = _BYTES_TYPE
     elif py_t is bool:
@@ -317,7 +438,7 @@ def compare_type(o, *t):
 
 def has_attr(aobj: AILObject, name: str):
     if isinstance(aobj, AILObject):
-        return name in aobj.properties
+        return name in aobj
     return False
 
 
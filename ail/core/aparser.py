@@ -1385,6 +1385,7 @@ class Parser:
 
         vl = []
         pl = []
+        tl = []
 
         while self.__now_tok.ttype == AIL_ENTER:
             self.__next_tok()
@@ -1402,7 +1403,7 @@ class Parser:
             vl.append(self.__now_tok.value)
             self.__next_tok()  # eat NAME
 
-            self.__parse_type_comment()
+            tl.append(self.__get_member_type(self.__parse_type_comment()))
 
             if self.__now_tok.ttype != AIL_ENTER:
                 self.__syntax_error()
@@ -1417,7 +1418,30 @@ class Parser:
 
         self.__next_tok()  # eat end_tok
 
-        return ast.StructDefineAST(name, vl, pl, ln)
+        return ast.StructDefineAST(
+            name, vl, pl, ln, tl if any(tl) else None)
+
+    def __get_member_type(self, type_expr) -> str:
+        """
+        :return: the type of a struct member in string, such as 'int',
+                 'bytes(16)' or a format code, None if no type comment
+        """
+        if type_expr is None:
+            return None
+
+        if isinstance(type_expr, ast.CellAST) and \
+                type_expr.type in (AIL_IDENTIFIER, AIL_STRING):
+            return type_expr.value
+
+        if isinstance(type_expr, ast.CallExprAST) and \
+                isinstance(type_expr.left, ast.CellAST) and \
+                type_expr.left.type == AIL_IDENTIFIER and \
+                len(type_expr.arg_list.arg_list) == 1:
+            size = type_expr.arg_list.arg_list[0].expr
+            if isinstance(size, ast.CellAST) and size.type == AIL_NUMBER:
+                return '%s(%s)' % (type_expr.left.value, size.value)
+
+        self.__syntax_error('invalid type of struct member', type_expr.ln)
 
     def __parse_doc_string_object(self):
         if self.__now_tok.ttype != AIL_DOC_STRING:
@@ -2411,7 +2435,7 @@ class ASTConverter:
         elif cell.value == 'true':
             return _set_lineno(constant_expr(True), cell.ln)
         elif cell.value == 'false':
-            return _set_lineno(constant_expr(True), cell.ln)
+            return _set_lineno(constant_expr(False), cell.ln)
         elif cell.type == AIL_NUMBER:
             return _set_lineno(constant_expr(eval(cell.value)), cell.ln)
         elif cell.type == AIL_STRING:
@@ -2745,7 +2769,11 @@ class ASTConverter:
                                        [self._new_constant(n, struct.ln) for n in struct.protected_list],
                                        load_ctx(),
                                    ), struct.ln),
-                               ], struct.ln))
+                               ] + ([_set_lineno(list_expr(
+                                       [self._new_constant(t, struct.ln) for t in struct.type_list],
+                                       load_ctx(),
+                                   ), struct.ln)] if struct.type_list else []),
+                               struct.ln))
 
     def _convert_arguments(self, args: ast.ArgListAST) -> pyast.arguments:
         argl = []
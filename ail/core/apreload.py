@@ -0,0 +1,148 @@
+# import graph analysis and dependency preloading
+
+import marshal
+import os.path
+
+from concurrent.futures import (
+    ProcessPoolExecutor, FIRST_COMPLETED, wait
+)
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List
+
+from . import asts as ast, error
+from .aloader import MAIN_LOADER
+from .pyexec import cache_code, compile_ail_source
+
+from ..py_runtime import shared as _rt_shared
+
+
+def get_import_names(block: ast.BlockAST) -> List[str]:
+    """
+    :return: module names of all top-level 'import' and 'load' statements
+    """
+    return [stmt.path for stmt in block.stmts
+            if isinstance(stmt, (ast.ImportStmtAST, ast.LoadStmtAST))]
+
+
+class ImportGraph:
+    """
+    module path -> paths of the modules it imports
+    """
+
+    def __init__(self, dependencies: Dict[str, List[str]] = None):
+        self.dependencies: Dict[str, List[str]] = \
+            dict() if dependencies is None else dependencies
+
+    def add_module(self, path: str, import_names: List[str],
+                   work_dir: str = None) -> List[str]:
+        """
+        resolve the imports of a module, import names are searched
+        as if the module is importing them.
+
+        :param work_dir: working directory while the module running,
+                         the directory of the module if None
+        :return: AIL modules which are not in this graph yet
+        """
+        if work_dir is None:
+            work_dir = os.path.dirname(path)
+
+        deps = []
+        new_modules = []
+
+        for name in import_names:
+            dep = MAIN_LOADER.search_module(name, work_dir)
+            if dep is None or dep in deps:
+                continue  # reports while importing
+            deps.append(dep)
+
+            if dep not in self.dependencies and dep not in new_modules:
+                if MAIN_LOADER.get_type(dep) == 'ail':
+                    new_modules.append(dep)
+                else:
+                    self.dependencies[dep] = []
+
+        self.dependencies[path] = deps
+
+        return new_modules
+
+    def get_dependents(self, path: str) -> List[str]:
+        """
+        :return: modules which import this module directly
+        """
+        return [p for p, deps in self.dependencies.items() if path in deps]
+
+
+def _compile_module(path: str) -> tuple:
+    """
+    compile an AIL module, runs in the preloading worker processes.
+
+    :return: (path, source, marshalled code, import names),
+             the code is None if failed to compile
+    """
+    throw_error = error.THROW_ERROR_TO_PYTHON
+    error.THROW_ERROR_TO_PYTHON = True
+
+    try:
+        with open(path, encoding='UTF-8') as f:
+            source = f.read()
+        code, node = compile_ail_source(source, path)
+    except Exception:
+        # let the importer reports it
+        return path, None, None, []
+    finally:
+        error.THROW_ERROR_TO_PYTHON = throw_error
+
+    return path, source, marshal.dumps(code), get_import_names(node)
+
+
+def _get_missing(modules: List[str]) -> List[str]:
+    return [p for p in modules if p not in _rt_shared.loaded_modules]
+
+
+def _preload_parallel(graph: ImportGraph,
+                      modules: List[str], max_workers: int = None):
+    with ProcessPoolExecutor(max_workers) as executor:
+        futures = {executor.submit(_compile_module, p) for p in modules}
+        graph.dependencies.update({p: [] for p in modules})
+
+        while futures:
+            done, futures = wait(futures, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                path, source, code, import_names = future.result()
+                if code is not None:
+                    cache_code(path, source, marshal.loads(code))
+
+                new_modules = _get_missing(
+                    graph.add_module(path, import_names))
+                graph.dependencies.update({p: [] for p in new_modules})
+
+                futures.update(executor.submit(_compile_module, p)
+                               for p in new_modules)
+
+
+def preload_imports(block: ast.BlockAST, filename: str,
+                    max_workers: int = None) -> ImportGraph:
+    """
+    find all modules which the main module imports directly or indirectly,
+    and compile those have not loaded concurrently into the compile cache
+    before the main module starts.
+
+    :return: the import graph of the main module
+    """
+    graph = ImportGraph()
+
+    # the main module runs in the current working directory
+    modules = _get_missing(graph.add_module(
+        os.path.abspath(filename), get_import_names(block), os.getcwd()))
+
+    if not modules:
+        return graph
+
+    try:
+        _preload_parallel(graph, modules, max_workers)
+    except (OSError, NotImplementedError, BrokenProcessPool):
+        # no process pool here, modules will be compiled while importing
+        pass
+
+    return graph
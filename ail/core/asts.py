@@ -451,10 +451,12 @@ class ImportStmtAST:
 
 
 class StructDefineAST:
-    def __init__(self, name: str, name_list: list, protected_list: list, ln: int):
+    def __init__(self, name: str, name_list: list, protected_list: list, ln: int,
+                 type_list: list = None):
         self.name = name
         self.name_list = name_list
         self.protected_list = protected_list
+        self.type_list = type_list  # type of each member, None if untyped
         self.ln = ln
 
 
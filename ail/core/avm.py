@@ -610,8 +610,8 @@ class Interpreter:
     
     @lru_cache(None)
     def __bool_test(self, obj):
-        if '__value__' in obj.properties:
-            return bool(obj.properties['__value__'])
+        if '__value__' in obj:
+            return bool(obj.value)
 
     def __pop_and_unwind_block(self, why) -> Block:
         stack = self.__block_stack
@@ -0,0 +1,199 @@
+# watch mode (ail --watch)
+
+import os.path
+import sys
+
+from threading import Event, Lock, Thread
+from time import perf_counter, sleep
+from typing import Dict, List, Set, Tuple
+
+from .apreload import ImportGraph
+from .pyexec import exec_pyc_main
+
+from ..py_runtime.functions import _IMPORTER
+from ..py_runtime.exceptions import print_py_traceback
+
+
+POLL_INTERVAL = 0.2  # seconds
+
+
+def _get_stat(path: str) -> Tuple[int, int]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _sort_modules(graph: ImportGraph, modules: Set[str]) -> List[str]:
+    """
+    :return: modules in order that every module comes after the modules
+             it imports
+    """
+    result = []
+    visited = set()
+
+    def visit(path):
+        if path in visited:
+            return
+        visited.add(path)
+        for dep in graph.dependencies.get(path, ()):
+            if dep in modules:
+                visit(dep)
+        result.append(path)
+
+    for m in sorted(modules):
+        visit(m)
+
+    return result
+
+
+class Watcher:
+    """
+    runs the main module, and runs it again when a source in its import
+    graph changes.
+
+    modules are never reloaded while the main module is running, a change
+    is applied after the main module returns, so a main module that never
+    returns (a server loop, for example) never sees the change.
+    """
+
+    def __init__(self, main_path: str, interval: float = POLL_INTERVAL):
+        self.main_path = os.path.abspath(main_path)
+        self.interval = interval
+
+        self.__file_path = main_path
+        self.__stats: Dict[str, Tuple[int, int]] = dict()
+        self.__changed: Set[str] = set()
+        self.__changed_lock = Lock()
+        self.__rerun = Event()
+        self.__main_running = Event()
+
+    def get_graph(self) -> ImportGraph:
+        deps = _IMPORTER.get_dependencies()
+        deps[self.main_path] = deps.pop(None, [])
+        return ImportGraph(deps)
+
+    def __get_watched_paths(self, graph: ImportGraph) -> Set[str]:
+        paths = {self.main_path}
+        for deps in graph.dependencies.values():
+            paths.update(p for p in deps if p.endswith('.ail'))
+        return paths
+
+    def __get_changed(self, graph: ImportGraph) -> Set[str]:
+        changed = set()
+
+        for path in self.__get_watched_paths(graph):
+            stat = _get_stat(path)
+            old_stat = self.__stats.get(path)
+            self.__stats[path] = stat
+
+            if old_stat is not None and stat != old_stat:
+                changed.add(path)
+
+        return changed
+
+    def __get_affected(self, graph: ImportGraph, changed: Set[str]) -> Set[str]:
+        affected = set()
+        stack = list(changed)
+
+        while stack:
+            path = stack.pop()
+            if path in affected:
+                continue
+            affected.add(path)
+            stack.extend(graph.get_dependents(path))
+
+        return affected
+
+    def reload_changed(self, changed: Set[str]):
+        """
+        reload changed modules and the modules depend on them.
+        """
+        graph = self.get_graph()
+        affected = self.__get_affected(graph, changed)
+        affected.discard(self.main_path)
+
+        start = perf_counter()
+        reloaded = []
+
+        for path in _sort_modules(graph, affected):
+            try:
+                if _IMPORTER.reload_module(path):
+                    reloaded.append(path)
+            except (Exception, SystemExit):
+                if not isinstance(sys.exc_info()[1], SystemExit):
+                    print_py_traceback()
+                sys.stderr.write(
+                    '[watch] failed to reload \'%s\'\n' % path)
+                break
+
+        if reloaded:
+            sys.stderr.write('[watch] reloaded %s in %.2f ms\n' % (
+                ', '.join(os.path.basename(p) for p in reloaded),
+                (perf_counter() - start) * 1000))
+
+    def __watch(self):
+        # only polls in this thread, modules are reloaded in the main thread
+        # so that they never run concurrently with the main module.
+        self.__get_changed(self.get_graph())  # take the first stats
+
+        while True:
+            sleep(self.interval)
+
+            changed = self.__get_changed(self.get_graph())
+            if changed:
+                with self.__changed_lock:
+                    self.__changed.update(changed)
+                self.__rerun.set()
+
+                if self.__main_running.is_set():
+                    sys.stderr.write(
+                        '[watch] %s changed, reloads after %s returns\n' % (
+                            ', '.join(os.path.basename(p)
+                                      for p in sorted(changed)),
+                            self.__file_path))
+
+    def __run_main(self) -> int:
+        try:
+            with open(self.__file_path, encoding='UTF-8') as f:
+                source = f.read()
+            return exec_pyc_main(source, self.__file_path, dict())
+        except SystemExit:
+            return 1
+        except OSError as e:
+            sys.stderr.write('[watch] cannot read \'%s\': %s\n' %
+                             (self.__file_path, e))
+            return 1
+
+    def run(self) -> int:
+        Thread(target=self.__watch, daemon=True).start()
+
+        while True:
+            start = perf_counter()
+            self.__main_running.set()
+            try:
+                self.__run_main()
+            finally:
+                self.__main_running.clear()
+            sys.stderr.write('[watch] %s finished in %.2f ms, '
+                             'waiting for changes...\n' % (
+                                 self.__file_path,
+                                 (perf_counter() - start) * 1000))
+
+            try:
+                self.__rerun.wait()
+            except KeyboardInterrupt:
+                return 0
+
+            self.__rerun.clear()
+
+            with self.__changed_lock:
+                changed = self.__changed
+                self.__changed = set()
+
+            self.reload_changed(changed)
+
+
+def watch_main(file_path: str) -> int:
+    return Watcher(file_path).run()
@@ -1,6 +1,8 @@
 # python compatible
 
+from . import aconfig
 from .alex import Lex
+from .aimporttime import import_phase
 from .aparser import ASTConverter, Parser
 
 from ..py_runtime import AIL_PY_GLOBAL
@@ -18,6 +20,10 @@ class StopExec(BaseException):
     pass
 
 
+# compiled AIL modules: filename -> (source, code object)
+_COMPILE_CACHE = dict()
+
+
 def _test_run():
 
     source = open('./tests/test.ail').read()
@@ -33,19 +39,54 @@ def _test_run():
     exec(code, AIL_PY_GLOBAL)
 
 
+def compile_ail_source(source: str, filename: str) -> tuple:
+    """
+    :return: (Python code object, AIL AST) of an AIL module
+    """
+    with import_phase('lex'):
+        ts = Lex().lex(source, filename)
+
+    with import_phase('parse'):
+        node = Parser().parse(ts, source, filename, True)
+
+    with import_phase('convert'):
+        tree = ASTConverter().convert_module(node)
+
+    with import_phase('compile'):
+        code = compile(tree, filename, 'exec')
+
+    return code, node
+
+
+def cache_code(filename: str, source: str, code):
+    _COMPILE_CACHE[filename] = (source, code)
+
+
+def get_cached_code(filename: str, source: str):
+    """
+    :return: the cached code object if it compiled from the same source
+             else None
+    """
+    cached = _COMPILE_CACHE.get(filename)
+    if cached is None or cached[0] != source:
+        return None
+    return cached[1]
+
+
 def exec_as_python(
         source: str, filename: str, globals: dict, main: bool = True) -> int:
     """
     :return: code: 0 -> ok | 1 -> exception occurred | 2 -> system exit
     """
-    l = Lex()
-    ts = l.lex(source, filename)
+    code = get_cached_code(filename, source)
 
-    p = Parser()
-    node = p.parse(ts, source, filename, True)
+    if code is None:
+        code, node = compile_ail_source(source, filename)
+        cache_code(filename, source, code)
 
-    converter = ASTConverter()
-    code = compile(converter.convert_module(node), filename, 'exec')
+        if main and aconfig.PRELOAD_IMPORTS:
+            from .apreload import preload_imports
+            preload_imports(node, filename)
 
     name = '__main__'
 
@@ -53,8 +94,9 @@ def exec_as_python(
         name = filename
 
     fill_namespace(globals, name, main)
-    
-    exec(code, globals)
+
+    with import_phase('exec'):
+        exec(code, globals)
     return 0
 
 
@@ -191,7 +191,8 @@ def make_ast_tree(a) -> dict:
         return {'StructDefineAST': {
             'name': make_ast_tree(a.name),
             'name_list': make_ast_tree(a.name_list),
-            'protected': make_ast_tree(a.protected_list)}}
+            'protected': make_ast_tree(a.protected_list),
+            'types': make_ast_tree(a.type_list)}}
 
     elif isinstance(a, ast.NotTestAST):
         return {'NotTestAST': {'expr': make_ast_tree(a.expr)}}
@@ -0,0 +1,97 @@
+# dynamic array, replaces lib/array.ail
+
+from typing import Iterable
+
+
+class _list_t:
+    """
+    a dynamic array backed by a Python list, has the API of _list_t in the
+    old lib/array.ail and appends in amortised O(1)
+    """
+
+    __slots__ = ('__ele',)
+
+    def __init__(self, elements: Iterable = None):
+        self.__ele = [] if elements is None else list(elements)
+
+    @property
+    def size(self) -> int:
+        return len(self.__ele)
+
+    def append(self, o) -> bool:
+        self.__ele.append(o)
+        return True
+
+    def extend(self, iterable: Iterable) -> bool:
+        if isinstance(iterable, _list_t):
+            iterable = iterable.__ele
+        self.__ele.extend(iterable)
+        return True
+
+    def insert(self, index: int, o) -> bool:
+        if type(index) is not int:
+            return False
+        self.__ele.insert(index, o)
+        return True
+
+    def pop(self, index: int = -1):
+        """
+        :return: the object removed from index, the last one by default
+        """
+        return self.__ele.pop(index)
+
+    def remove(self, index: int) -> bool:
+        """
+        remove the object at 'index'
+        """
+        if type(index) is not int:
+            return False
+
+        if not -len(self.__ele) <= index < len(self.__ele):
+            return False
+
+        del self.__ele[index]
+        return True
+
+    def get(self, index: int):
+        return self.__ele[index]
+
+    def set(self, index: int, o):
+        self.__ele[index] = o
+
+    def clear(self):
+        self.__ele.clear()
+
+    def toArray(self) -> list:
+        return self.__ele.copy()
+
+    def toString(self) -> str:
+        return repr(self.__ele)
+
+    def __len__(self) -> int:
+        return len(self.__ele)
+
+    def __getitem__(self, index):
+        return self.__ele[index]
+
+    def __setitem__(self, index, o):
+        self.__ele[index] = o
+
+    def __iter__(self):
+        return iter(self.__ele)
+
+    def __str__(self) -> str:
+        return '<list %s>' % repr(self.__ele)
+
+    __repr__ = __str__
+
+
+def list_(elements: Iterable = None) -> _list_t:
+    return _list_t(elements)
+
+
+_AIL_PYC_MODULE_ = True
+_AIL_NAMESPACE_ = {
+    '_list_t': _list_t,
+    'list': list_,
+}
@@ -9,6 +9,7 @@ from ail.api.error import AILRuntimeError
 _console_struct_object_cache = None
 
 
+@function_accepts_py_natives
 def _console_writeln(_, msg):
     msg = object_unpack_ailobj(msg)
 
@@ -19,6 +20,7 @@ def _console_writeln(_, msg):
     stdout.flush()
 
 
+@function_accepts_py_natives
 def _console_write(_, msg):
     msg = object_unpack_ailobj(msg)
 
@@ -29,6 +31,7 @@ def _console_write(_, msg):
     stdout.flush()
 
 
+@function_accepts_py_natives
 def _console_errorln(_, msg):
     msg = object_unpack_ailobj(msg)
 
@@ -38,6 +41,7 @@ def _console_errorln(_, msg):
     stderr.write(msg + '\n')
 
 
+@function_accepts_py_natives
 def _console_error(_, msg):
     msg = object_unpack_ailobj(msg)
 
@@ -47,6 +51,7 @@ def _console_error(_, msg):
     stderr.write(msg)
 
 
+@function_accepts_py_natives
 def _console_readln(_, msg):
     msg = object_unpack_ailobj(msg)
 
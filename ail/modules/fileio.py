@@ -1,8 +1,12 @@
 
+import codecs
 import os
 
+from typing import Iterator
+
 from ail.core.aobjects import convert_to_ail_object, unpack_ailobj
 from ail.core.error import AILRuntimeError
+from ail.objects.function import accepts_py_natives
 
 from ail.objects.class_object import (
     new_class, new_object,
@@ -10,6 +14,8 @@ from ail.objects.class_object import (
     object_setattr,
 )
 
+from ail.modules.strings import lines as _split_str_lines
+
 
 _ERROR_CLOSED = AILRuntimeError('file closed', 'OSError')
 _ERROR_MODE_AGAIN = AILRuntimeError('Must have exactly one of create/read/write/append'
@@ -116,34 +122,255 @@ def _fileio___init__(self, file_path, mode, buf_size=1024):
     object_setattr(self, 'closed', convert_to_ail_object(False))
 
 
-def _fileio_readall(self, block_size=1024):
-    """
-    readAll([blockSize=1024]) -> bytes
+if hasattr(os, 'readv'):
+    def _readinto(fd: int, buffer) -> int:
+        return os.readv(fd, [buffer])
+else:
+    def _readinto(fd: int, buffer) -> int:
+        b = os.read(fd, len(buffer))
+        n = len(b)
+        buffer[:n] = b
+        return n
 
-    read a readable file from current cursor to EOF.
+
+def _remaining_size(fd: int) -> int:
     """
-    fd = self._file_object_fd
-    if fd < 0:
+    :return: the number of bytes from the cursor to EOF, 0 if the file is
+             not a regular file (a pipe, a tty...)
+    """
+    try:
+        size = os.fstat(fd).st_size
+        pos = os.lseek(fd, 0, os.SEEK_CUR)
+    except OSError:
+        return 0
+
+    return max(size - pos, 0)
+
+
+def _read_all(fd: int, block_size: int) -> bytes:
+    size = _remaining_size(fd)
+    data = os.read(fd, size) if size else b''
+
+    if len(data) == size:
+        # a regular file is read by one call into the result, no copy is
+        # made unless the file grows while reading
+        b = os.read(fd, block_size)
+        if not b:
+            return data
+        data += b
+
+    # a pipe, a short read or a growing file: fill a buffer, which is sized
+    # from the file and grows by 'block_size' at least
+    buf = bytearray(data)
+    n = len(buf)
+    if n < size:
+        buf.extend(bytes(size - n))
+
+    while True:
+        if n == len(buf):
+            # the buffer is full, it's EOF if nothing more can be read
+            b = os.read(fd, block_size)
+            if not b:
+                return bytes(buf)
+            buf += b
+            buf.extend(bytes(max(block_size, len(buf) >> 3)))
+            n += len(b)
+            continue
+
+        with memoryview(buf) as view:
+            r = _readinto(fd, view[n:])
+
+        if r == 0:
+            del buf[n:]
+            return bytes(buf)
+        n += r
+
+
+def _split_lines(data) -> list:
+    # bytes.splitlines() also splits at '\r', only take it when there is none
+    if b'\r' not in data:
+        return data.splitlines(True)
+
+    lines = []
+    start = 0
+    end = data.find(b'\n')
+
+    while end >= 0:
+        lines.append(data[start:end + 1])
+        start = end + 1
+        end = data.find(b'\n', start)
+
+    if start < len(data):
+        lines.append(data[start:])
+
+    return lines
+
+
+def _check_readable(self):
+    if self._file_object_fd < 0:
         return _ERROR_CLOSED
 
     if not self._file_readable:
         return AILRuntimeError('file is not readable', 'OSError')
 
+
+@accepts_py_natives
+def _fileio_readall(self, block_size=1024):
+    """
+    readAll([blockSize=1024]) -> bytes
+
+    read a readable file from current cursor to EOF.
+    a regular file is read at once by its size, a file which has no size,
+    like a pipe, is read by 'blockSize' at least.
+    """
+    err = _check_readable(self)
+    if err is not None:
+        return err
+
     block_size = unpack_ailobj(block_size)
-    if not isinstance(block_size, int):
+    if not isinstance(block_size, int) or block_size <= 0:
         return AILRuntimeError(
-            '\'blockSize\' must be integer', 'TypeError')
+            '\'blockSize\' must be a positive integer', 'TypeError')
 
-    b = os.read(fd, block_size)
-    total_b = b
+    return _read_all(self._file_object_fd, block_size)
 
-    while b:
-        b = os.read(fd, block_size)
-        total_b += b
 
-    return total_b
+@accepts_py_natives
+def _fileio_readinto(self, buffer):
+    """
+    readInto(buffer) -> integer
+
+    read bytes from a readable file into a writable buffer, such as a
+    bytearray or a memoryview, until the buffer is full or reach EOF.
+    @returns the number of bytes read, 0 at EOF.
+    """
+    err = _check_readable(self)
+    if err is not None:
+        return err
+
+    buffer = unpack_ailobj(buffer)
+
+    try:
+        view = memoryview(buffer).cast('B')
+    except TypeError:
+        return AILRuntimeError('buffer must be a writable buffer', 'TypeError')
+
+    with view:
+        if view.readonly:
+            return AILRuntimeError('buffer is read-only', 'TypeError')
+
+        fd = self._file_object_fd
+        n = 0
+        size = len(view)
+
+        while n < size:
+            r = _readinto(fd, view[n:])
+            if r == 0:
+                break
+            n += r
+
+    return n
+
+
+@accepts_py_natives
+def _fileio_readlines(self):
+    """
+    readLines() -> array
+
+    read a readable file from current cursor to EOF, and split it into
+    lines of bytes, each line keeps its line end.
+    """
+    err = _check_readable(self)
+    if err is not None:
+        return err
+
+    return _split_lines(_read_all(self._file_object_fd, 1024))
+
+
+def _iter_chunks(self, size: int) -> Iterator[bytes]:
+    while True:
+        fd = self._file_object_fd
+        if fd < 0:
+            raise OSError('file closed')
+
+        b = os.read(fd, size)
+        if not b:
+            return
+        yield b
+
+
+def _iter_decoded(self, encoding: str, size: int) -> Iterator[str]:
+    # an incremental decoder keeps the characters cut between two chunks
+    decoder = codecs.getincrementaldecoder(encoding)()
+
+    for b in _iter_chunks(self, size):
+        s = decoder.decode(b)
+        if s:
+            yield s
+
+    s = decoder.decode(b'', True)
+    if s:
+        yield s
+
+
+def _check_chunk_size(size, name: str):
+    if not isinstance(size, int) or size <= 0:
+        return AILRuntimeError(
+            '\'%s\' must be a positive integer' % name, 'TypeError')
+
+
+@accepts_py_natives
+def _fileio_chunks(self, size=65536):
+    """
+    chunks([size=65536]) -> iterator
+
+    iterate a readable file from current cursor to EOF by chunks of bytes,
+    only one chunk is read at a time, the last chunk may be shorter.
+    """
+    err = _check_readable(self)
+    if err is not None:
+        return err
+
+    size = unpack_ailobj(size)
+    err = _check_chunk_size(size, 'size')
+    if err is not None:
+        return err
+
+    return _iter_chunks(self, size)
+
+
+@accepts_py_natives
+def _fileio_lines(self, encoding='UTF-8', chunk_size=65536):
+    """
+    lines([encoding='UTF-8' [, chunkSize=65536]]) -> iterator
+
+    iterate the lines of a readable file from current cursor to EOF as
+    strings split at '\\n', the file is read and decoded by chunks, so only
+    a chunk and the line across it are in memory.
+    """
+    err = _check_readable(self)
+    if err is not None:
+        return err
+
+    encoding = unpack_ailobj(encoding)
+    if not isinstance(encoding, str):
+        return AILRuntimeError('\'encoding\' must be string', 'TypeError')
+
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        return AILRuntimeError(
+            'unknown encoding: %s' % encoding, 'LookupError')
+
+    chunk_size = unpack_ailobj(chunk_size)
+    err = _check_chunk_size(chunk_size, 'chunkSize')
+    if err is not None:
+        return err
+
+    return _split_str_lines(_iter_decoded(self, encoding, chunk_size))
 
 
+@accepts_py_natives
 def _fileio_read(self, n):
     """
     read(n: integer) -> bytes
@@ -172,6 +399,7 @@ def _fileio_read(self, n):
     return b
 
 
+@accepts_py_natives
 def _fileio_write(self, b):
     """
     write(data: bytes) -> integer
@@ -187,12 +415,13 @@ def _fileio_write(self, b):
         return AILRuntimeError('file is not writeable', 'OSError')
 
     b = unpack_ailobj(b)
-    if not isinstance(b, bytes):
+    if not isinstance(b, (bytes, bytearray, memoryview)):
         return AILRuntimeError('can only write bytes', 'TypeError')
 
     return os.write(fd, b)
 
 
+@accepts_py_natives
 def _fileio_seek(self, pos, whence=os.SEEK_SET):
     """
     seek(pos [, whence=SEEK_SET]) -> integer
@@ -229,6 +458,7 @@ def _fileio_seek(self, pos, whence=os.SEEK_SET):
     return os.lseek(fd, pos, whence)
 
 
+@accepts_py_natives
 def _fileio_close(self):
     """
     close()
@@ -249,6 +479,10 @@ CLASS_FILEIO = new_class(
     {
         '__init__': convert_to_ail_object(_fileio___init__),
         'readAll': convert_to_ail_object(_fileio_readall),
+        'readInto': convert_to_ail_object(_fileio_readinto),
+        'readLines': convert_to_ail_object(_fileio_readlines),
+        'lines': convert_to_ail_object(_fileio_lines),
+        'chunks': convert_to_ail_object(_fileio_chunks),
         'read': convert_to_ail_object(_fileio_read),
         'write': convert_to_ail_object(_fileio_write),
         'seek': convert_to_ail_object(_fileio_seek),
@@ -1,57 +1,138 @@
 # map module
 # 2020 / 7 / 7
 
-from ail.core.aobjects import convert_to_ail_object, unpack_ailobj
-from ail.objects.struct import convert_to_pyobj, new_struct_object
-from ail.objects.null import null
-from ail.core.error import AILRuntimeError
+from typing import Callable, Iterable, Iterator
 
 
 _KEY_NOT_EXISTS = object()
 
 
-def _map_put(this, k, v):
-    this = convert_to_pyobj(this)
+class hash_map:
+    """
+    a map backed directly by a Python dict, every operation costs one dict
+    operation and a method call
+    """
 
-    m = this.__this___base_map
+    __slots__ = ('__map',)
 
-    k_val = unpack_ailobj(k)
+    def __init__(self, items=None):
+        # a dict of items is copied, the map never changes it
+        if items is None:
+            self.__map = {}
+        elif isinstance(items, hash_map):
+            self.__map = items.toDict()
+        else:
+            self.__map = dict(items)
 
-    try:
-        m[k_val] = v
-    except TypeError:
-        return AILRuntimeError(str(k['__class__']), 'UnhashableError')
+    @property
+    def size(self) -> int:
+        return len(self.__map)
 
+    def get(self, k, default=None):
+        return self.__map.get(k, default)
 
-def _map_get(this, k, default=None):
-    this = convert_to_pyobj(this)
+    def put(self, k, v):
+        self.__map[k] = v
 
-    k_val = unpack_ailobj(k)
-    try:
-        v = this.__this___base_map.get(k_val, default)
-    except TypeError:
-        return AILRuntimeError(str(k['__class__']), 'UnhashableError')
+    def remove(self, k, default=_KEY_NOT_EXISTS):
+        """
+        remove k and return its value, or default if k is not in the map
 
-    return v
+        raise KeyError if k is not in the map and no default is given
+        """
+        if default is _KEY_NOT_EXISTS:
+            return self.__map.pop(k)
+        return self.__map.pop(k, default)
 
+    def contains(self, k) -> bool:
+        return k in self.__map
 
-def _new_map():
-    new_dict = map_obj_dict.copy()
-    new_dict['__base_map'] = dict()
+    def setdefault(self, k, default=None):
+        return self.__map.setdefault(k, default)
 
-    return new_struct_object(
-            'hash_map', null, new_dict, map_obj_dict.keys())
+    def keys(self) -> Iterator:
+        return iter(self.__map.keys())
 
+    def values(self) -> Iterator:
+        return iter(self.__map.values())
+
+    def items(self) -> Iterator:
+        return iter(self.__map.items())
+
+    def update(self, other) -> 'hash_map':
+        """
+        put all items of other, a map, a dict or an iterable of pairs
+        """
+        self.__map.update(_to_dict(other))
+        return self
+
+    def merge(self, other, func: Callable = None) -> 'hash_map':
+        """
+        :return: a new map with the items of this map and other, the values
+                 of a key in both maps are merged by func(old, new), the new
+                 value is taken if func is not given
+        """
+        result = hash_map(self)
+        m = result.__map
+        other = _to_dict(other)
+
+        if func is None:
+            m.update(other)
+        else:
+            for k, v in other.items():
+                m[k] = func(m[k], v) if k in m else v
+
+        return result
+
+    def clear(self):
+        self.__map.clear()
+
+    def toDict(self) -> dict:
+        return self.__map.copy()
+
+    def __len__(self) -> int:
+        return len(self.__map)
+
+    def __contains__(self, k) -> bool:
+        return k in self.__map
+
+    def __getitem__(self, k):
+        return self.__map[k]
+
+    def __setitem__(self, k, v):
+        self.__map[k] = v
+
+    def __delitem__(self, k):
+        del self.__map[k]
+
+    def __iter__(self) -> Iterator:
+        return iter(self.__map)
+
+    def __eq__(self, o) -> bool:
+        if isinstance(o, hash_map):
+            o = o.__map
+        return self.__map == o
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return '<map %r>' % self.__map
+
+
+def _to_dict(items) -> dict:
+    if isinstance(items, hash_map):
+        return items.toDict()
+    if isinstance(items, dict):
+        return items
+    return dict(items)
 
-map_obj_dict = {
-        '__base_map': None,
-        'get': convert_to_ail_object(_map_get),
-        'put': convert_to_ail_object(_map_put),
-}
 
+def map_(items: Iterable = None) -> hash_map:
+    return hash_map(items)
 
-_IS_AIL_MODULE_ = True
 
+_AIL_PYC_MODULE_ = True
 _AIL_NAMESPACE_ = {
-        'map': _new_map
+    'hash_map': hash_map,
+    'map': map_,
 }
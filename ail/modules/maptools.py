@@ -0,0 +1,24 @@
+# map tools, replaces lib/maptools.ail
+
+from typing import Callable, Iterable
+
+
+def mapto(keys: Iterable, v_func: Callable) -> dict:
+    """
+    :return: a dict maps each key to v_func(key)
+    """
+    return {k: v_func(k) for k in keys}
+
+
+def mapwith(function: Callable, arr: Iterable) -> list:
+    """
+    :return: an array of function(x) for each x in arr
+    """
+    return [function(x) for x in arr]
+
+
+_AIL_PYC_MODULE_ = True
+_AIL_NAMESPACE_ = {
+    'mapto': mapto,
+    'mapwith': mapwith,
+}
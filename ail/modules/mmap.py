@@ -0,0 +1,229 @@
+# memory-mapped files
+
+import mmap as _mmap
+import os
+
+from typing import Iterator
+
+
+_MODES = {
+    # mode: (flags of os.open, access of mmap)
+    'r': (os.O_RDONLY, _mmap.ACCESS_READ),
+    'r+': (os.O_RDWR, _mmap.ACCESS_WRITE),
+    'c': (os.O_RDONLY, _mmap.ACCESS_COPY),
+}
+
+_LINES_WINDOW = 1 << 20
+
+
+class MappedFile:
+    """
+    a file mapped into memory, indexing returns a byte and slicing returns
+    a memoryview of the mapping, neither of them reads or copies the file
+
+    modes: 'r' read only, 'r+' writes through to the file, 'c' copy on
+           write, writes never reach the file
+    """
+
+    __slots__ = ('__path', '__mode', '__map', '__view')
+
+    def __init__(self, path: str, mode: str = 'r'):
+        if type(path) is not str:
+            raise TypeError('\'path\' must be string')
+
+        if mode not in _MODES:
+            raise ValueError('invalid mode %r' % mode)
+
+        self.__path = path
+        self.__mode = mode
+
+        flags, access = _MODES[mode]
+        fd = os.open(path, flags | getattr(os, 'O_BINARY', 0))
+
+        try:
+            if os.fstat(fd).st_size == 0:
+                # an empty file can not be mapped, a view of its own is
+                # released by close()
+                self.__map = None
+                self.__view = memoryview(b'')
+            else:
+                self.__map = _mmap.mmap(fd, 0, access=access)
+                self.__view = memoryview(self.__map)
+        finally:
+            # the mapping keeps its own handle of the file
+            os.close(fd)
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def mode(self) -> str:
+        return self.__mode
+
+    @property
+    def size(self) -> int:
+        return len(self.__view)
+
+    @property
+    def closed(self) -> bool:
+        return self.__view is None
+
+    def view(self, offset: int = 0, size: int = -1) -> memoryview:
+        """
+        :return: a memoryview of size bytes from offset, to the end of file
+                 if size < 0
+        """
+        view = self.__get_view()
+        if size < 0:
+            return view[offset:]
+        return view[offset:offset + size]
+
+    def find(self, sub: bytes, start: int = 0, end: int = -1) -> int:
+        """
+        :return: the lowest index of sub in [start, end), -1 if not found
+        """
+        self.__get_view()
+        if self.__map is None:
+            return -1
+        if end < 0:
+            end = len(self.__map)
+        return self.__map.find(sub, start, end)
+
+    def rfind(self, sub: bytes, start: int = 0, end: int = -1) -> int:
+        """
+        :return: the highest index of sub in [start, end), -1 if not found
+        """
+        self.__get_view()
+        if self.__map is None:
+            return -1
+        if end < 0:
+            end = len(self.__map)
+        return self.__map.rfind(sub, start, end)
+
+    def lines(self, keep_ends: bool = False) -> Iterator[bytes]:
+        """
+        iterate the lines of the mapping as bytes, the mapping is split a
+        window at a time, so only the window is copied, not the whole file
+        """
+        self.__get_view()
+        return _iter_lines(self.__map, keep_ends)
+
+    def unpack(self, struct, offset: int = 0):
+        """
+        unpack a record of struct, a struct whose members are all typed,
+        from offset
+        """
+        return _get_codec(struct, 'unpack')(self.__get_view(), offset)
+
+    def iterUnpack(self, struct, offset: int = 0, count: int = -1) -> Iterator:
+        """
+        iterate count records of struct from offset, all the records till
+        the end of file if count < 0, a broken record at the end is ignored
+        """
+        iter_unpack = _get_codec(struct, 'iter_unpack')
+        size = struct.packed_size
+
+        view = self.__get_view()[offset:]
+        n = len(view) // size
+        if 0 <= count < n:
+            n = count
+
+        return iter_unpack(view[:n * size])
+
+    def flush(self, offset: int = 0, size: int = -1):
+        """
+        write the changes of [offset, offset + size) back to the file, all
+        of the changes if size < 0
+        """
+        self.__get_view()
+        if self.__map is None:
+            return
+        if size < 0:
+            size = len(self.__map) - offset
+        self.__map.flush(offset, size)
+
+    def close(self):
+        """
+        close the mapping, views got from it must be released before
+        """
+        if self.__view is None:
+            return
+
+        self.__view.release()
+
+        if self.__map is not None:
+            try:
+                self.__map.close()
+            except BufferError:
+                # a view got from the mapping is still alive
+                self.__view = memoryview(self.__map)
+                raise
+            self.__map = None
+
+        self.__view = None
+
+    def __get_view(self) -> memoryview:
+        view = self.__view
+        if view is None:
+            raise ValueError('mapped file closed')
+        return view
+
+    def __len__(self) -> int:
+        return len(self.__get_view())
+
+    def __getitem__(self, index):
+        return self.__get_view()[index]
+
+    def __setitem__(self, index, value):
+        self.__get_view()[index] = value
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self.lines(True)
+
+    def __repr__(self) -> str:
+        return '<MappedFile %r, mode %r, %s>' % (
+            self.__path, self.__mode,
+            'closed' if self.__view is None else '%d bytes' % len(self.__view))
+
+
+def _get_codec(struct, name: str):
+    codec = getattr(struct, name, None)
+    if codec is None or not hasattr(struct, 'packed_size'):
+        raise TypeError(
+            '%s has no binary layout, all members must be typed' %
+            getattr(struct, '__name__', struct))
+    return codec
+
+
+def _iter_lines(mm, keep_ends: bool) -> Iterator[bytes]:
+    if mm is None:
+        return
+
+    size = len(mm)
+    start = 0
+    rest = b''
+
+    while start < size:
+        # split a window of the mapping at once, a line costs no Python code
+        chunk = mm[start:start + _LINES_WINDOW]
+        start += len(chunk)
+
+        lines = chunk.split(b'\n')
+        lines[0] = rest + lines[0]
+        rest = lines.pop()
+
+        if keep_ends:
+            for ln in lines:
+                yield ln + b'\n'
+        else:
+            yield from lines
+
+    if rest:
+        yield rest
+
+
+_AIL_PYC_MODULE_ = True
+_AIL_NAMESPACE_ = {
+    'MappedFile': MappedFile,
+}
@@ -0,0 +1,65 @@
+# range iterators, replaces lib/range.ail
+
+from builtins import range as _range
+
+
+class _StopIteration:
+    def __repr__(self) -> str:
+        return '<StopIteration>'
+
+
+StopIteration = _StopIteration()
+
+
+class _RangeIter:
+    """
+    iterates a lazy Python range, has the API of __RangeIter in the old
+    lib/range.ail: next() returns StopIteration when the range is exhausted
+
+    next() keeps its own position, every for-loop iterates the whole range
+    """
+
+    __slots__ = ('__range', '__iter')
+
+    def __init__(self, r: _range):
+        self.__range = r
+        self.__iter = iter(r)
+
+    def next(self):
+        return next(self.__iter, StopIteration)
+
+    def __len__(self) -> int:
+        return len(self.__range)
+
+    def __getitem__(self, index):
+        return self.__range[index]
+
+    def __contains__(self, o) -> bool:
+        return o in self.__range
+
+    def __iter__(self):
+        return iter(self.__range)
+
+    def __repr__(self) -> str:
+        return '<RangeIter %r>' % self.__range
+
+
+def rangeFromTo(from_: int, to: int) -> _RangeIter:
+    return _RangeIter(_range(from_, to))
+
+
+def rangeTo(to: int) -> _RangeIter:
+    return _RangeIter(_range(to))
+
+
+def range_(from_: int, to: int, step: int = 1) -> _RangeIter:
+    return _RangeIter(_range(from_, to, step))
+
+
+_AIL_PYC_MODULE_ = True
+_AIL_NAMESPACE_ = {
+    'StopIteration': StopIteration,
+    'rangeFromTo': rangeFromTo,
+    'rangeTo': rangeTo,
+    'range': range_,
+}
@@ -0,0 +1,181 @@
+# string library, replaces lib/strlib.ail and lib/ostrlib.ail
+
+from typing import Iterable, Iterator
+
+
+class StringBuilder:
+    """
+    builds a string from pieces in linear time, the pieces are joined once
+    by toString()
+    """
+
+    __slots__ = ('__parts', '__size')
+
+    def __init__(self, s: str = ''):
+        self.__parts = [s] if s else []
+        self.__size = len(s)
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    def append(self, o) -> 'StringBuilder':
+        s = o if type(o) is str else str(o)
+        self.__parts.append(s)
+        self.__size += len(s)
+        return self
+
+    def appendLine(self, o='') -> 'StringBuilder':
+        return self.append(o).append('\n')
+
+    def clear(self):
+        self.__parts.clear()
+        self.__size = 0
+
+    def toString(self) -> str:
+        parts = self.__parts
+        if len(parts) > 1:
+            parts[:] = [''.join(parts)]
+        return parts[0] if parts else ''
+
+    def __len__(self) -> int:
+        return self.__size
+
+    __str__ = toString
+
+    def __repr__(self) -> str:
+        return '<StringBuilder %r>' % self.toString()
+
+
+class string_t:
+    """
+    a string with the methods of string_t in the old lib/strlib.ail
+    """
+
+    __slots__ = ('_astr',)
+
+    def __init__(self, s: str = ''):
+        self._astr = str(s)
+
+    @property
+    def size(self) -> int:
+        return len(self._astr)
+
+    def append(self, o) -> 'string_t':
+        self._astr += str(o)
+        return self
+
+    def equals(self, o) -> bool:
+        if isinstance(o, string_t):
+            o = o._astr
+        return self._astr == o
+
+    def to_array(self) -> list:
+        return list(self._astr)
+
+    def __str__(self) -> str:
+        return self._astr
+
+    def __repr__(self) -> str:
+        return repr(self._astr)
+
+
+def _check_str(s, name: str = 'argument'):
+    if type(s) is not str:
+        raise TypeError('%s must be a string' % name)
+
+
+def join(sep: str, items: Iterable) -> str:
+    _check_str(sep, 'separator')
+    return sep.join([x if type(x) is str else str(x) for x in items])
+
+
+def split(s: str, sep: str = None, max_split: int = -1) -> list:
+    _check_str(s)
+    return s.split(sep, max_split)
+
+
+def replace(s: str, old: str, new: str, count: int = -1) -> str:
+    _check_str(s)
+    return s.replace(old, new, count)
+
+
+def find(s: str, sub: str, start: int = 0) -> int:
+    """
+    :return: the lowest index of sub in s from start, -1 if not found
+    """
+    _check_str(s)
+    return s.find(sub, start)
+
+
+def format(fmt: str, *items) -> str:
+    """
+    format items as '%' does, like string.format()
+    """
+    _check_str(fmt, 'format')
+    return fmt % items
+
+
+def lines(source, keep_ends: bool = False) -> Iterator[str]:
+    """
+    iterate the lines of a string, or of an iterable of string chunks such
+    as a file, without splitting the whole text at once
+    """
+    if type(source) is str:
+        return _iter_str_lines(source, keep_ends)
+    return _iter_chunk_lines(source, keep_ends)
+
+
+def _iter_str_lines(s: str, keep_ends: bool) -> Iterator[str]:
+    start = 0
+    end = s.find('\n')
+    extra = 1 if keep_ends else 0
+
+    while end >= 0:
+        yield s[start:end + extra]
+        start = end + 1
+        end = s.find('\n', start)
+
+    if start < len(s):
+        yield s[start:]
+
+
+def _iter_chunk_lines(chunks: Iterable[str], keep_ends: bool) -> Iterator[str]:
+    rest = ''
+
+    for chunk in chunks:
+        _check_str(chunk, 'chunk')
+        rest += chunk
+
+        if '\n' not in chunk:
+            continue
+
+        *complete, rest = rest.split('\n')
+        for ln in complete:
+            yield ln + '\n' if keep_ends else ln
+
+    if rest:
+        yield rest
+
+
+def strcmp(a: str, b: str) -> int:
+    """
+    :return: 1 if a > b, -1 if a < b, 0 if a == b
+    """
+    _check_str(a)
+    _check_str(b)
+    return (a > b) - (a < b)
+
+
+_AIL_PYC_MODULE_ = True
+_AIL_NAMESPACE_ = {
+    'StringBuilder': StringBuilder,
+    'string_t': string_t,
+    'join': join,
+    'split': split,
+    'replace': replace,
+    'find': find,
+    'format': format,
+    'lines': lines,
+    'strcmp': strcmp,
+}
@@ -1,24 +1,23 @@
 
 from ail.core.error import AILRuntimeError
-from ail.core.aobjects import compare_type, unpack_ailobj
-from ail.objects.array import convert_to_array
-from ail.objects.function import convert_to_func_wrapper
-from ail.objects.integer import INTEGER_TYPE
+from ail.core.aobjects import unpack_ailobj
+from ail.objects.function import convert_to_func_wrapper, accepts_py_natives
 
 
+@accepts_py_natives
 def func_range(a, b, step=1):
-    if not (compare_type(a, INTEGER_TYPE) and compare_type(b, INTEGER_TYPE)) \
-            and compare_type(step, INTEGER_TYPE):
-
-        return AILRuntimeError('a and b must be an integer!')
-
     va = unpack_ailobj(a)
     vb = unpack_ailobj(b)
     vs = unpack_ailobj(step)
 
-    if va > vb:
-        return convert_to_array([])
-    return convert_to_array(list(range(va, vb, vs)))
+    if not all(type(v) is int for v in (va, vb, vs)):
+        return AILRuntimeError('a and b must be an integer!', 'TypeError')
+
+    if vs == 0:
+        return AILRuntimeError('step of range must not be zero', 'ValueError')
+
+    # a lazy range, which supports len(), indexing and iteration
+    return range(va, vb, vs)
 
 
 _IS_AIL_MODULE_ = True
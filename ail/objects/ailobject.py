@@ -35,7 +35,7 @@ def obj_func_eq(aobj, oobj):
 
 
 def obj_getattr(aobj, name):
-    if not _is_reserved_attr_name(name) and name in aobj.properties:
+    if not _is_reserved_attr_name(name) and name in aobj:
         return aobj[name]
 
     return AILRuntimeError('\'%s\' object has no attribute \'%s\'' %
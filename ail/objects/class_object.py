@@ -1,6 +1,7 @@
 
-from copy import deepcopy
+from copy import copy
 from typing import List
+from weakref import ref
 
 from .function import PY_FUNCTION_TYPE, FUNCTION_TYPE
 from .super_object import get_super
@@ -12,6 +13,7 @@ from ..core.aobjects import (
     create_object
 )
 
+from ..core import aconfig
 from ..core.err_types import TYPE_ERROR, NAME_ERROR
 from ..core.aframe import Frame
 from ..core.error import AILRuntimeError
@@ -40,7 +42,7 @@ def _get_method_str_func(obj_name: str, is_pyfunc: bool=False):
 
 
 def _copy_function(f: AILObject) -> AILObject:
-    new_f = deepcopy(f)
+    new_f = copy(f)
     new_f.properties = f.properties.copy()
 
     return new_f
@@ -74,27 +76,58 @@ def class_init(self,
 
     dict_['__doc__'] = doc_string
 
+    # name -> attribute found in mro (None if not found), the version tag
+    # changes when the cache is cleared by class_setattr()
+    self['__attr_cache__'] = dict()
+    self['__version_tag__'] = 0
+    self['__subclasses__'] = list()
 
-def class_getattr_with_default(cls, name, default=None):
-    mro = cls['__mro__']
-    for cls in mro:
+    for base in bases:
+        base['__subclasses__'].append(ref(self))
+
+
+def _lookup_mro(cls, name):
+    for cls in cls['__mro__']:
         val = cls['__dict__'].get(name)
         if val is not None:
             return val
-    return default
+    return None
+
+
+def _invalidate_cache(cls):
+    cls['__attr_cache__'].clear()
+    cls['__version_tag__'] += 1
+
+    subclasses = cls['__subclasses__']
+    subclasses[:] = [r for r in subclasses if r() is not None]
+
+    for r in subclasses:
+        _invalidate_cache(r())
+
+
+def class_getattr_with_default(cls, name, default=None):
+    cache = cls['__attr_cache__']
+    if cache is None:
+        val = _lookup_mro(cls, name)
+    else:
+        try:
+            val = cache[name]
+        except KeyError:
+            val = cache[name] = _lookup_mro(cls, name)
+
+    return default if val is None else val
 
 
 def class_getattr(cls, name):
-    mro = cls['__mro__']
-    for cls in mro:
-        val = cls['__dict__'].get(name)
-        if val is not None:
-            return val
+    val = class_getattr_with_default(cls, name)
+    if val is not None:
+        return val
     return AILRuntimeError('name %s is not define' % name, NAME_ERROR)
 
 
 def class_setattr(self, name, value):
     self['__dict__'][name] = value
+    _invalidate_cache(self)
 
 
 def class_str(self):
@@ -205,7 +238,7 @@ def object_getattr_with_default(self, name, default=None):
 
 
 def object_init(self):
-    self._bound_methods = dict()
+    self['__bound_methods__'] = dict()  # name -> (version tag, method)
     self.hash_handler = object_hash
     obj_dict = dict()
 
@@ -222,6 +255,23 @@ def object_getattr(self, name):
         return val
 
     cls = self['__this_class__']
+    version = cls['__version_tag__']
+    bound_methods = self['__bound_methods__']
+
+    # methods bound before the class changed are out of date
+    bound = bound_methods.get(name)
+    if bound is not None and bound[0] == version:
+        m = bound[1]
+        if type(m) is ref:
+            m = m()
+        else:
+            # keep the most recently used last, _cache_bound_method() drops
+            # the first one
+            del bound_methods[name]
+            bound_methods[name] = bound
+        if m is not None:
+            return m
+
     val = class_getattr_with_default(cls, name)
 
     if val is None:
@@ -230,20 +280,28 @@ def object_getattr(self, name):
     if val['__class__'] not in _func_type:
         return val
 
-    # method key = %CLASS_NAME%$%INSTANCE_ID%$%METHOD_NAME%
-    method_key = '%s$%s$%s' % (cls['__name__'], id(self), name)
-    bound_methods = self._bound_methods
-    m = bound_methods.get(method_key)
-    
-    if m is not None:
-        return m
-
     m = _check_bound(self, val, cls['__name__'])
-    bound_methods[method_key] = m
+    _cache_bound_method(bound_methods, name, version, m)
     
     return m
 
 
+def _cache_bound_method(bound_methods: dict, name: str, version: int, m):
+    size = aconfig.BOUND_METHOD_CACHE_SIZE
+
+    # a bound method refers to the object, so a strong reference makes a
+    # cycle, which only the cyclic gc can free
+    if size <= 0:
+        bound_methods[name] = (version, ref(m))
+        return
+
+    if name not in bound_methods and len(bound_methods) >= size:
+        # drop the least recently used
+        del bound_methods[next(iter(bound_methods))]
+
+    bound_methods[name] = (version, m)
+
+
 def object_setattr(self, name, value):
     self['__dict__'][name] = value
 
@@ -26,7 +26,7 @@ def float_init(self: AILObject, value: AILObject):
     _vtype = type(value)
 
     if _vtype is float or _vtype is int:
-        self.properties['__value__'] = value
+        self['__value__'] = value
     elif value['__class__'] is FLOAT_TYPE:
         self['__value__'] = value['__value__']
     else:
@@ -136,13 +136,13 @@ def convert_to_integer(pyint: int):
     if type(pyint) in _conv_type:
         return _new_object(INTEGER_TYPE, float(pyint))
 
+    # pooled and interned objects are shared, never change them
     if cls is INTEGER_TYPE or cls is FLOAT_TYPE:
-        pyint['__value__'] = float(pyint['__value__'])
-        return pyint
+        return _new_object(FLOAT_TYPE, float(pyint['__value__']))
 
     elif cls is STRING_TYPE:
         v = pyint['__value__']  # type: str
         if v.isnumeric():
-            pyint['__value__'] = float(v)
+            return _new_object(FLOAT_TYPE, float(v))
 
     return AILRuntimeError('argument must be a string or a number', 'TypeError')
@@ -34,10 +34,24 @@ def _make_cache():
         _not_loaded = False
 
 
+_PY_NATIVES_FLAG = '__ail_accepts_py_natives__'
+
+
+def accepts_py_natives(func):
+    """
+    mark a python function which accepts int, float, str, bool and None
+    as well as their AIL objects (unpacks arguments by unpack_ailobj),
+    so that Python-compatible code can pass these values without boxing.
+    """
+    setattr(func, _PY_NATIVES_FLAG, True)
+    return func
+
+
 def pyfunc_func_init(self: AILObject, func: t.FunctionType):
     self.properties['__pyfunction__'] = func
-    self.properties['__value__'] = func
+    self['__value__'] = func
     self.properties['__name__'] = func.__name__
+    self.properties['__py_natives__'] = getattr(func, _PY_NATIVES_FLAG, False)
 
     set_doc(self, func.__doc__)
 
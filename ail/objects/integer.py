@@ -1,5 +1,8 @@
 # Integer
+from threading import Lock
+
 from ..core import aobjects as obj
+from ..core import aconfig
 
 from ..core.aobjects import (
     AILObjectType,
@@ -16,10 +19,12 @@ from .bool import BOOL_TYPE
 from .float import FLOAT_TYPE
 
 
-POOL_RANGE_MIN = -1
-POOL_RANGE_MAX = 100
+POOL_RANGE_MIN, POOL_RANGE_MAX = aconfig.INTEGER_POOL_RANGE
 POOL_RANGE = (POOL_RANGE_MIN, POOL_RANGE_MAX)
 
+# misses next to the range between two adjustments of an adaptive pool
+_POOL_ADAPT_INTERVAL = 1024
+
 
 def _get_a_b(self, other, op: str) -> tuple:
     if other['__value__'] is None:  # do not have __value__ property
@@ -46,6 +51,9 @@ def int_init(self: AILObject, value: AILObject):
     elif isinstance(value, float):
         o = create_object(FLOAT_TYPE, value)
         self.reference = o.reference
+        self.cls = o.cls
+        self.value = o.value
+        self.hash = o.hash
         self.properties = o.properties
     elif compare_type(value, INTEGER_TYPE):
         self['__value__'] = value['__value__']
@@ -262,7 +270,7 @@ def get_integer(pyint: int) -> AILObject:
     """
     get an integer object.
 
-    if pyint in [POOL_RANGE_MIN, POOL_RANGE_MAX), returns the integer in pool,
+    if pyint in the range of INTEGER_POOL, returns the integer in pool,
     otherwise, create an integer object.
 
     :return: Integer object
@@ -270,31 +278,138 @@ def get_integer(pyint: int) -> AILObject:
     if not isinstance(pyint, int):
         return pyint
 
-    if POOL_RANGE_MIN < pyint < POOL_RANGE_MAX:
-        return INTEGER_POOL[pyint - POOL_RANGE_MIN]
-    return create_object(INTEGER_TYPE, pyint)
+    return INTEGER_POOL.get(pyint)
+
+
+class IntegerPool:
+    """
+    shared integer objects in [low, high).
+
+    an adaptive pool counts the misses next to its range, and extends the
+    range to the side which has the most of them, until the pool has limit
+    objects.
+    """
+
+    def __init__(self, low: int, high: int,
+                 adaptive: bool = False, limit: int = 0):
+        # (low, objects), replaced as a whole so that get() never sees the
+        # low of one range with the objects of another
+        self.__state = (low, [])
+        self.__resize_lock = Lock()
 
+        self.adaptive = adaptive
+        self.limit = max(limit, high - low)
 
-class _IntegerPool:
-    def __init__(self):
-        self.__pool = list()
+        self.hits = 0
+        self.misses = 0
 
-        self.__init_pool()
+        self.__below = 0  # misses in [low - size, low)
+        self.__above = 0  # misses in [high, high + size)
 
-    def __init_pool(self):
-        mi, ma = POOL_RANGE
+        self.set_range(low, high)
 
-        for num in range(mi, ma):
+    @staticmethod
+    def __new_integers(low: int, high: int) -> list:
+        nums = list()
+
+        for num in range(low, high):
             num = create_object(INTEGER_TYPE, num)
             num.reference += 1
-            self.__pool.append(num)
+            nums.append(num)
+
+        return nums
+
+    def set_range(self, low: int, high: int):
+        """
+        change the range of pool, objects already in range are kept
+        """
+        if low > high:
+            raise ValueError('invalid range of integer pool')
+
+        with self.__resize_lock:
+            old_low, old = self.__state
+            keep_low = max(low, old_low)
+            keep_high = min(high, old_low + len(old))
+
+            if keep_low < keep_high:
+                pool = self.__new_integers(low, keep_low)
+                pool.extend(old[keep_low - old_low:keep_high - old_low])
+                pool.extend(self.__new_integers(keep_high, high))
+            else:
+                pool = self.__new_integers(low, high)
+
+            self.__state = (low, pool)
+            self.limit = max(self.limit, high - low)
+
+    @property
+    def low(self) -> int:
+        return self.__state[0]
+
+    @property
+    def high(self) -> int:
+        low, pool = self.__state
+        return low + len(pool)
+
+    def get(self, pyint: int) -> AILObject:
+        low, pool = self.__state
+        i = pyint - low
+        size = len(pool)
+
+        if 0 <= i < size:
+            self.hits += 1
+            return pool[i]
+
+        self.misses += 1
+        if self.adaptive and -size <= i < size * 2:
+            self.__count_miss(i >= 0)
+
+        return create_object(INTEGER_TYPE, pyint)
+
+    def __count_miss(self, above: bool):
+        if above:
+            self.__above += 1
+        else:
+            self.__below += 1
+
+        if self.__above + self.__below < _POOL_ADAPT_INTERVAL:
+            return
+
+        low, pool = self.__state
+        size = len(pool)
+        grow = min(size, self.limit - size)
+
+        if grow > 0:
+            if self.__above >= self.__below:
+                self.set_range(low, low + size + grow)
+            else:
+                self.set_range(low - grow, low + size)
+
+        self.__below = self.__above = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        return {
+            'range': (self.low, self.high),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate,
+        }
+
+    def reset_stats(self):
+        self.hits = self.misses = 0
 
     @property
     def pool(self):
-        return self.__pool
+        return self.__state[1]
 
 
-INTEGER_POOL = _IntegerPool().pool
+INTEGER_POOL = IntegerPool(
+    POOL_RANGE_MIN, POOL_RANGE_MAX,
+    aconfig.INTEGER_POOL_ADAPTIVE, aconfig.INTEGER_POOL_LIMIT)
 
 _conv_types = (int, float, str)
 
@@ -305,13 +420,13 @@ def convert_to_integer(pyint: int):
     if type(pyint) in _conv_types:
         return get_integer(pyint)
     
+    # pooled and interned objects are shared, never change them
     cls = pyint['__class__']
     if cls is INTEGER_TYPE or cls is FLOAT_TYPE:
-        pyint['__value__'] = int(pyint['__value__'])
-        return pyint
+        return get_integer(int(pyint['__value__']))
     elif cls is STRING_TYPE:
         v = pyint['__value__']  # type: str
         if v.isnumeric():
-            pyint['__value__'] = int(v)
+            return get_integer(int(v))
 
     return AILRuntimeError('argument must be a string or a number', 'TypeError')
@@ -1,5 +1,6 @@
 # String
 from ..core import aobjects as obj
+from ..core import aconfig
 from ..core.aobjects import AILObject
 from ..core.error import AILRuntimeError
 from . import bool, integer, function
@@ -219,3 +220,62 @@ STRING_TYPE = obj.AILObjectType('<string type>', types.I_STR_TYPE,
                                 __getitem__=str_getitem,
                                 __len__=str_len,
                                 )
+
+
+class StringInternTable:
+    """
+    shared objects of short strings, a string is interned by get() until
+    the table has limit strings.
+    """
+
+    def __init__(self, max_length: int, limit: int):
+        self.__table = dict()
+        self.max_length = max_length
+        self.limit = limit
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, pystr: str) -> AILObject:
+        if len(pystr) > self.max_length:
+            return obj.ObjectCreater.new_object(STRING_TYPE, pystr)
+
+        o = self.__table.get(pystr)
+        if o is not None:
+            self.hits += 1
+            return o
+
+        self.misses += 1
+        o = obj.ObjectCreater.new_object(STRING_TYPE, pystr)
+
+        if len(self.__table) < self.limit:
+            o.reference += 1
+            self.__table[pystr] = o
+
+        return o
+
+    def clear(self):
+        self.__table.clear()
+
+    def __len__(self) -> int:
+        return len(self.__table)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        return {
+            'size': len(self.__table),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate,
+        }
+
+    def reset_stats(self):
+        self.hits = self.misses = 0
+
+
+STRING_INTERN_TABLE = StringInternTable(
+    aconfig.STRING_INTERN_MAX_LENGTH, aconfig.STRING_INTERN_LIMIT)
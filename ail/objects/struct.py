@@ -1,4 +1,4 @@
-from copy import deepcopy
+from copy import copy
 
 from ..core import aobjects as obj
 
@@ -23,7 +23,7 @@ def _is_reserved_name(name):
 
 
 def _copy_function(f: AILObject) -> AILObject:
-    new_f = deepcopy(f)
+    new_f = copy(f)
     new_f.properties = f.properties.copy()
 
     return new_f
@@ -48,7 +48,9 @@ def super_setattr(self, name, value):
     cls = _find_class_from_order(self, name)
 
     if cls is not None:
-        cls['__dict__'][name] = convert_to_ail_object(value)
+        # through class_setattr(), which clears the attribute caches of cls
+        # and its subclasses
+        cls['__setattr__'](cls, name, convert_to_ail_object(value))
 
 
 def super_str(self):
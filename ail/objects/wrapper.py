@@ -31,9 +31,26 @@ def wrapper_func_setattr(self, name, value):
                            'AttributeError')
 
 
+def wrapper_func_getitem(self, index):
+    try:
+        return obj.convert_to_ail_object(
+            self['__pyobject__'][obj.unpack_ailobj(index)])
+    except (TypeError, IndexError, KeyError) as e:
+        return AILRuntimeError(str(e), type(e).__name__)
+
+
+def wrapper_func_len(self):
+    try:
+        return len(self['__pyobject__'])
+    except TypeError as e:
+        return AILRuntimeError(str(e), 'TypeError')
+
+
 WRAPPER_TYPE = obj.AILObjectType('<python object wrapper type>', types.I_WRAPPER_TYPE,
                                  __init__=wrapper_func_init,
                                  __str__=wrapper_func_str,
                                  __repr__=wrapper_func_repr,
                                  __getattr__=wrapper_func_getattr,
-                                 __setattr__=wrapper_func_setattr)
+                                 __setattr__=wrapper_func_setattr,
+                                 __getitem__=wrapper_func_getitem,
+                                 __len__=wrapper_func_len)
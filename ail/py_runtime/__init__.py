@@ -1,7 +1,11 @@
+import builtins as _py_builtins
+
 from . import functions as _func
 from . import shared as _shared
 
+from .abuiltins import NATIVE_BUILTINS as _NATIVE_BUILTINS
 from .objects import convert_object
+from .structarray import StructArray
 
 from ..core import abuiltins as _builtins
 from ..core.aconfig import RENAME_PY_RUNTIME
@@ -16,7 +20,7 @@ _PY_BUILTINS = {
     'help', 'dir',
     'chr', 'ord', 'hex', 'oct',
     'len', 'type', 'isinstance',
-    'isimplement', 'str', 'repr',
+    'str', 'repr',
     'int', 'float', 'super',
     'Object', 'FileIO', 'fnum',
     'abs'
@@ -30,6 +34,9 @@ AIL_PY_GLOBAL = {
 }
 
 
+AIL_PY_GLOBAL.update(_NATIVE_BUILTINS)
+
+
 AIL_PY_GLOBAL.update({
     '__ail_input__': _func.ail_input,
     '__ail_import__': _func.ail_import,
@@ -37,6 +44,7 @@ AIL_PY_GLOBAL.update({
     '__ail_bind_function__': _func.bind_function,
     '__modules__': _shared.loaded_modules,
     'new': _func.new_struct_object,
+    'StructArray': StructArray,
     'contains': _func.contains,
     'console': convert_object(_get_console_object()),
     'fnum': _func.func_fnum,
@@ -46,6 +54,12 @@ AIL_PY_GLOBAL.update({
 })
 
 
+# AIL builtins, installed as the '__builtins__' of every AIL module globals
+# so that names fall through to them instead of being copied per module
+AIL_PY_BUILTINS = dict(vars(_py_builtins))
+AIL_PY_BUILTINS.update(AIL_PY_GLOBAL)
+
+
 # rename py_runtime modules
 if RENAME_PY_RUNTIME:
     import sys
@@ -0,0 +1,173 @@
+from .objects import (
+    AILArrayView, AILObjectWrapper, AILStruct, AILStructType,
+    _is_private_name
+)
+
+from ..core.aobjects import AILObject
+
+
+# builtins of python compatible mode which work on python values directly,
+# the legacy ones in core.abuiltins convert every argument to AILObject and
+# the result back.
+
+# values which have no doc string in AIL
+_NO_DOC_TYPES = (int, float, str, bool, list, dict, type(None))
+
+
+def _unwrap(o):
+    if isinstance(o, (AILObjectWrapper, AILArrayView)):
+        return o.__ail_object__
+    return o
+
+
+def _get_struct_type(type_or_obj, func_name: str) -> AILStructType:
+    if isinstance(type_or_obj, AILStructType):
+        return type_or_obj
+    elif isinstance(type_or_obj, AILStruct):
+        return type(type_or_obj)
+    raise TypeError('%s() needs struct or object' % func_name)
+
+
+def func_int_input(msg):
+    """
+    int_input(prompt: string) -> integer
+    @throws ValueError if the input value not a ordinal number
+    """
+    return int(input(str(msg)))
+
+
+def func_equal(a, b):
+    """
+    equal(a: Any, b: Any) -> boolean
+    @returns address of a == address of b
+    """
+    return _unwrap(a) is _unwrap(b)
+
+
+def func_array(size, default=None):
+    """
+    array(size: integer [, default: Any]) -> array
+    @param size the size of array
+    @param default the default value of array
+    """
+    if type(size) is not int:
+        raise TypeError('array() needs an integer.')
+    return [default] * size
+
+
+def func_map(*args):
+    """
+    map(pairs: Array[List])
+    """
+    if len(args) == 0:
+        return dict()
+    elif len(args) == 1:
+        pairs = args[0]
+
+        if not isinstance(pairs, (list, AILArrayView)):
+            raise TypeError('all of map(pairs) arguments must be array.')
+
+        m = dict()
+        for p in pairs:
+            if not isinstance(p, (list, AILArrayView)) or len(p) != 2:
+                raise ValueError('each pair must like: [key, value]')
+            k, v = p
+            m[k] = v
+
+        return m
+
+    raise ValueError('map() needs 0 or 1 arguments')
+
+
+def func_isimplement(type_or_obj, *stypes):
+    """
+    isimplement(typeOrObject: Struct|StructObject, *structTypes: StructType) -> boolean
+    @return whether a struct type or struct object have all bound functions in struct type(s)
+    """
+    if len(stypes) == 0:
+        raise ValueError('isimplement() needs two or more arguments')
+
+    _type = _get_struct_type(type_or_obj, 'isimplement')
+    names = set(_type.__ail_members__)
+    names.update(_type.__ail_bound_names__)
+
+    for stype in stypes:
+        if not isinstance(stype, AILStructType):
+            raise TypeError('isimplement(): not a struct')
+
+        for name in stype.__ail_members__ + tuple(stype.__ail_bound_names__):
+            if _is_private_name(name):
+                continue
+            if name not in names:
+                return False
+
+    return True
+
+
+def func_doc(o):
+    """
+    doc(o: Any) -> string
+    @return the doc string of an object
+    @return '' if no doc string
+    """
+    o = _unwrap(o)
+
+    if isinstance(o, AILObject):
+        doc_string = o['__doc__']
+    elif isinstance(o, _NO_DOC_TYPES) or isinstance(o, AILStruct):
+        doc_string = None
+    else:
+        doc_string = getattr(o, '__doc__', None)
+
+    if doc_string is None:
+        return ''
+    return doc_string
+
+
+def func_equal_type(a, b):
+    """
+    equal_type(a: Any, b: Any) -> boolean
+    @return whether the type of a equals the type of b
+    """
+    a = _unwrap(a)
+    b = _unwrap(b)
+
+    if isinstance(a, AILObject) and isinstance(b, AILObject):
+        return a['__class__'].otype == b['__class__'].otype
+    return type(a) is type(b)
+
+
+def func_show_struct(sobj):
+    """
+    show_struct(obj: StructObject) -> string
+    @returns a pretty info string of the struct object
+    """
+    _type = _get_struct_type(sobj, 'show_struct')
+
+    if sobj is _type:
+        memb = [(k, t) for k, t in zip(_type.__ail_members__,
+                                       _type.__ail_types__)]
+    else:
+        memb = [(k, slot.__get__(sobj))
+                for k, slot in _type.__ail_slots__.items()]
+
+    memb.extend((k, getattr(sobj, k)) for k in _type.__ail_bound_names__)
+
+    meml = '\n'.join(['\t%s : %s' % (k, v) for k, v in memb
+                      if k[:2] != '__'])
+    block = '{\n%s\n}' % meml
+
+    return str(sobj) + '\n' + block
+
+
+# name -> native implementation, these replace the converted legacy ones
+NATIVE_BUILTINS = {
+    'int_input': func_int_input,
+    'equal': func_equal,
+    'array': func_array,
+    'map': func_map,
+    'isimplement': func_isimplement,
+    'doc': func_doc,
+    'equal_type': func_equal_type,
+    'show_struct': func_show_struct,
+}
@@ -1,16 +1,23 @@
 
-from copy import copy
 from functools import wraps
 from inspect import isfunction, isbuiltin
 from typing import List, Dict, Union
 
-from .objects import AILImporter as _AILImporter, AILStruct as _AILStruct
+from .objects import (
+    AILArrayView as _AILArrayView,
+    AILImporter as _AILImporter,
+    AILStructType as _AILStructType,
+    make_struct_type as _make_struct_type
+)
 
 from . import exceptions as _exceptions
 
 
 _IMPORTER = _AILImporter()
 
+# arrays got from AIL objects are views, not lists
+_LIST_TYPES = (list, _AILArrayView)
+
 
 def ail_input(prompt: str, value_count: int):
     m = input(prompt)
@@ -35,14 +42,13 @@ def ail_import(
     return _IMPORTER.import_module(mode, name, namespace, alias, members)
 
 
-def bind_function(name: str, struct: _AILStruct):
+def bind_function(name: str, struct: _AILStructType):
     def outer_wrapper(func):
-        if not isinstance(struct, _AILStruct) or (
-                struct.__ail_as_instance__ or struct.__ail_as_object__):
+        if not isinstance(struct, _AILStructType):
             raise TypeError('function must bind on a struct')
         elif not (isfunction(func) or isbuiltin(func)):
             raise TypeError('only function can be bound')
-        struct.__bound_functions__[name] = func
+        struct.__ail_bind__(name, func)
         return func
     return outer_wrapper
 
@@ -51,51 +57,34 @@ def contains(o, iterable):
     return o in iterable
 
 
-def make_struct(name: str, members: List[str], protected: List[str]) -> _AILStruct:
+def make_struct(name: str, members: List[str],
+                protected: List[str], types: List[str] = None) -> _AILStructType:
     if not isinstance(name, str):
         raise TypeError('struct name must be string')
-    if not isinstance(members, list) or not isinstance(protected, list):
+    if not isinstance(members, _LIST_TYPES) \
+            or not isinstance(protected, _LIST_TYPES):
         raise TypeError('struct members or protecteds must be list')
-    return _AILStruct(name, members, protected)
+    if types is not None:
+        if not isinstance(types, _LIST_TYPES) or len(types) != len(members):
+            raise TypeError('struct types must be list of each member')
+        types = list(types)
+    return _make_struct_type(name, list(members), list(protected), types)
 
 
-def new_struct_object(struct: _AILStruct, attrs: Union[Dict, List] = None):
-    if not isinstance(struct, _AILStruct):
+def new_struct_object(struct: _AILStructType, attrs: Union[Dict, List] = None):
+    if not isinstance(struct, _AILStructType):
         raise TypeError('new() requires a struct')
 
-    obj = copy(struct)
-    obj.__ail_dict__ = dict()
-    obj.__ail_as_object__ = True
-
-    members_len = len(obj.__ail_members__)
-
-    if isinstance(attrs, dict):
-        items = attrs.items()
-        try:
-            obj.__ail_as_instance__ = True
-            for k, v in items:
-                setattr(obj, k, v)
-        finally:
-            obj.__ail_as_instance__ = False
-    elif isinstance(attrs, list):
+    if isinstance(attrs, _LIST_TYPES):
+        members_len = len(struct.__ail_members__)
         if len(attrs) != members_len:
-            raise ValueError('struct \'%s\' initializing needs %s value(s)' % 
-                             (obj.__ail_struct_name__, members_len))
-        try:
-            obj.__ail_as_instance__ = True
-            for k, v in zip(obj.__ail_members__, attrs):
-                setattr(obj, k, v)
-        finally:
-            obj.__ail_as_instance__ = False
-
-    instance = copy(obj)
-    instance.__ail_as_instance__ = True
-
-    for name, func in struct.__bound_functions__.items():
-        v = struct.__ail_check_bound__(instance, func, True)
-        setattr(instance, name, v)
-
-    return obj
+            raise ValueError('struct \'%s\' initializing needs %s value(s)' %
+                             (struct.__ail_struct_name__, members_len))
+        return struct.__ail_new__(*attrs)
+    elif isinstance(attrs, dict):
+        return struct.__ail_new__(**attrs)
+
+    return struct.__ail_new__()
 
 
 def func_fnum(x):
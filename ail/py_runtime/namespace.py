@@ -1,9 +1,9 @@
 
-from . import AIL_PY_GLOBAL
+from . import AIL_PY_BUILTINS
 
 
 def fill_namespace(ns: dict, name: str = '__main__', main: bool = True):
-    ns.update(AIL_PY_GLOBAL)
+    ns['__builtins__'] = AIL_PY_BUILTINS
     ns['__name__'] = name
     ns['__main__'] = main
 
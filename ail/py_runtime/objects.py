@@ -1,21 +1,36 @@
-from copy import copy
-from inspect import isfunction, isbuiltin
+from collections.abc import MutableSequence
+from functools import partialmethod
+from inspect import iscode, isfunction
+from keyword import iskeyword
 from os import getcwd, chdir
 from os.path import dirname
-from types import MethodType
+from sys import _getframe
+from threading import Lock
+from types import BuiltinFunctionType, FunctionType, MethodType
 from typing import List
 
 from . import exceptions as _exceptions
 from . import shared as _shared
+from .structpack import CODEC_NAMES, get_format_codes, make_struct_codec
 
 from ..core.aloader import MAIN_LOADER as _LOADER
 from ..core.aobjects import AILObject, convert_to_ail_object
 from ..core.error import AILRuntimeError as _RTError
 
+from ..objects.class_object import (
+    CLASS_TYPE as _CLASS_TYPE, OBJECT_TYPE as _OBJECT_TYPE,
+    new_object as _new_class_object
+)
+from ..objects.function import FUNCTION_TYPE, PY_FUNCTION_TYPE
 from ..objects.null import _NULL_TYPE
 
 _NONE = object()
 
+_FUNCTION_TYPES = (FUNCTION_TYPE, PY_FUNCTION_TYPE)
+
+# values passed to and returned from python functions without conversion
+_NATIVE_TYPES = frozenset((int, float, str, bool, type(None)))
+
 
 def check_object(obj):
     if isinstance(obj, _RTError):
@@ -24,8 +39,8 @@ def check_object(obj):
 
 
 def convert_to_ail_object_pyc(obj):
-    if isinstance(obj, AILObjectWrapper):
-        return getattr(obj, '_$ail_object')
+    if isinstance(obj, (AILObjectWrapper, AILArrayView)):
+        return obj.__ail_object__
     return convert_to_ail_object(obj)
 
 
@@ -37,11 +52,88 @@ def convert_object(obj):
         elif type(v) in (int, str, float):
             return v
         elif type(v) is list:
-            return [convert_object(o) for o in v]
+            return AILArrayView(obj)
         return AILObjectWrapper(obj)
     return obj
 
 
+class AILArrayView(MutableSequence):
+    """
+    a list-like view of an AIL array, converts elements on access and
+    writes through to the array, without copying the array.
+    """
+
+    __slots__ = ('__ail_object__',)
+
+    __hash__ = None
+
+    def __init__(self, ail_array: AILObject):
+        self.__ail_object__ = ail_array
+
+    @property
+    def __ail_list__(self) -> list:
+        return self.__ail_object__.value
+
+    def __len__(self) -> int:
+        return len(self.__ail_list__)
+
+    def __getitem__(self, index):
+        if type(index) is slice:
+            return [convert_object(o) for o in self.__ail_list__[index]]
+        return convert_object(self.__ail_list__[index])
+
+    def __setitem__(self, index, value):
+        if type(index) is slice:
+            value = [convert_to_ail_object_pyc(v) for v in value]
+        else:
+            value = convert_to_ail_object_pyc(value)
+        self.__ail_list__[index] = value
+
+    def __delitem__(self, index):
+        del self.__ail_list__[index]
+
+    def __iter__(self):
+        for o in self.__ail_list__:
+            yield convert_object(o)
+
+    def insert(self, index: int, value):
+        self.__ail_list__.insert(index, convert_to_ail_object_pyc(value))
+
+    def append(self, value):
+        self.__ail_list__.append(convert_to_ail_object_pyc(value))
+
+    def sort(self, key=None, reverse: bool = False):
+        if key is None:
+            key = convert_object
+        else:
+            key = (lambda k: lambda o: k(convert_object(o)))(key)
+        self.__ail_list__.sort(key=key, reverse=reverse)
+
+    def copy(self) -> list:
+        return list(self)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, AILArrayView)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __add__(self, other) -> list:
+        return list(self) + list(other)
+
+    def __radd__(self, other) -> list:
+        return list(other) + list(self)
+
+    def __mul__(self, n: int) -> list:
+        return list(self) * n
+
+    __rmul__ = __mul__
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    __str__ = __repr__
+
+
 class AILModule:
     def __init__(self, name: str, path: str, globals: dict):
         setattr(self, '_$_module_globals', globals)
@@ -76,6 +168,17 @@ class AILImporter:
     def __init__(self):
         self.__loading_modules = []
 
+        # module path (None for the main module) -> paths of modules it imports
+        self.dependencies = dict()
+        self.__dependencies_lock = Lock()
+
+    def get_dependencies(self) -> dict:
+        """
+        :return: a copy of dependencies, safe to read from another thread
+        """
+        with self.__dependencies_lock:
+            return {k: list(v) for k, v in self.dependencies.items()}
+
     @staticmethod
     def get_export(namespace: dict, exports: dict) -> dict:
         if exports is None:
@@ -104,6 +207,13 @@ class AILImporter:
             raise ImportError('Cannot import module \'%s\' ' % name +
                               '(may caused circular import)')
 
+        importer = self.__loading_modules[-1] \
+            if self.__loading_modules else None
+        with self.__dependencies_lock:
+            deps = self.dependencies.setdefault(importer, [])
+            if path not in deps:
+                deps.append(path)
+
         self.__loading_modules.append(path)
 
         try:
@@ -143,6 +253,32 @@ class AILImporter:
         finally:
             self.__loading_modules.remove(path)
 
+    def reload_module(self, path: str) -> bool:
+        """
+        execute the newest source of a loaded module, and replace the
+        namespace of its module object, so that the importers see new names.
+
+        :return: False if the module has not been loaded as an AIL module
+        """
+        module_obj = _shared.loaded_modules.get(path)
+        if not isinstance(module_obj, AILModule):
+            return False
+
+        if path in self.__loading_modules:
+            raise ImportError('Cannot reload module \'%s\' while loading' %
+                              path)
+
+        self.__loading_modules.append(path)
+
+        try:
+            ns = self.get_namespace(path, self.get_source(path))
+            ns = self.get_export(ns, ns.get('__export__', None))
+            setattr(module_obj, '_$_module_globals', ns)
+        finally:
+            self.__loading_modules.remove(path)
+
+        return True
+
     @staticmethod
     def get_path(name: str, default=_NONE) -> str:
         path = _LOADER.search_module(name)
@@ -174,8 +310,7 @@ class AILImporter:
         cwd = getcwd()
 
         try:
-            from . import AIL_PY_GLOBAL
-            module_globals = AIL_PY_GLOBAL.copy()
+            module_globals = dict()
 
             module_work_dir = dirname(path)
 
@@ -194,17 +329,50 @@ class AILImporter:
             chdir(cwd)
 
 
+def _get_attr_version(o: AILObject, name: str):
+    """
+    :return: the version tag of the class of o if o is an object of a legacy
+             class and name is not set on o itself, the attribute can not
+             change until the tag changes. None for other objects.
+    """
+    if o.cls is _OBJECT_TYPE:
+        props = o.properties
+        if name not in props['__dict__']:
+            return props['__this_class__'].properties['__version_tag__']
+    return None
+
+
 class AILObjectWrapper:
+    __slots__ = ('__ail_object__', '__ail_attr_cache__')
+
     def __init__(self, ail_object):
-        setattr(self, '_$ail_object', ail_object)
+        object.__setattr__(self, '__ail_object__', ail_object)
+        object.__setattr__(self, '__ail_attr_cache__', None)
 
     def __getattr__(self, name):
         if name[:2] == '_$':
-            return super().__getattribute__(name[2:])
+            return object.__getattribute__(self, '__%s__' % name[2:])
         elif name[:2] == name[-2:] == '__':
-            return super().__getattribute__(name)
+            return object.__getattribute__(self, name)
+
+        o = self.__ail_object__
+
+        # name -> (version, function object, its wrapper), the attribute
+        # may be changed through the object, another wrapper or its class
+        cache = self.__ail_attr_cache__
+        cached = None
+
+        if cache is not None:
+            cached = cache.get(name)
+            if cached is not None and cached[0] is not None:
+                # an object of a legacy class, see _get_attr_version()
+                props = o.properties
+                if name not in props['__dict__'] and cached[0] == \
+                        props['__this_class__'].properties['__version_tag__']:
+                    return cached[2]
+
+        version = _get_attr_version(o, name)
 
-        o = getattr(self, '_$ail_object')
         v = o['__getattr__']
 
         if v is None:
@@ -212,15 +380,30 @@ class AILObjectWrapper:
                 'object %s has no attribute \'%s\'' %
                 (o['__class__'], name))
 
-        return check_object(v(o, name))
+        v = v(o, name)
+
+        # the lookup still gives the same function, keep its wrapper
+        if cached is not None and cached[1] is v:
+            cache[name] = (version, v, cached[2])
+            return cached[2]
+
+        result = check_object(v)
+
+        if isinstance(v, AILObject) and v['__class__'] in _FUNCTION_TYPES:
+            if cache is None:
+                cache = dict()
+                object.__setattr__(self, '__ail_attr_cache__', cache)
+            cache[name] = (version, v, result)
+
+        return result
 
     def __setattr__(self, name, value):
         if name[:2] == '_$':
-            return super().__setattr__(name[2:], value)
+            return object.__setattr__(self, '__%s__' % name[2:], value)
         elif name[:2] == name[-2:] == '__':
-            return super().__setattr__(name, value)
+            return object.__setattr__(self, name, value)
 
-        o = getattr(self, '_$ail_object')
+        o = self.__ail_object__
         v = o['__setattr__']
 
         if v is None:
@@ -230,7 +413,7 @@ class AILObjectWrapper:
         return check_object(v(o, name, convert_to_ail_object(value)))
 
     def __str__(self):
-        o = getattr(self, '_$ail_object')
+        o = self.__ail_object__
         v = o['__str__']
 
         if v is None:
@@ -239,7 +422,7 @@ class AILObjectWrapper:
         return check_object(v(o))
 
     def __repr__(self):
-        o = getattr(self, '_$ail_object')
+        o = self.__ail_object__
         v = o['__repr__']
 
         if v is None:
@@ -248,98 +431,282 @@ class AILObjectWrapper:
         return check_object(v(o))
 
     def __call__(self, *args):
-        o = getattr(self, '_$ail_object')
-        v = o['__pyfunction__']
+        o = self.__ail_object__
+        props = o.properties
+        v = props.get('__pyfunction__')
 
         if v is None:
+            if o.cls is _CLASS_TYPE:
+                return check_object(_new_class_object(
+                    o, *[convert_to_ail_object_pyc(a) for a in args]))
+
             raise AttributeError(
                 '\'%s\' object is not callable' % o['__class__'])
 
-        args = [convert_to_ail_object_pyc(o) for o in args]
+        if props.get('__py_natives__'):
+            args = [a if type(a) in _NATIVE_TYPES
+                    else convert_to_ail_object_pyc(a) for a in args]
+        else:
+            args = [convert_to_ail_object_pyc(a) for a in args]
 
-        if o['__this__'] is not None:
-            return check_object(v(o, *args))
-        return check_object(v(*args))
+        this = props.get('__self__')  # method of class object
+        if this is not None:
+            r = v(this, *args)
+        elif props.get('__this__') is not None:
+            r = v(o, *args)
+        else:
+            r = v(*args)
 
+        if type(r) in _NATIVE_TYPES:
+            return r
+        return check_object(r)
 
-class AILStruct:
-    def __init__(self, name: str, members: List[str], protected: List[str]):
-        self.__ail_protected__ = tuple(protected)
-        self.__ail_members__ = tuple(members)
-        self.__ail_as_instance__ = False
-        self.__ail_struct_name__ = name
-        self.__ail_as_object__ = False
-        self.__bound_functions__ = {}
 
-        self.__ail_dict__ = dict()
+def _is_private_name(name: str) -> bool:
+    return name[:2] == '__' and name[-2:] != '__'
 
-        self.__init_members__()
 
-    def __ail_check_bound__(self, instance, target, try_bound: bool = False):
-        is_func = isfunction(target) or isbuiltin(target)
-        if not is_func:
-            if try_bound:
-                return target
-            raise TypeError('bound target must be a function')
-        method = MethodType(target, instance)
-        return method
+def _mangle_name(class_name: str, name: str) -> str:
+    # names in __slots__ are mangled like the names in a class body
+    class_name = class_name.lstrip('_')
+    if not _is_private_name(name) or not class_name:
+        return name
+    return '_%s%s' % (class_name, name)
 
-    def __set_bound_function__(self, name: str, func):
-        self.__bound_functions__[name] = func
 
-    def __init_members__(self):
-        try:
-            self.__ail_as_instance__ = True
-            for m in self.__ail_members__:
-                setattr(self, m, None)
-        finally:
-            self.__ail_as_instance__ = False
+# functions stored in members by new() or by the methods of the struct are
+# bound to the object, so that they get the object as 'this'
+_MEMBER_FUNCTION_TYPES = frozenset((FunctionType, BuiltinFunctionType))
 
-    def __getattr__(self, name: str):
-        if name[:2] == name[-2:] == '__':
-            return super().__getattribute__(name)
-        elif name[:2] == '__':
-            if not self.__ail_as_instance__:
-                raise AttributeError('struct \'%s\' has no attribute \'%s\'' %
-                                     (self.__ail_struct_name__, name))
-        if name in self.__ail_dict__:
-            return self.__ail_dict__[name]
-        else:
-            raise AttributeError('struct \'%s\' has no attribute \'%s\'' %
-                                 (self.__ail_struct_name__, name))
 
-    def __setattr__(self, name: str, value):
-        if name[:2] == name[-2:] == '__':
-            return super().__setattr__(name, value)
+def _bind_member_value(obj, value):
+    if type(value) in _MEMBER_FUNCTION_TYPES:
+        return MethodType(value, obj)
+    return value
 
-        elif name[:2] == '__':
-            if not self.__ail_as_instance__:
-                raise AttributeError('struct \'%s\' has no attribute \'%s\'' %
-                                     (self.__ail_struct_name__, name))
 
-        elif name in self.__ail_protected__ and not self.__ail_as_instance__:
-            raise AttributeError('readonly attribute')
+def _iter_code_objects(code):
+    """
+    iterate code and the code objects nested in it, such as lambdas,
+    closures and comprehensions
+    """
+    yield code
+    for c in code.co_consts:
+        if iscode(c):
+            yield from _iter_code_objects(c)
 
-        elif self.__ail_as_instance__:
-            v = self.__ail_check_bound__(self, value, True)
-            self.__ail_dict__[name] = v
 
-        elif self.__ail_as_object__:
-            if name in self.__ail_protected__:
-                raise AttributeError('cannot set a protected attribute \'%s\'' % name)
-            self.__ail_dict__[name] = value
+def _make_member_property(struct, name: str, slot, readable: bool):
+    """
+    :return: a property which only the methods bound to struct, and the
+             code nested in them, can set, and get if not readable
+    """
+    codes = struct.__ail_method_codes__
+    struct_name = struct.__ail_struct_name__
+    get_slot = slot.__get__
+    set_slot = slot.__set__
 
-        elif name not in self.__ail_members__:
+    if readable:
+        fget = get_slot
+    else:
+        def fget(obj):
+            if _getframe(1).f_code in codes:
+                return get_slot(obj)
             raise AttributeError('struct \'%s\' has no attribute \'%s\'' %
-                                 (self.__ail_struct_name__, name))
+                                 (struct_name, name))
+
+    def fset(obj, value):
+        if _getframe(1).f_code in codes:
+            return set_slot(obj, _bind_member_value(obj, value))
+        if readable:
+            raise AttributeError(
+                'cannot set a protected attribute \'%s\'' % name)
+        raise AttributeError('struct \'%s\' has no attribute \'%s\'' %
+                             (struct_name, name))
+
+    return property(fget, fset)
+
+
+def _is_arg_name(name: str) -> bool:
+    return name.isidentifier() and not iskeyword(name) and \
+           name[:5] != '_ail_'
+
+
+def _make_struct_new(struct, slots: dict):
+    """
+    :return: a constructor specialised for struct, which allocates the object
+             once and sets each slot from a positional or keyword argument,
+             None for missing ones
+    """
+    if not all(_is_arg_name(m) for m in slots):
+        return _make_struct_new_generic(struct, slots)
+
+    ns = {'_ail_alloc': object.__new__, '_ail_struct': struct,
+          '_ail_method': MethodType,
+          '_ail_function_types': _MEMBER_FUNCTION_TYPES}
+    args = []
+    body = []
+
+    for i, (m, slot) in enumerate(slots.items()):
+        ns['_ail_set_%d' % i] = slot.__set__
+        args.append('%s=None' % m)
+        body.append(
+            '    _ail_set_%d(_ail_obj, _ail_method(%s, _ail_obj) '
+            'if type(%s) in _ail_function_types else %s)\n' % (i, m, m, m))
+
+    # names starting with '_ail_' are never members, see _is_arg_name()
+    source = 'def new(%s):\n    _ail_obj = _ail_alloc(_ail_struct)\n%s' \
+             '    return _ail_obj\n' % (', '.join(args), ''.join(body))
+
+    exec(source, ns)
+
+    return ns['new']
+
+
+def _make_struct_new_generic(struct, slots: dict):
+    members = tuple(slots)
+    alloc = object.__new__
+
+    def new(*args, **kwargs):
+        if len(args) > len(members):
+            raise TypeError('new() takes %s positional argument(s)' %
+                            len(members))
+
+        values = dict.fromkeys(members)
+        values.update(zip(members, args))
+
+        for k, v in kwargs.items():
+            if k not in values:
+                raise TypeError(
+                    'new() got an unexpected keyword argument \'%s\'' % k)
+            values[k] = v
+
+        obj = alloc(struct)
+        for m, slot in slots.items():
+            slot.__set__(obj, _bind_member_value(obj, values[m]))
+
+        return obj
+
+    return new
+
+
+class AILStructType(type):
+    """
+    the type of AIL structs, every struct declaration is a class generated
+    by make_struct_type() whose instances are the struct objects.
+    """
+
+    def __call__(cls, *args, **kwargs):
+        raise TypeError('struct \'%s\' is not callable, use new() instead' %
+                        cls.__ail_struct_name__)
+
+    def __setattr__(cls, name: str, value):
+        raise AttributeError('cannot set attribute to struct')
+
+    def __ail_bind__(cls, name: str, func):
+        """
+        bind a function as a method of struct objects, bound functions can
+        access the private members and set the protected members.
+        """
+        if name in CODEC_NAMES and hasattr(cls, 'packed_size'):
+            raise TypeError(
+                'cannot bind \'%s\' to struct \'%s\', which packs its '
+                'objects' % (name, cls.__ail_struct_name__))
+
+        if name not in cls.__ail_bound_names__:
+            cls.__ail_bound_names__.append(name)
+
+        if isfunction(func):
+            # code nested in a method can access the members as well
+            cls.__ail_method_codes__.update(_iter_code_objects(func.__code__))
         else:
-            raise AttributeError('cannot set attribute to struct')
-        # super().__setattr__(name, value)
+            func = partialmethod(func)
+
+        type.__setattr__(cls, name, func)
+
+    def __str__(cls) -> str:
+        return '<struct \'%s\'>' % cls.__ail_struct_name__
+
+    __repr__ = __str__
+
+
+class AILStruct(metaclass=AILStructType):
+    __slots__ = ()
+
+    __ail_struct_name__ = 'struct'
+    __ail_members__ = ()
+    __ail_protected__ = ()
+    __ail_types__ = ()
+    __ail_format_codes__ = ()
+    __ail_slots__ = {}  # member name -> slot descriptor
+    __ail_bound_names__ = ()
+
+    @staticmethod
+    def __ail_new__():
+        raise TypeError('cannot create object of the base struct')
 
     def __str__(self) -> str:
-        if self.__ail_as_object__:
-            return '<struct \'%s\' object at %s>' % \
-                   (self.__ail_struct_name__, hex(id(self)))
-        return '<struct \'%s\'>' % self.__ail_struct_name__
+        return '<struct \'%s\' object at %s>' % \
+               (self.__ail_struct_name__, hex(id(self)))
 
     __repr__ = __str__
+
+
+def make_struct_type(name: str, members: List[str], protected: List[str],
+                     types: List[str] = None) -> AILStructType:
+    """
+    generate a class with __slots__ for a struct declaration, the public
+    members are plain slots, the protected and private members are
+    properties over their slots.
+
+    if every member is typed, the struct can pack its objects into bytes.
+    """
+    if types is None:
+        types = [None] * len(members)
+    elif members and all(types):
+        clash = [m for m in members if m in CODEC_NAMES]
+        if clash:
+            raise TypeError(
+                'member \'%s\' of struct \'%s\' clashes with the generated '
+                'pack / unpack functions' % (clash[0], name))
+
+    member_types = dict()
+    for m, t in zip(members, types):
+        member_types.setdefault(m, t)
+
+    members = tuple(member_types)
+    types = tuple(member_types.values())
+
+    struct = AILStructType(name, (AILStruct,), {
+        '__slots__': members,
+        '__ail_struct_name__': name,
+        '__ail_members__': members,
+        '__ail_protected__': tuple(protected),
+        '__ail_types__': types,
+        '__ail_format_codes__': get_format_codes(types),
+        '__ail_method_codes__': set(),
+        '__ail_bound_names__': [],
+        '__module__': AILStruct.__module__,
+    })
+
+    slots = dict()
+
+    for m in members:
+        key = _mangle_name(name, m)
+        slot = slots[m] = struct.__dict__[key]
+
+        private = _is_private_name(m)
+        if private or m in protected:
+            type.__delattr__(struct, key)
+            type.__setattr__(
+                struct, m, _make_member_property(struct, m, slot, not private))
+
+    type.__setattr__(struct, '__ail_slots__', slots)
+    type.__setattr__(
+        struct, '__ail_new__', staticmethod(_make_struct_new(struct, slots)))
+
+    if members and all(types):
+        for k, v in make_struct_codec(struct, slots, types).items():
+            type.__setattr__(struct, k, v)
+
+    return struct
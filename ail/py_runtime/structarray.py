@@ -0,0 +1,275 @@
+from array import array as _array
+from typing import Iterable, List, Union
+
+from .objects import AILArrayView, AILStruct, AILStructType
+
+
+# numeric columns are stored in typed arrays, an int column is upcast to
+# float by the first float, other values turn the column into a list.
+# members typed with a numeric type keep their array type.
+_INT_CODE = 'q'
+_FLOAT_CODE = 'd'
+
+_ARRAY_CODES = set('bBhHiIqQfd')
+
+_Column = Union[_array, list]
+
+
+def _new_column(value) -> _Column:
+    t = type(value)
+    if t is int:
+        return _array(_INT_CODE)
+    elif t is float:
+        return _array(_FLOAT_CODE)
+    return []
+
+
+def _fits(column: _Column, value) -> bool:
+    if type(column) is list:
+        return True
+    elif column.typecode == _INT_CODE:
+        return isinstance(value, int) and -(1 << 63) <= value < (1 << 63)
+    return type(value) is float or isinstance(value, int)
+
+
+def _widen(column: _Column, value) -> _Column:
+    """
+    :return: a column which can store value and all values of column
+    """
+    if type(column) is _array and column.typecode == _INT_CODE \
+            and type(value) is float:
+        return _array(_FLOAT_CODE, column)
+    return list(column)
+
+
+class StructRow:
+    """
+    a view of a row in a StructArray, reads and writes go to the columns
+    """
+
+    __slots__ = ('_array', '_index')
+
+    def __init__(self, struct_array, index: int):
+        object.__setattr__(self, '_array', struct_array)
+        object.__setattr__(self, '_index', index)
+
+    def __getattr__(self, name: str):
+        return self._array.get_value(self._index, name)
+
+    def __setattr__(self, name: str, value):
+        self._array.set_value(self._index, name, value)
+
+    def to_object(self) -> AILStruct:
+        return self._array.get_object(self._index)
+
+    def __str__(self) -> str:
+        return '<row %s of struct \'%s\' array>' % (
+            self._index, self._array.struct.__ail_struct_name__)
+
+    __repr__ = __str__
+
+
+class StructArray:
+    """
+    StructArray(struct, n) -> an array of n rows of struct, which stores
+    every member in a column (struct of arrays).
+    """
+
+    def __init__(self, struct: AILStructType, n: int = 0):
+        if not isinstance(struct, AILStructType):
+            raise TypeError('StructArray() requires a struct')
+        if type(n) is not int or n < 0:
+            raise ValueError('size of StructArray must be a non-negative int')
+
+        self.struct = struct
+        self.members = struct.__ail_members__
+
+        # typed members have fixed columns, the others choose their type
+        # by values. new rows are filled with 0.
+        self.__fixed = {m for m, c in zip(self.members,
+                                          struct.__ail_format_codes__)
+                        if c in _ARRAY_CODES}
+        self.__columns = dict()
+
+        for m, c in zip(self.members, struct.__ail_format_codes__):
+            code = c if m in self.__fixed else _INT_CODE
+            self.__columns[m] = _array(
+                code, bytes(_array(code).itemsize * n))
+
+        self.__size = n
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __check_index(self, index: int) -> int:
+        if type(index) is not int:
+            raise TypeError('StructArray indices must be integers')
+        if index < 0:
+            index += self.__size
+        if not 0 <= index < self.__size:
+            raise IndexError('StructArray index out of range')
+        return index
+
+    def __get_column(self, name: str) -> _Column:
+        column = self.__columns.get(name)
+        if column is None:
+            raise AttributeError('struct \'%s\' has no attribute \'%s\'' %
+                                 (self.struct.__ail_struct_name__, name))
+        return column
+
+    def __store(self, name: str, index: int, value):
+        column = self.__columns[name]
+        if name not in self.__fixed and not _fits(column, value):
+            column = self.__columns[name] = _widen(column, value)
+        column[index] = value
+
+    def __push(self, name: str, value):
+        column = self.__columns[name]
+        if name in self.__fixed:
+            pass
+        elif not column and type(column) is _array:
+            column = self.__columns[name] = _new_column(value)
+        elif not _fits(column, value):
+            column = self.__columns[name] = _widen(column, value)
+        column.append(value)
+
+    def __check_fixed(self, values: List):
+        # a typed column raises on a bad value, check every typed value
+        # before any column changes
+        for m, v in zip(self.members, values):
+            if m in self.__fixed:
+                _array(self.__columns[m].typecode, (v,))
+
+    def __get_values(self, values) -> List:
+        """
+        :return: values of every member from a struct object, a list or a map
+        """
+        if isinstance(values, AILStruct):
+            if type(values) is not self.struct:
+                raise TypeError('expect object of struct \'%s\', got %s' %
+                                (self.struct.__ail_struct_name__, values))
+            return [slot.__get__(values)
+                    for slot in self.struct.__ail_slots__.values()]
+
+        elif isinstance(values, StructRow):
+            return [values._array.get_value(values._index, m)
+                    for m in self.members]
+
+        elif isinstance(values, dict):
+            for k in values:
+                self.__get_column(k)
+            return [values.get(m, 0) for m in self.members]
+
+        elif isinstance(values, (list, tuple, AILArrayView)):
+            if len(values) != len(self.members):
+                raise ValueError(
+                    'struct \'%s\' initializing needs %s value(s)' %
+                    (self.struct.__ail_struct_name__, len(self.members)))
+            return list(values) if type(values) is AILArrayView else values
+
+        raise TypeError('cannot use %s as a row of StructArray' % values)
+
+    def get_value(self, index: int, name: str):
+        return self.__get_column(name)[self.__check_index(index)]
+
+    def set_value(self, index: int, name: str, value):
+        self.__get_column(name)
+        self.__store(name, self.__check_index(index), value)
+
+    def get_object(self, index: int) -> AILStruct:
+        """
+        :return: a new struct object which has the values of the row
+        """
+        index = self.__check_index(index)
+        return self.struct.__ail_new__(
+            *[self.__columns[m][index] for m in self.members])
+
+    def column(self, name: str) -> _Column:
+        """
+        :return: the storage of a member, an array or a list
+        """
+        return self.__get_column(name)
+
+    def append(self, values):
+        """
+        append a row from a struct object, a row, a list or a map
+        """
+        values = self.__get_values(values)
+        self.__check_fixed(values)
+        for m, v in zip(self.members, values):
+            self.__push(m, v)
+        self.__size += 1
+
+    def extend(self, rows: Iterable):
+        """
+        append rows from an iterable, one column at a time
+        """
+        rows = [self.__get_values(r) for r in rows]
+        if not rows:
+            return
+
+        # convert typed columns first, so that no column changes on error
+        fixed = {m: _array(self.__columns[m].typecode, [r[i] for r in rows])
+                 for i, m in enumerate(self.members) if m in self.__fixed}
+
+        for i, m in enumerate(self.members):
+            column = self.__columns[m]
+
+            if m in fixed:
+                column.extend(fixed[m])
+                continue
+
+            values = [r[i] for r in rows]
+
+            if not column and type(column) is _array:
+                column = self.__columns[m] = _new_column(values[0])
+
+            if type(column) is _array:
+                try:
+                    column.extend(_array(column.typecode, values))
+                    continue
+                except (TypeError, OverflowError):
+                    pass
+
+            for v in values:
+                if not _fits(column, v):
+                    column = self.__columns[m] = _widen(column, v)
+
+            column.extend(values)
+
+        self.__size += len(rows)
+
+    def sort_by(self, name: str, reverse: bool = False):
+        """
+        sort the rows by a member in place
+        """
+        key = self.__get_column(name)
+        order = sorted(range(self.__size), key=key.__getitem__,
+                       reverse=reverse)
+
+        for m, column in self.__columns.items():
+            if type(column) is list:
+                self.__columns[m] = [column[i] for i in order]
+            else:
+                self.__columns[m] = _array(
+                    column.typecode, [column[i] for i in order])
+
+    def __getitem__(self, index: int) -> StructRow:
+        return StructRow(self, self.__check_index(index))
+
+    def __setitem__(self, index: int, values):
+        index = self.__check_index(index)
+        values = self.__get_values(values)
+        self.__check_fixed(values)
+        for m, v in zip(self.members, values):
+            self.__store(m, index, v)
+
+    def __iter__(self):
+        for i in range(self.__size):
+            yield StructRow(self, i)
+
+    def __str__(self) -> str:
+        return '<StructArray of struct \'%s\' with %s row(s)>' % (
+            self.struct.__ail_struct_name__, self.__size)
+
+    __repr__ = __str__
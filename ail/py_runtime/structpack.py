@@ -0,0 +1,132 @@
+import struct as _struct
+
+from itertools import starmap
+from typing import List, Optional, Tuple
+
+
+# records are little-endian with standard sizes and no padding
+_BYTE_ORDER = '<'
+
+_TYPE_CODES = {
+    'int': 'q', 'float': 'd', 'bool': '?',
+    'i8': 'b', 'u8': 'B', 'i16': 'h', 'u16': 'H',
+    'i32': 'i', 'u32': 'I', 'i64': 'q', 'u64': 'Q',
+    'f32': 'f', 'f64': 'd',
+}
+
+_SIZED_TYPES = ('bytes', 'str')  # bytes(n), str(n)
+
+# attributes generated by make_struct_codec(), no member or method can take
+CODEC_NAMES = ('pack', 'pack_into', 'unpack', 'iter_unpack', 'packed_size')
+
+
+def get_format_code(type_name: str) -> str:
+    """
+    :return: the struct module format code of a member type, such as
+             'i32' -> 'i', 'str(16)' -> '16s', or a format code itself
+    """
+    code = _TYPE_CODES.get(type_name)
+    if code is not None:
+        return code
+
+    for sized in _SIZED_TYPES:
+        if type_name.startswith(sized + '(') and type_name[-1] == ')':
+            size = type_name[len(sized) + 1:-1]
+            if size.isdigit():
+                return size + 's'
+
+    try:
+        fmt = _BYTE_ORDER + type_name
+        if len(_struct.unpack(fmt, bytes(_struct.calcsize(fmt)))) == 1:
+            return type_name
+    except _struct.error:
+        pass
+
+    raise TypeError('invalid type of struct member: \'%s\'' % type_name)
+
+
+def get_format_codes(types: List[Optional[str]]) -> Tuple[Optional[str]]:
+    return tuple(None if t is None else get_format_code(t) for t in types)
+
+
+def _make_str_encoder(name: str, size: int):
+    def encode(s: str) -> bytes:
+        b = s.encode('UTF-8')
+        if len(b) > size:
+            raise ValueError(
+                'member \'%s\' is %d bytes in UTF-8, longer than str(%d)' %
+                (name, len(b), size))
+        return b
+    return encode
+
+
+def _decode_str(b: bytes) -> str:
+    return b.rstrip(b'\0').decode('UTF-8')
+
+
+def make_struct_codec(struct, slots: dict, types: List[str]) -> dict:
+    """
+    generate pack, pack_into, unpack and iter_unpack for a struct whose
+    members are all typed, members of str(n) are encoded in UTF-8, a value
+    longer than n bytes raises ValueError instead of being cut.
+
+    :return: attributes to set to the struct
+    """
+    codes = get_format_codes(types)
+    packer = _struct.Struct(_BYTE_ORDER + ''.join(codes))
+
+    ns = {
+        '_ail_new': struct.__ail_new__,
+        '_ail_pack': packer.pack,
+        '_ail_pack_into': packer.pack_into,
+        '_ail_decode': _decode_str,
+    }
+
+    values = []
+    fields = []
+
+    for i, (t, (m, slot)) in enumerate(zip(types, slots.items())):
+        ns['_ail_get_%d' % i] = slot.__get__
+        if t.startswith('str('):
+            ns['_ail_encode_%d' % i] = _make_str_encoder(m, int(t[4:-1]))
+            values.append('_ail_encode_%d(_ail_get_%d(self))' % (i, i))
+            fields.append('_ail_decode(v[%d])' % i)
+        else:
+            values.append('_ail_get_%d(self)' % i)
+            fields.append('v[%d]' % i)
+
+    values = ', '.join(values)
+
+    source = 'def pack(self):\n' \
+             '    return _ail_pack(%s)\n' \
+             'def pack_into(self, buffer, offset=0):\n' \
+             '    _ail_pack_into(buffer, offset, %s)\n' \
+             'def from_tuple(v):\n' \
+             '    return _ail_new(%s)\n' % (
+                 values, values, ', '.join(fields))
+
+    exec(source, ns)
+
+    new = struct.__ail_new__
+    from_tuple = ns['from_tuple']
+    unpack_from = packer.unpack_from
+    iter_unpack = packer.iter_unpack
+    has_str = any(t.startswith('str(') for t in types)
+
+    def unpack(buffer, offset: int = 0):
+        return from_tuple(unpack_from(buffer, offset))
+
+    if has_str:
+        def iter_unpack_objects(buffer):
+            return map(from_tuple, iter_unpack(buffer))
+    else:
+        def iter_unpack_objects(buffer):
+            return starmap(new, iter_unpack(buffer))
+
+    return {
+        'pack': ns['pack'],
+        'pack_into': ns['pack_into'],
+        'unpack': staticmethod(unpack),
+        'iter_unpack': staticmethod(iter_unpack_objects),
+        'packed_size': packer.size,
+    }
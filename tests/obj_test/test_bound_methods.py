@@ -0,0 +1,150 @@
+import gc
+import tracemalloc
+
+from time import perf_counter
+from weakref import ref
+
+import ail.py_runtime
+
+from ail.core import aconfig
+from ail.core.aobjects import convert_to_ail_object
+from ail.objects.class_object import new_class, new_object, object_getattr
+
+
+# the bound-method cache of objects of legacy classes
+
+OBJECT_COUNT = 2000
+METHOD_COUNT = 32
+CALL_COUNT = 100000
+
+
+def _make_class():
+    def method(self):
+        return self
+
+    return new_class('C', [], {
+        'm%d' % i: convert_to_ail_object(method)
+        for i in range(METHOD_COUNT)
+    })
+
+
+class _CacheSize:
+    """
+    set aconfig.BOUND_METHOD_CACHE_SIZE in a with block
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+
+    def __enter__(self):
+        self.old_size = aconfig.BOUND_METHOD_CACHE_SIZE
+        aconfig.BOUND_METHOD_CACHE_SIZE = self.size
+
+    def __exit__(self, *_):
+        aconfig.BOUND_METHOD_CACHE_SIZE = self.old_size
+
+
+def test_bound_method_cache_hit():
+    with _CacheSize(8):
+        o = new_object(_make_class())
+
+        m = object_getattr(o, 'm0')
+        assert object_getattr(o, 'm0') is m
+        assert list(o['__bound_methods__']) == ['m0']
+
+
+def test_bound_method_cache_eviction():
+    with _CacheSize(4):
+        o = new_object(_make_class())
+        cache = o['__bound_methods__']
+
+        m0 = object_getattr(o, 'm0')
+        for i in range(1, 4):
+            object_getattr(o, 'm%d' % i)
+        assert len(cache) == 4
+
+        # m0 is used again, so m1 is the least recently used one
+        assert object_getattr(o, 'm0') is m0
+        object_getattr(o, 'm4')
+
+        assert len(cache) == 4
+        assert 'm0' in cache and 'm1' not in cache
+        assert object_getattr(o, 'm0') is m0
+
+
+def test_bound_method_cache_weakref():
+    with _CacheSize(0):
+        o = new_object(_make_class())
+        cache = o['__bound_methods__']
+
+        m = object_getattr(o, 'm0')
+        assert type(cache['m0'][1]) is ref
+        assert object_getattr(o, 'm0') is m
+
+        # the cache does not keep the method alive
+        del m
+        assert cache['m0'][1]() is None
+        assert object_getattr(o, 'm0') is not None
+
+        # nor the object, no cycle through the cache
+        r = ref(o)
+        del o
+        assert r() is None
+
+
+def bench_bound_methods(cache_size: int):
+    with _CacheSize(cache_size):
+        _bench_bound_methods(cache_size)
+
+
+def _bench_bound_methods(cache_size: int):
+    cls = _make_class()
+    names = ['m%d' % i for i in range(METHOD_COUNT)]
+
+    gc.collect()
+    gc.disable()
+
+    try:
+        tracemalloc.start()
+        objects = [new_object(cls) for _ in range(OBJECT_COUNT)]
+        for o in objects:
+            for name in names:
+                object_getattr(o, name)
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        # objects freed without the cyclic gc
+        refs = [ref(o) for o in objects]
+        del objects, o
+        freed = sum(r() is None for r in refs)
+    finally:
+        gc.enable()
+
+    o = new_object(cls)
+    start = perf_counter()
+    for _ in range(CALL_COUNT):
+        object_getattr(o, 'm0')
+    t = perf_counter() - start
+
+    print('cache size %3d: %8.0f bytes/object  %4d/%d freed without gc  '
+          '%6.0f ns/lookup' % (cache_size, size / OBJECT_COUNT, freed,
+                               OBJECT_COUNT, t / CALL_COUNT * 1e9))
+
+
+def test_bound_method_memory():
+    print('%d objects, %d methods of each are looked up' %
+          (OBJECT_COUNT, METHOD_COUNT))
+
+    for size in (METHOD_COUNT, 8, 0):
+        bench_bound_methods(size)
+
+
+def test():
+    test_bound_method_cache_hit()
+    test_bound_method_cache_eviction()
+    test_bound_method_cache_weakref()
+    test_bound_method_memory()
+
+
+if __name__ == '__main__':
+    test()
@@ -0,0 +1,22 @@
+# helpers shared by the tests in this directory
+
+
+def expect(exc_type, func, *args):
+    """
+    call func(*args), raise AssertionError if it does not raise exc_type
+    """
+    try:
+        func(*args)
+    except exc_type:
+        return
+    raise AssertionError('%s not raised' % exc_type.__name__)
+
+
+def run_tests(namespace: dict):
+    """
+    call every test_* function of a test module, in order of definition
+    """
+    for k, v in list(namespace.items()):
+        if k.startswith('test_'):
+            v()
+            print('%s ok' % k)
@@ -0,0 +1,61 @@
+from time import perf_counter
+
+import ail.py_runtime
+
+from ail.core.aobjects import convert_to_ail_object
+from ail.py_runtime.objects import convert_object, convert_to_ail_object_pyc
+
+
+N = 100000
+REPEAT = 20
+
+AIL_ARRAY = convert_to_ail_object(list(range(N)))
+
+
+def copy_convert(obj):
+    # how arrays were converted before AILArrayView
+    return [convert_object(o) for o in obj['__value__']]
+
+
+def bench(name, func):
+    start = perf_counter()
+    for _ in range(REPEAT):
+        func()
+    t = (perf_counter() - start) / REPEAT
+    print('%-36s %10.3f ms' % (name, t * 1000))
+
+
+def pass_view():
+    # an array goes to python code and comes back
+    convert_to_ail_object_pyc(convert_object(AIL_ARRAY))
+
+
+def pass_copy():
+    convert_to_ail_object_pyc(copy_convert(AIL_ARRAY))
+
+
+def index_view():
+    convert_object(AIL_ARRAY)[N // 2]
+
+
+def index_copy():
+    copy_convert(AIL_ARRAY)[N // 2]
+
+
+def sum_view():
+    sum(convert_object(AIL_ARRAY))
+
+
+def sum_copy():
+    sum(copy_convert(AIL_ARRAY))
+
+
+if __name__ == '__main__':
+    print('pass an array of %d elements through the API boundary' % N)
+
+    bench('round trip (view)', pass_view)
+    bench('round trip (copy)', pass_copy)
+    bench('index one element (view)', index_view)
+    bench('index one element (copy)', index_copy)
+    bench('sum all elements (view)', sum_view)
+    bench('sum all elements (copy)', sum_copy)
@@ -0,0 +1,58 @@
+from time import perf_counter
+
+import ail.py_runtime
+
+from ail.core.aobjects import convert_to_ail_object
+from ail.objects.class_object import (
+    class_setattr, new_class, new_object, object_getattr
+)
+
+
+N = 100000
+
+
+def hello(self):
+    return 'hello'
+
+
+def hi(self):
+    return 'hi'
+
+
+def make_hierarchy(depth: int):
+    cls = new_class('C0', [], {'hello': convert_to_ail_object(hello)})
+    root = cls
+
+    for i in range(1, depth):
+        cls = new_class('C%d' % i, [cls], {})
+
+    return root, cls
+
+
+def bench(name, obj, attr):
+    start = perf_counter()
+    for _ in range(N):
+        object_getattr(obj, attr)
+    t = perf_counter() - start
+    print('%-36s %8.1f ns/lookup' % (name, t / N * 1e9))
+
+
+if __name__ == '__main__':
+    print('look up attributes of legacy class objects')
+
+    for depth in (1, 10, 100):
+        root, leaf = make_hierarchy(depth)
+        obj = new_object(leaf)
+
+        bench('method of base, depth %d' % depth, obj, 'hello')
+        bench('missing attribute, depth %d' % depth, obj, 'bye')
+
+    # changing a base class is seen by the objects of subclasses
+    root, leaf = make_hierarchy(10)
+    obj = new_object(leaf)
+    m = object_getattr(obj, 'hello')
+
+    class_setattr(root, 'hello', convert_to_ail_object(hi))
+    assert object_getattr(obj, 'hello')['__pyfunction__'] is hi
+    assert object_getattr(obj, 'hello') is object_getattr(obj, 'hello')
+    assert m['__pyfunction__'] is hello
@@ -0,0 +1,88 @@
+import os
+import tempfile
+
+from time import perf_counter
+
+import ail.py_runtime
+
+from ail.modules.fileio import _read_all, _readinto
+
+
+SIZE = 256 * 1024 * 1024
+SMALL_SIZE = 2 * 1024 * 1024
+
+
+def bench(name, path, func):
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        start = perf_counter()
+        n = func(fd)
+        t = perf_counter() - start
+    finally:
+        os.close(fd)
+
+    print('%-28s %8.1f ms  %8.1f MB/s' % (
+        name, t * 1000, n / t / 1024 / 1024))
+
+
+def old_read_all(fd):
+    # the readAll() before, 1024 bytes a block
+    b = os.read(fd, 1024)
+    total_b = b
+
+    while b:
+        b = os.read(fd, 1024)
+        total_b += b
+
+    return len(total_b)
+
+
+def read_all(fd):
+    return len(_read_all(fd, 1024))
+
+
+def read_into(fd):
+    buf = bytearray(1024 * 1024)
+    view = memoryview(buf)
+    total = 0
+
+    r = _readinto(fd, view)
+    while r:
+        total += r
+        r = _readinto(fd, view)
+
+    return total
+
+
+def python_read(fd):
+    with open(fd, 'rb', closefd=False) as f:
+        return len(f.read())
+
+
+def _make_file(size: int) -> str:
+    fd, path = tempfile.mkstemp()
+    block = os.urandom(1024 * 1024)
+
+    with open(fd, 'wb') as f:
+        for _ in range(size // len(block)):
+            f.write(block)
+
+    return path
+
+
+if __name__ == '__main__':
+    small = _make_file(SMALL_SIZE)
+    big = _make_file(SIZE)
+
+    try:
+        print('%d MB file' % (SMALL_SIZE >> 20))
+        bench('old readAll', small, old_read_all)
+        bench('readAll', small, read_all)
+
+        print('%d MB file' % (SIZE >> 20))
+        bench('readAll', big, read_all)
+        bench('readInto, 1 MB buffer', big, read_into)
+        bench('open().read()', big, python_read)
+    finally:
+        os.remove(small)
+        os.remove(big)
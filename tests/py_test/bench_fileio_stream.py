@@ -0,0 +1,98 @@
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+
+from time import perf_counter
+
+
+# the size of the file read by lines() and chunks(), it's 'multi-GB', pass
+# the size in MB as the first argument to try a smaller one
+SIZE = 4096 * 1024 * 1024
+READ_ALL_SIZE = 256 * 1024 * 1024
+LINE = b'x' * 1023 + b'\n'
+
+_SCRIPT_LINES = '''
+import 'fileio'
+f = fileio.FileIO(%r, 'r')
+n = 0
+for (it = f.lines(), ln = next(it, null); ln != null; ln = next(it, null)) {
+    n = n + 1
+}
+print n, 'lines'
+'''
+
+_SCRIPT_CHUNKS = '''
+import 'fileio'
+f = fileio.FileIO(%r, 'r')
+n = 0
+for (it = f.chunks(1048576), b = next(it, null); b != null; b = next(it, null)) {
+    n = n + len(b)
+}
+print n, 'bytes'
+'''
+
+_SCRIPT_READ_ALL = '''
+import 'fileio'
+f = fileio.FileIO(%r, 'r')
+print len(f.readAll().split(bytes('\\n', 'ascii'))), 'pieces'
+'''
+
+
+def run(name, script, path, size):
+    fd, script_path = tempfile.mkstemp(suffix='.ail')
+    with open(fd, 'w') as f:
+        f.write(script % path)
+
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [os.path.dirname(os.path.dirname(os.path.dirname(
+            os.path.abspath(__file__))))] + sys.path)
+
+    try:
+        start = perf_counter()
+        out = subprocess.run([sys.executable, '-m', 'ail', script_path],
+                             stdout=subprocess.PIPE, env=env, check=True)
+        t = perf_counter() - start
+    finally:
+        os.remove(script_path)
+
+    # ru_maxrss is the peak of the biggest child so far, in KB on Linux
+    rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+
+    print('%-20s %6d MB  %8.1f s  %8.1f MB/s  max RSS %6d MB  %s' % (
+        name, size >> 20, t, size / t / 1024 / 1024, rss >> 10,
+        out.stdout.decode().strip()))
+
+
+def _make_file(size: int) -> str:
+    fd, path = tempfile.mkstemp()
+    block = LINE * 1024
+
+    with open(fd, 'wb') as f:
+        for _ in range(size // len(block)):
+            f.write(block)
+
+    return path
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        SIZE = int(sys.argv[1]) * 1024 * 1024
+
+    path = _make_file(SIZE)
+
+    try:
+        # the streaming ones first, the max RSS of children only grows
+        run('chunks(1 MB)', _SCRIPT_CHUNKS, path, SIZE)
+        run('lines()', _SCRIPT_LINES, path, SIZE)
+    finally:
+        os.remove(path)
+
+    path = _make_file(READ_ALL_SIZE)
+
+    try:
+        run('readAll() + split', _SCRIPT_READ_ALL, path, READ_ALL_SIZE)
+    finally:
+        os.remove(path)
@@ -0,0 +1,45 @@
+from time import perf_counter
+
+import ail.py_runtime
+
+from ail.core.aobjects import convert_to_ail_object
+from ail.objects.integer import INTEGER_POOL
+from ail.objects.string import STRING_INTERN_TABLE
+
+
+N = 200000
+
+
+def bench(name, func, pool):
+    pool.reset_stats()
+
+    start = perf_counter()
+    func()
+    t = perf_counter() - start
+
+    print('%-32s %8.1f ns/op  hit rate %5.1f%%' % (
+        name, t / N * 1e9, pool.hit_rate * 100))
+
+
+def add_counter():
+    # a loop counter going past the initial range of the pool
+    one = convert_to_ail_object(1)
+    i = convert_to_ail_object(0)
+    add = i['__add__']
+    for _ in range(N):
+        i = add(convert_to_ail_object(_ % 2000), one)
+
+
+def convert_words():
+    words = ['key%d' % (i % 100) for i in range(N)]
+    for w in words:
+        convert_to_ail_object(w)
+
+
+if __name__ == '__main__':
+    print(INTEGER_POOL.stats())
+    bench('integer add, 0..2000', add_counter, INTEGER_POOL)
+    bench('integer add, 0..2000 (again)', add_counter, INTEGER_POOL)
+    print(INTEGER_POOL.stats())
+
+    bench('convert 100 short strings', convert_words, STRING_INTERN_TABLE)
@@ -0,0 +1,49 @@
+from time import perf_counter
+
+import ail.py_runtime
+
+from ail.modules.map import hash_map
+
+
+N = 200000
+KEYS = ['key%d' % i for i in range(1000)]
+
+
+def bench(name, func):
+    start = perf_counter()
+    func()
+    t = perf_counter() - start
+    print('%-24s %8.1f ns/op' % (name, t / N * 1e9))
+
+
+def dict_put_get():
+    d = {}
+    keys = KEYS
+    for i in range(N):
+        k = keys[i % 1000]
+        d[k] = i
+        d.get(k)
+
+
+def map_put_get():
+    m = hash_map()
+    keys = KEYS
+    for i in range(N):
+        k = keys[i % 1000]
+        m.put(k, i)
+        m.get(k)
+
+
+def map_update():
+    m = hash_map()
+    items = {k: i for i, k in enumerate(KEYS)}
+    for _ in range(N // 1000):
+        m.update(items)
+
+
+if __name__ == '__main__':
+    print('%d put and get of 1000 keys' % N)
+
+    bench('dict', dict_put_get)
+    bench('map.put / map.get', map_put_get)
+    bench('map.update (per key)', map_update)
@@ -0,0 +1,79 @@
+import os
+import tempfile
+
+from time import perf_counter
+
+import ail.py_runtime
+
+from ail.modules.mmap import MappedFile
+
+
+SIZE = 128 * 1024 * 1024
+LINE = b'2020-07-07 12:00:00 INFO request served in 12 ms\n'
+NEEDLE = b'ERROR'
+
+
+def bench(name, func, path):
+    start = perf_counter()
+    n = func(path)
+    t = perf_counter() - start
+    print('%-28s %8.1f ms  %8.1f MB/s  -> %d' % (
+        name, t * 1000, SIZE / t / 1024 / 1024, n))
+
+
+def count_lines_open(path):
+    with open(path, 'rb') as f:
+        return sum(1 for _ in f)
+
+
+def count_lines_mmap(path):
+    m = MappedFile(path)
+    n = sum(1 for _ in m.lines())
+    m.close()
+    return n
+
+
+def find_read(path):
+    # read the file in chunks and search each of them
+    with open(path, 'rb') as f:
+        pos = 0
+        chunk = f.read(1 << 20)
+        while chunk:
+            i = chunk.find(NEEDLE)
+            if i >= 0:
+                return pos + i
+            pos += len(chunk)
+            chunk = f.read(1 << 20)
+    return -1
+
+
+def find_mmap(path):
+    m = MappedFile(path)
+    i = m.find(NEEDLE)
+    m.close()
+    return i
+
+
+def _make_file() -> str:
+    fd, path = tempfile.mkstemp()
+    block = LINE * ((1 << 20) // len(LINE))
+
+    with open(fd, 'wb') as f:
+        for _ in range(SIZE // len(block)):
+            f.write(block)
+        f.write(NEEDLE)
+
+    return path
+
+
+if __name__ == '__main__':
+    path = _make_file()
+
+    try:
+        print('%d MB log file' % (SIZE >> 20))
+        bench('lines, open()', count_lines_open, path)
+        bench('lines, MappedFile', count_lines_mmap, path)
+        bench('find, read 1 MB chunks', find_read, path)
+        bench('find, MappedFile', find_mmap, path)
+    finally:
+        os.remove(path)
@@ -0,0 +1,39 @@
+import tracemalloc
+
+from time import perf_counter
+
+import ail.py_runtime
+
+from ail.core.aobjects import ObjectCreater
+from ail.objects.array import ARRAY_TYPE
+from ail.objects.integer import INTEGER_TYPE
+from ail.objects.string import STRING_TYPE
+
+
+N = 100000
+
+
+def bench(name, obj_type, value):
+    new_object = ObjectCreater.new_object
+
+    start = perf_counter()
+    for _ in range(N):
+        new_object(obj_type, value)
+    t = perf_counter() - start
+
+    tracemalloc.start()
+    objects = [new_object(obj_type, value) for _ in range(N)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+
+    print('%-10s %8.1f ns/object  %8.1f bytes/object' % (
+        name, t / N * 1e9, size / N))
+
+
+if __name__ == '__main__':
+    print('create %d legacy AIL objects' % N)
+
+    bench('integer', INTEGER_TYPE, 1 << 40)
+    bench('string', STRING_TYPE, 'ail')
+    bench('array', ARRAY_TYPE, [])
@@ -0,0 +1,40 @@
+import tracemalloc
+
+from time import perf_counter
+
+import ail.py_runtime
+
+from ail.core.aobjects import convert_to_ail_object
+from ail.objects.array import convert_to_array
+from ail.modules.utils import func_range
+
+
+N = 1000000
+
+
+def bench(name, func):
+    tracemalloc.start()
+    start = perf_counter()
+    r = func()
+    t = perf_counter() - start
+    size = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print('%-24s %8.1f ms  peak %10d bytes  len %d' % (
+        name, t * 1000, size, len(r)))
+
+
+def eager_range():
+    # what utils.range returned before, an array of every integer
+    return convert_to_array(list(range(N)))['__value__']
+
+
+def lazy_range():
+    return func_range(0, N)
+
+
+if __name__ == '__main__':
+    print('range(0, %d)' % N)
+
+    bench('lazy range', lazy_range)
+    bench('eager array', eager_range)
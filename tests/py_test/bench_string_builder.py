@@ -0,0 +1,47 @@
+from time import perf_counter
+
+import ail.py_runtime
+
+from ail.core.aobjects import convert_to_ail_object
+from ail.modules.strings import StringBuilder, string_t
+
+
+N = 20000
+LINE = 'item %d: ok, total so far is fine\n'
+
+
+def bench(name, func):
+    start = perf_counter()
+    s = func()
+    t = perf_counter() - start
+    print('%-32s %8.1f ms  %d chars' % (name, t * 1000, len(s)))
+
+
+def concat_ail_string():
+    # how report code built strings on the legacy string objects
+    s = convert_to_ail_object('')
+    for i in range(N):
+        s = s['__add__'](s, convert_to_ail_object(LINE % i))
+    return s['__value__']
+
+
+def concat_string_t():
+    s = string_t()
+    for i in range(N):
+        s.append(LINE % i)
+    return str(s)
+
+
+def string_builder():
+    sb = StringBuilder()
+    for i in range(N):
+        sb.append(LINE % i)
+    return sb.toString()
+
+
+if __name__ == '__main__':
+    print('build a report of %d lines' % N)
+
+    bench('AIL string +', concat_ail_string)
+    bench('string_t.append', concat_string_t)
+    bench('StringBuilder.append', string_builder)
@@ -0,0 +1,45 @@
+from time import perf_counter
+
+from ail.py_runtime.functions import make_struct, new_struct_object
+
+
+N = 1000000
+
+Point = make_struct('Point', ['x', 'y', '__tag'], ['y'])
+
+
+def bench(name, func):
+    start = perf_counter()
+    func()
+    t = perf_counter() - start
+    print('%-24s %8.3f s  %8.1f ns/object' % (name, t, t / N * 1e9))
+
+
+def new_empty():
+    for _ in range(N):
+        new_struct_object(Point)
+
+
+def new_positional():
+    for i in range(N):
+        new_struct_object(Point, [i, i, None])
+
+
+def new_keyword():
+    for i in range(N):
+        new_struct_object(Point, {'x': i, 'y': i})
+
+
+def new_direct():
+    new = Point.__ail_new__
+    for i in range(N):
+        new(i, i)
+
+
+if __name__ == '__main__':
+    print('create %d struct objects' % N)
+
+    bench('new(Point)', new_empty)
+    bench('new(Point, [...])', new_positional)
+    bench('new(Point, {...})', new_keyword)
+    bench('Point.__ail_new__(...)', new_direct)
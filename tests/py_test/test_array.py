@@ -0,0 +1,85 @@
+from ail.core.aobjects import convert_to_ail_object
+from ail.modules.array import list_
+from ail.py_runtime.objects import convert_object
+
+from _util import expect, run_tests
+
+
+def test_append():
+    a = list_()
+    assert a.size == 0 and a.toString() == '[]'
+
+    for i in range(3):
+        assert a.append(i) is True
+    assert a.size == len(a) == 3
+    assert a.toString() == '[0, 1, 2]'
+
+    # size is read-only, as the protected member of the old struct
+    expect(AttributeError, setattr, a, 'size', 0)
+
+
+def test_remove():
+    a = list_([0, 1, 2, 3])
+
+    assert a.remove(1) is True
+    assert a.remove(-1) is True
+    assert a.toArray() == [0, 2]
+
+    # the old module returned false instead of raising
+    assert a.remove(2) is False
+    assert a.remove(-3) is False
+    assert a.remove('0') is False
+    assert a.toArray() == [0, 2]
+
+
+def test_insert_pop():
+    a = list_([1, 3])
+
+    assert a.insert(1, 2) is True
+    assert a.insert(0, 0) is True
+    assert a.insert(1.0, 0) is False
+    assert a.toArray() == [0, 1, 2, 3]
+
+    assert a.pop() == 3
+    assert a.pop(0) == 0
+    assert a.toArray() == [1, 2]
+    expect(IndexError, list_().pop)
+
+
+def test_extend():
+    a = list_([0])
+    a.extend([1, 2])
+    a.extend(list_([3]))
+    a.extend(range(4, 6))
+
+    # an array got from an AIL object
+    a.extend(convert_object(convert_to_ail_object([6, 7])))
+    assert a.toArray() == list(range(8))
+
+    a.extend(a)
+    assert a.size == 16
+
+
+def test_access():
+    a = list_('abc')
+
+    assert a.get(0) == a[0] == 'a'
+    assert a[-1] == 'c'
+    assert a[1:] == ['b', 'c']
+
+    a.set(0, 'x')
+    a[1] = 'y'
+    assert list(a) == ['x', 'y', 'c']
+    expect(IndexError, a.get, 3)
+    expect(IndexError, a.set, 3, 'z')
+
+    # toArray() copies
+    a.toArray().append('d')
+    assert a.size == 3
+
+    a.clear()
+    assert a.size == 0 and list(a) == []
+
+
+if __name__ == '__main__':
+    run_tests(globals())
@@ -0,0 +1,158 @@
+import builtins
+
+from ail.py_runtime import AIL_PY_GLOBAL
+from ail.py_runtime import abuiltins as native
+from ail.py_runtime.functions import bind_function, make_struct, new_struct_object
+from ail.py_runtime.objects import convert_object
+
+from ail.core import abuiltins as legacy
+from ail.core.aobjects import convert_to_ail_object
+from ail.core.error import AILRuntimeError
+
+from _util import run_tests
+
+
+def call_legacy(func, *args):
+    # convert an object once, equal() compares the identities
+    objects = dict()
+    r = func(*[objects.setdefault(id(a), convert_to_ail_object(a))
+               for a in args])
+    if isinstance(r, AILRuntimeError):
+        return r.err_type
+    return to_python(convert_object(r))
+
+
+def call_native(func, *args):
+    try:
+        return to_python(func(*args))
+    except (TypeError, ValueError) as e:
+        return type(e).__name__
+
+
+def to_python(v):
+    if isinstance(v, list) or type(v).__name__ == 'AILArrayView':
+        return [to_python(x) for x in v]
+    elif type(v).__name__ == 'AILObjectWrapper':
+        return {to_python(k): to_python(x)
+                for k, x in v.__ail_object__['__value__'].items()}
+    return v
+
+
+def check(name, *args):
+    a = call_legacy(getattr(legacy, 'func_' + name), *args)
+    b = call_native(getattr(native, 'func_' + name), *args)
+    assert a == b, '%s%s: legacy %r, native %r' % (name, args, a, b)
+
+
+def test_registered():
+    for name, func in native.NATIVE_BUILTINS.items():
+        assert AIL_PY_GLOBAL[name] is func, name
+
+
+def test_array():
+    check('array', 0)
+    check('array', 3)
+    check('array', 3, 1)
+    check('array', 2, 'ail')
+    check('array', 2, [1, 2])
+    check('array', 'x')
+    check('array', 1.5)
+
+
+def test_map():
+    check('map')
+    check('map', 1)
+    check('map', 1, 2)
+
+    # the legacy version only accepts python lists, which are never passed
+    # to it by AILObjectWrapper
+    assert native.func_map([]) == {}
+    assert native.func_map([[1, 2], ['a', 'b']]) == {1: 2, 'a': 'b'}
+    assert native.func_map([[1, 2], [1, 3]]) == {1: 3}
+    assert native.func_map(convert_object(
+        convert_to_ail_object([[1, 2]]))) == {1: 2}
+    assert call_native(native.func_map, [[1, 2, 3]]) == 'ValueError'
+    assert call_native(native.func_map, [1]) == 'ValueError'
+
+
+def test_equal():
+    l = [1]
+    check('equal', l, l)
+    check('equal', [1], [1])
+    check('equal', 'a', 1)
+
+
+def test_equal_type():
+    check('equal_type', 1, 2)
+    check('equal_type', 1, 2.0)
+    check('equal_type', 'a', 'b')
+    check('equal_type', [], [1])
+    check('equal_type', [], 'a')
+
+
+def test_doc():
+    check('doc', 1)
+    check('doc', 'a')
+    check('doc', [])
+
+    # the docs of builtins are kept
+    for name, func in native.NATIVE_BUILTINS.items():
+        assert func.__doc__ == getattr(legacy, 'func_' + name).__doc__, name
+        assert native.func_doc(func) == func.__doc__
+
+    assert native.func_doc(AIL_PY_GLOBAL['hash']) == legacy.func_doc(
+        legacy.BUILTINS['hash'])
+
+
+def test_int_input():
+    input_ = builtins.input
+
+    for line in ('12', ' -3 ', 'x', '1.5'):
+        builtins.input = lambda _: line
+        try:
+            a = legacy.func_int_input('')
+            a = a.err_type if isinstance(a, AILRuntimeError) else a
+            b = call_native(native.func_int_input, '')
+        finally:
+            builtins.input = input_
+        assert a == b, '%r: legacy %r, native %r' % (line, a, b)
+
+
+def test_isimplement():
+    # the legacy version does not work on the struct types of python
+    # compatible mode, the cases follow its rules of members.
+    def hello(self):
+        return self
+
+    a = make_struct('A', ['x', 'y'], [])
+    b = make_struct('B', ['x'], [])
+    c = make_struct('C', ['z'], [])
+    bind_function('hello', a)(hello)
+
+    assert native.func_isimplement(a, b)
+    assert native.func_isimplement(new_struct_object(a), b)
+    assert not native.func_isimplement(a, c)
+    assert not native.func_isimplement(b, a)
+    assert not native.func_isimplement(a, b, c)
+
+    d = make_struct('D', ['__x', 'hello'], [])
+    assert native.func_isimplement(a, d)  # private members are skipped
+
+    for args in ((a,), (1, b), (a, 1)):
+        assert call_native(native.func_isimplement, *args) in (
+            'TypeError', 'ValueError')
+
+
+def test_show_struct():
+    point = make_struct('Point', ['x', 'y', '__tag'], ['y'])
+    p = new_struct_object(point, [1, 'a', None])
+
+    assert native.func_show_struct(p) == \
+        '%s\n{\n\tx : 1\n\ty : a\n}' % p
+    assert native.func_show_struct(point) == \
+        '<struct \'Point\'>\n{\n\tx : None\n\ty : None\n}'
+    assert call_native(native.func_show_struct, 1) == 'TypeError'
+
+
+if __name__ == '__main__':
+    run_tests(globals())
@@ -0,0 +1,65 @@
+import ail.py_runtime
+
+from ail.core.aobjects import convert_to_ail_object, unpack_ailobj
+from ail.objects.class_object import (
+    class_getattr_with_default, class_setattr,
+    new_class, new_object, object_getattr
+)
+from ail.objects.super_object import get_super
+
+from _util import run_tests
+
+
+def hello(self):
+    return 'hello'
+
+
+def hi(self):
+    return 'hi'
+
+
+def make_hierarchy():
+    base = new_class('Base', [], {
+        'hello': convert_to_ail_object(hello),
+        'x': convert_to_ail_object(1),
+    })
+    derived = new_class('Derived', [base], {})
+    return base, derived
+
+
+def call_method(obj, name):
+    m = object_getattr(obj, name)
+    return unpack_ailobj(m['__pyfunction__'](m['__self__']))
+
+
+def test_class_setattr_invalidates_subclasses():
+    base, derived = make_hierarchy()
+    o = new_object(derived)
+
+    assert call_method(o, 'hello') == 'hello'
+    tag = derived['__version_tag__']
+
+    class_setattr(base, 'hello', convert_to_ail_object(hi))
+
+    assert derived['__version_tag__'] != tag
+    assert call_method(o, 'hello') == 'hi'
+
+
+def test_super_setattr_invalidates():
+    base, derived = make_hierarchy()
+    o = new_object(derived)
+
+    # fill the caches of both classes
+    assert unpack_ailobj(class_getattr_with_default(derived, 'x')) == 1
+    assert unpack_ailobj(class_getattr_with_default(base, 'x')) == 1
+
+    sup = get_super(derived, o)
+    sup['__setattr__'](sup, 'x', 2)
+
+    assert unpack_ailobj(class_getattr_with_default(base, 'x')) == 2
+    assert unpack_ailobj(class_getattr_with_default(derived, 'x')) == 2
+    assert unpack_ailobj(object_getattr(o, 'x')) == 2
+
+
+if __name__ == '__main__':
+    run_tests(globals())
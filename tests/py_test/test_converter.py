@@ -0,0 +1,23 @@
+from ail.core.pyexec import compile_ail_source
+from ail.py_runtime import AIL_PY_GLOBAL
+
+from _util import run_tests
+
+
+def run(source: str) -> dict:
+    namespace = dict(AIL_PY_GLOBAL)
+    code, _ = compile_ail_source(source, '<test>')
+    exec(code, namespace)
+    return namespace
+
+
+def test_bool_constants():
+    ns = run('t = true\nf = false\nn = not false\n')
+
+    assert ns['t'] is True
+    assert ns['f'] is False
+    assert ns['n'] is True
+
+
+if __name__ == '__main__':
+    run_tests(globals())
@@ -0,0 +1,215 @@
+import os
+import subprocess
+import sys
+import tempfile
+
+from ail.modules.fileio import (
+    _fileio_readlines, _iter_chunks, _iter_decoded, _read_all
+)
+from ail.modules.strings import lines as split_lines
+
+from _util import expect, run_tests
+
+
+TEXT = 'first\n中文 line\n\nlast without end'
+
+
+class _File:
+    # the fields of a FileIO object used by its methods
+    def __init__(self, path: str):
+        self._file_object_fd = os.open(path, os.O_RDONLY)
+        self._file_readable = True
+
+    def close(self):
+        os.close(self._file_object_fd)
+        self._file_object_fd = -1
+
+
+def _make_file(data: bytes) -> str:
+    fd, path = tempfile.mkstemp()
+    with open(fd, 'wb') as f:
+        f.write(data)
+    return path
+
+
+def _with_file(data: bytes, func):
+    path = _make_file(data)
+    f = _File(path)
+    try:
+        func(f)
+    finally:
+        if f._file_object_fd >= 0:
+            f.close()
+        os.remove(path)
+
+
+def test_read_all():
+    data = bytes(range(256)) * 100
+
+    def check(f):
+        fd = f._file_object_fd
+        b = _read_all(fd, 1024)
+        assert type(b) is bytes and b == data
+        assert _read_all(fd, 1024) == b''
+
+        os.lseek(fd, 1000, os.SEEK_SET)
+        assert _read_all(fd, 7) == data[1000:]
+
+        # the result can be a key, as bytes from the old readAll()
+        assert {b: 1}[data] == 1
+
+    def check_empty(f):
+        assert _read_all(f._file_object_fd, 4) == b''
+
+    _with_file(data, check)
+    _with_file(b'', check_empty)
+
+
+def test_read_all_pipe():
+    # a pipe has no size, it's read by blocks
+    data = os.urandom(10000)
+    r, w = os.pipe()
+
+    try:
+        os.write(w, data)
+        os.close(w)
+        w = -1
+
+        b = _read_all(r, 7)
+        assert type(b) is bytes and b == data
+    finally:
+        os.close(r)
+        if w >= 0:
+            os.close(w)
+
+
+def test_read_lines():
+    def check(f):
+        lines = _fileio_readlines(f)
+        assert lines == [b'a\n', b'b\r\n', b'\rc\n', b'd']
+        assert all(type(ln) is bytes for ln in lines)
+
+    _with_file(b'a\nb\r\n\rc\nd', check)
+
+
+def test_chunks():
+    def check(f):
+        assert list(_iter_chunks(f, 4)) == [b'0123', b'4567', b'89']
+
+    def check_empty(f):
+        assert list(_iter_chunks(f, 4)) == []
+
+    _with_file(b'0123456789', check)
+    _with_file(b'', check_empty)
+
+
+def test_chunks_closed():
+    def check(f):
+        it = _iter_chunks(f, 2)
+        assert next(it) == b'ab'
+        f.close()
+        expect(OSError, next, it)
+
+    _with_file(b'abcd', check)
+
+
+def test_decode_across_chunks():
+    data = TEXT.encode('UTF-8')
+
+    # every chunk size cuts some multi-byte character
+    for size in range(1, 8):
+        def check(f):
+            chunks = list(_iter_decoded(f, 'UTF-8', size))
+            assert ''.join(chunks) == TEXT
+            assert all(chunks)
+
+        _with_file(data, check)
+
+    def check_broken(f):
+        expect(UnicodeDecodeError, list, _iter_decoded(f, 'UTF-8', 2))
+
+    _with_file(data[:-len('end') - 1] + b'\xe4', check_broken)
+
+
+def test_lines_across_chunks():
+    data = TEXT.encode('UTF-8')
+
+    for size in (1, 3, 5, 64):
+        def check(f):
+            assert list(split_lines(_iter_decoded(f, 'UTF-8', size))) == \
+                TEXT.split('\n')
+
+        _with_file(data, check)
+
+    def check_utf16(f):
+        assert list(split_lines(_iter_decoded(f, 'UTF-16', 3))) == \
+            TEXT.split('\n')
+
+    _with_file(TEXT.encode('UTF-16'), check_utf16)
+
+
+_SCRIPT = '''
+import 'fileio'
+f = fileio.FileIO(%r, 'r')
+
+for (it = f.lines('UTF-8', 3), ln = next(it, null); ln != null; ln = next(it, null)) {
+    print 'line', ln
+}
+
+f.seek(0)
+n = 0
+for (it = f.chunks(4), b = next(it, null); b != null; b = next(it, null)) {
+    n = n + len(b)
+}
+print 'bytes', n
+
+try {
+    f.chunks(0)
+} catch e {
+    print e
+}
+
+try {
+    f.lines('no-such-encoding')
+} catch e {
+    print e
+}
+'''
+
+
+def _run_ail(source: str) -> str:
+    fd, script_path = tempfile.mkstemp(suffix='.ail')
+    with open(fd, 'w', encoding='UTF-8') as f:
+        f.write(source)
+
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [os.path.dirname(os.path.dirname(os.path.dirname(
+            os.path.abspath(__file__))))] + sys.path)
+    env['PYTHONIOENCODING'] = 'UTF-8'
+
+    try:
+        return subprocess.run(
+            [sys.executable, '-m', 'ail', script_path],
+            stdout=subprocess.PIPE, env=env, check=True).stdout.decode('UTF-8')
+    finally:
+        os.remove(script_path)
+
+
+def test_fileio_object():
+    data = TEXT.encode('UTF-8')
+    path = _make_file(data)
+
+    try:
+        out = _run_ail(_SCRIPT % path).splitlines()
+    finally:
+        os.remove(path)
+
+    assert out[:-2] == ['line ' + ln for ln in TEXT.split('\n')] + [
+        'bytes %d' % len(data)], out
+    assert out[-2].startswith('TypeError'), out
+    assert out[-1].startswith('LookupError'), out
+
+
+if __name__ == '__main__':
+    run_tests(globals())
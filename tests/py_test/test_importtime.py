@@ -0,0 +1,130 @@
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from contextlib import redirect_stdout
+
+import ail.ail_main  # sets the module search paths
+
+from ail.core import aimporttime, pyexec
+from ail.core.aloader import ModuleLoader
+from ail.py_runtime.objects import AILImporter
+
+from _util import run_tests
+
+
+# main imports a, a imports b, the second import of b is not an import
+_TREE = {
+    'main.ail': 'import "a"\nimport "b"\nprint a.x\n',
+    'a.ail': 'import "b"\nx = b.y + 1\n',
+    'b.ail': 'y = 2\n',
+}
+
+_MODULE_PHASES = {'search', 'lex', 'parse', 'convert', 'compile', 'exec'}
+
+
+class _Tree:
+    def __enter__(self) -> str:
+        self.__cwd = os.getcwd()
+        self.__dir = os.path.realpath(tempfile.mkdtemp())
+
+        for name, source in _TREE.items():
+            with open(os.path.join(self.__dir, name), 'w') as f:
+                f.write(source)
+
+        os.chdir(self.__dir)
+        return self.__dir
+
+    def __exit__(self, *_):
+        os.chdir(self.__cwd)
+        shutil.rmtree(self.__dir)
+
+
+def test_profiler_tree():
+    import_module = AILImporter.import_module
+    load_namespace = ModuleLoader.load_namespace
+
+    try:
+        with _Tree() as d:
+            profiler = aimporttime.enable_import_profiler('main.ail')
+            assert aimporttime.enable_import_profiler('x') is profiler
+
+            with redirect_stdout(io.StringIO()):
+                pyexec.exec_as_python(
+                    _TREE['main.ail'], os.path.join(d, 'main.ail'), dict())
+            profiler.finish()
+    finally:
+        # the profiler is global, restore the importers for other tests
+        aimporttime._PROFILER = None
+        AILImporter.import_module = import_module
+        ModuleLoader.load_namespace = load_namespace
+
+    root = profiler.root
+    assert [c.name for c in root.children] == ['a']
+    a = root.children[0]
+    assert [c.name for c in a.children] == ['b']
+    b = a.children[0]
+    assert b.children == []
+
+    # the main module is not searched
+    assert set(root.phases) == _MODULE_PHASES - {'search'}
+    assert set(a.phases) == set(b.phases) == _MODULE_PHASES
+
+    assert a.child_time == b.cumulative
+    assert a.self_time == a.cumulative - b.cumulative
+    assert sum(a.phases.values()) <= a.self_time
+    assert root.cumulative >= a.cumulative >= b.cumulative
+
+    out = io.StringIO()
+    profiler.print_tree(out)
+    names = [ln.rsplit('|', 1)[1] for ln in out.getvalue().splitlines()]
+    assert names == [' imported module', ' main.ail', '   a', '     b'], names
+
+
+def _check_record(record: dict):
+    """
+    :return: names of the imports of record, as nested lists
+    """
+    children = record['imports']
+    phases = record['phases_us']
+
+    # each value is truncated to an integer on its own
+    slack = len(children) + 1
+    assert record['cumulative_us'] >= record['self_us'] >= 0
+    assert abs(record['self_us'] + sum(c['cumulative_us'] for c in children)
+               - record['cumulative_us']) <= slack, record
+    assert sum(phases.values()) <= record['self_us'] + len(phases), record
+
+    return [record['module'], [_check_record(c) for c in children]]
+
+
+def test_importtime_json():
+    with _Tree() as d:
+        json_path = os.path.join(d, 'importtime.json')
+
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(
+            [os.path.dirname(os.path.dirname(os.path.dirname(
+                os.path.abspath(__file__))))] + sys.path)
+
+        p = subprocess.run(
+            [sys.executable, '-m', 'ail',
+             '-X', 'importtime=%s' % json_path, 'main.ail'],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env,
+            check=True)
+        assert p.stdout == b'3\n'
+        assert p.stderr.decode().count('import time:') == 4
+
+        with open(json_path, encoding='UTF-8') as f:
+            root = json.load(f)
+
+    assert _check_record(root) == ['main.ail', [['a', [['b', []]]]]]
+    assert set(root['imports'][0]['phases_us']) == _MODULE_PHASES
+
+
+if __name__ == '__main__':
+    run_tests(globals())
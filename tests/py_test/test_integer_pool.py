@@ -0,0 +1,74 @@
+import sys
+
+from threading import Thread
+
+import ail.py_runtime
+
+from ail.objects.integer import IntegerPool
+
+from _util import run_tests
+
+
+def test_get():
+    pool = IntegerPool(-5, 10)
+
+    assert pool.get(3) is pool.get(3)
+    assert pool.get(3)['__value__'] == 3
+    assert pool.get(100) is not pool.get(100)
+    assert pool.get(100)['__value__'] == 100
+    assert pool.stats()['range'] == (-5, 10)
+
+
+def test_set_range_keeps_objects():
+    pool = IntegerPool(0, 10)
+    five = pool.get(5)
+
+    pool.set_range(-10, 20)
+    assert (pool.low, pool.high) == (-10, 20)
+    assert pool.get(5) is five
+    assert [pool.get(i)['__value__'] for i in range(-10, 20)] == \
+        list(range(-10, 20))
+
+
+def test_adaptive_growth():
+    pool = IntegerPool(0, 16, adaptive=True, limit=64)
+
+    for _ in range(2000):
+        pool.get(-3)
+
+    assert pool.low < 0
+    assert pool.get(-3)['__value__'] == -3
+    assert pool.high - pool.low <= 64
+
+
+def test_threads_see_consistent_range():
+    # the pool grows downward while other threads read it
+    pool = IntegerPool(0, 16, adaptive=True, limit=1 << 16)
+    errors = []
+
+    def worker():
+        for _ in range(300):
+            for n in range(-256, 16):
+                v = pool.get(n)['__value__']
+                if v != n:
+                    errors.append((n, v))
+
+    # switch threads as often as possible to hit the resize
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    try:
+        threads = [Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert not errors, errors[:5]
+    assert pool.low < 0
+
+
+if __name__ == '__main__':
+    run_tests(globals())
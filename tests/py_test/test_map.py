@@ -0,0 +1,100 @@
+from ail.modules.map import hash_map, map_
+from ail.modules.maptools import mapto, mapwith
+
+from _util import expect, run_tests
+
+
+def test_get_put():
+    m = map_()
+    assert type(m) is hash_map and m.size == 0
+
+    m.put('a', 1)
+    m['b'] = 2
+    assert m.get('a') == m['a'] == 1
+    assert m.get('c') is None
+    assert m.get('c', 0) == 0
+    assert m.size == len(m) == 2
+
+    expect(KeyError, m.__getitem__, 'c')
+    expect(TypeError, m.put, [], 1)
+
+
+def test_new_copies():
+    d = {'a': 1}
+    m = map_(d)
+    m.put('b', 2)
+    assert d == {'a': 1}
+
+    m2 = map_(m)
+    m2.put('c', 3)
+    assert 'c' not in m
+
+    assert map_([('a', 1), ('b', 2)]) == m
+
+
+def test_remove_contains():
+    m = map_({'a': 1, 'b': 2})
+
+    assert m.contains('a') and 'a' in m
+    assert m.remove('a') == 1
+    assert not m.contains('a')
+
+    assert m.remove('a', None) is None
+    expect(KeyError, m.remove, 'a')
+
+    del m['b']
+    assert m.size == 0
+
+
+def test_iteration():
+    m = map_({'a': 1, 'b': 2})
+
+    assert list(m) == list(m.keys()) == ['a', 'b']
+    assert list(m.values()) == [1, 2]
+    assert list(m.items()) == [('a', 1), ('b', 2)]
+
+
+def test_update_merge():
+    m = map_({'a': 1})
+
+    assert m.update({'b': 2}) is m
+    m.update(map_({'c': 3})).update([('d', 4)])
+    assert m.toDict() == {'a': 1, 'b': 2, 'c': 3, 'd': 4}
+
+    m = map_({'a': 1, 'b': 2})
+    merged = m.merge({'b': 10, 'c': 3})
+    assert merged.toDict() == {'a': 1, 'b': 10, 'c': 3}
+
+    merged = m.merge(map_({'b': 10}), lambda old, new: old + new)
+    assert merged.toDict() == {'a': 1, 'b': 12}
+
+    # merge() leaves both maps unchanged
+    assert m.toDict() == {'a': 1, 'b': 2}
+
+
+def test_setdefault_clear():
+    m = map_()
+
+    assert m.setdefault('a', []) == []
+    m.setdefault('a', []).append(1)
+    assert m['a'] == [1]
+
+    # toDict() copies
+    m.toDict().clear()
+    assert m.size == 1
+
+    m.clear()
+    assert m.size == 0
+    assert m == {} and m == map_()
+    expect(TypeError, hash, m)
+
+
+def test_maptools():
+    assert mapto(['a', 'bc'], len) == {'a': 1, 'bc': 2}
+    assert mapto([], len) == {}
+    assert mapwith(lambda x: x * 2, range(3)) == [0, 2, 4]
+    assert mapwith(str, map_({1: 0})) == ['1']
+
+
+if __name__ == '__main__':
+    run_tests(globals())
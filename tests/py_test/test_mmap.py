@@ -0,0 +1,173 @@
+import os
+import tempfile
+
+import ail.py_runtime
+
+from ail.modules import mmap as ail_mmap
+from ail.modules.mmap import MappedFile
+from ail.py_runtime.functions import make_struct, new_struct_object
+
+from _util import expect, run_tests
+
+
+def _write_file(data: bytes) -> str:
+    fd, path = tempfile.mkstemp()
+    with open(fd, 'wb') as f:
+        f.write(data)
+    return path
+
+
+def test_index_and_slice():
+    path = _write_file(b'hello world')
+
+    try:
+        m = MappedFile(path)
+        assert len(m) == m.size == 11
+        assert m[0] == ord('h')
+
+        view = m[6:]
+        assert isinstance(view, memoryview)
+        assert bytes(view) == b'world'
+        assert bytes(m.view(0, 5)) == b'hello'
+        assert bytes(m.view(6)) == b'world'
+
+        expect(TypeError, m.__setitem__, 0, ord('H'))  # read only
+
+        del view
+        m.close()
+        assert m.closed
+        expect(ValueError, len, m)
+    finally:
+        os.remove(path)
+
+
+def test_write():
+    path = _write_file(b'hello')
+
+    try:
+        m = MappedFile(path, 'c')
+        m[0] = ord('j')
+        assert bytes(m[:]) == b'jello'
+        m.close()
+
+        with open(path, 'rb') as f:
+            assert f.read() == b'hello'  # copy on write
+
+        m = MappedFile(path, 'r+')
+        m[0] = ord('j')
+        m.flush()
+        m.close()
+
+        with open(path, 'rb') as f:
+            assert f.read() == b'jello'
+    finally:
+        os.remove(path)
+
+
+def test_find():
+    path = _write_file(b'abc-abc-abc')
+
+    try:
+        m = MappedFile(path)
+        assert m.find(b'abc') == 0
+        assert m.find(b'abc', 1) == 4
+        assert m.find(b'abc', 1, 6) == -1
+        assert m.find(b'xyz') == -1
+        assert m.rfind(b'abc') == 8
+        m.close()
+    finally:
+        os.remove(path)
+
+
+def test_lines():
+    data = b'alpha\nbeta\n\ngamma'
+    path = _write_file(data)
+
+    try:
+        m = MappedFile(path)
+        assert list(m.lines()) == [b'alpha', b'beta', b'', b'gamma']
+        assert list(m.lines(True)) == [b'alpha\n', b'beta\n', b'\n', b'gamma']
+        assert b''.join(m) == data
+        m.close()
+    finally:
+        os.remove(path)
+
+
+def test_lines_across_window():
+    window = ail_mmap._LINES_WINDOW
+    long_line = b'x' * (window + 10)
+    data = b'a' * (window - 3) + b'\nbc\n' + long_line + b'\nend\n'
+    path = _write_file(data)
+
+    try:
+        m = MappedFile(path)
+        assert list(m.lines()) == data.split(b'\n')[:-1]
+        assert b''.join(m.lines(True)) == data
+        m.close()
+    finally:
+        os.remove(path)
+
+
+def test_empty_file():
+    path = _write_file(b'')
+
+    try:
+        m1 = MappedFile(path)
+        m2 = MappedFile(path)
+
+        m1.close()
+
+        # closing one empty mapping must not affect another
+        assert len(m2) == 0
+        assert list(m2.lines()) == []
+        assert m2.find(b'a') == -1
+        m2.close()
+    finally:
+        os.remove(path)
+
+
+def test_unpack():
+    rec = make_struct('Rec', ['id', 'score'], [], ['u32', 'f64'])
+    records = [new_struct_object(rec, [i, i / 2]) for i in range(3)]
+    path = _write_file(b''.join(r.pack() for r in records) + b'\0\0')
+
+    try:
+        m = MappedFile(path)
+
+        r = m.unpack(rec, rec.packed_size)
+        assert (r.id, r.score) == (1, 0.5)
+
+        assert [(r.id, r.score) for r in m.iterUnpack(rec)] == \
+            [(0, 0.0), (1, 0.5), (2, 1.0)]
+        assert [r.id for r in m.iterUnpack(rec, rec.packed_size, 1)] == [1]
+
+        untyped = make_struct('Untyped', ['a'], [])
+        expect(TypeError, m.unpack, untyped)
+
+        m.close()
+    finally:
+        os.remove(path)
+
+
+def test_close_with_view_alive():
+    path = _write_file(b'hello')
+
+    try:
+        m = MappedFile(path)
+        view = m.view(0, 2)
+
+        expect(BufferError, m.close)
+
+        # the mapping is still usable
+        assert not m.closed
+        assert bytes(m[:]) == b'hello'
+
+        view.release()
+        m.close()
+        assert m.closed
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    run_tests(globals())
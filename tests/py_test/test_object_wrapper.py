@@ -0,0 +1,62 @@
+import ail.py_runtime
+
+from ail.core.aobjects import convert_to_ail_object
+from ail.objects.class_object import (
+    class_setattr, new_class, new_object, object_setattr
+)
+from ail.py_runtime.objects import AILObjectWrapper
+
+from _util import run_tests
+
+
+def hello(self):
+    return 'hello'
+
+
+def hi(self):
+    return 'hi'
+
+
+def make_object():
+    cls = new_class('C', [], {'greet': convert_to_ail_object(hello)})
+    return cls, new_object(cls)
+
+
+def test_method_wrapper_reused():
+    _, o = make_object()
+    w = AILObjectWrapper(o)
+
+    assert w.greet() == 'hello'
+    assert w.greet is w.greet
+
+
+def test_changed_through_class():
+    cls, o = make_object()
+    w = AILObjectWrapper(o)
+
+    assert w.greet() == 'hello'
+    class_setattr(cls, 'greet', convert_to_ail_object(hi))
+    assert w.greet() == 'hi'
+
+
+def test_changed_through_object():
+    _, o = make_object()
+    w = AILObjectWrapper(o)
+
+    assert w.greet() == 'hello'
+    object_setattr(o, 'greet', convert_to_ail_object(1))
+    assert w.greet == 1
+
+
+def test_changed_through_other_wrapper():
+    _, o = make_object()
+    w1 = AILObjectWrapper(o)
+    w2 = AILObjectWrapper(o)
+
+    assert w1.greet() == 'hello'
+    w2.greet = 'not a method'
+    assert w1.greet == 'not a method'
+
+
+if __name__ == '__main__':
+    run_tests(globals())
@@ -0,0 +1,158 @@
+import io
+import marshal
+import os
+import shutil
+import tempfile
+
+from contextlib import redirect_stderr, redirect_stdout
+
+import ail.ail_main  # sets the module search paths
+
+from ail.core import aconfig, pyexec
+from ail.core.alex import Lex
+from ail.core.aparser import Parser
+from ail.core.apreload import ImportGraph, _compile_module, preload_imports
+
+from _util import run_tests
+
+
+_TREE = {
+    'main.ail': 'import "a"\nimport "b"\nprint a.x + b.y\n',
+    'a.ail': 'import "b"\nx = b.y + 1\n',
+    'b.ail': 'y = 2\n',
+    'broken.ail': 'x = (\n',
+    'pymod.py': '',
+}
+
+
+class _Tree:
+    # a module tree in a new directory, which is the working directory
+    # while in the with block
+    def __enter__(self) -> str:
+        self.__cwd = os.getcwd()
+        self.__dir = os.path.realpath(tempfile.mkdtemp())
+
+        for name, source in _TREE.items():
+            with open(os.path.join(self.__dir, name), 'w') as f:
+                f.write(source)
+
+        os.chdir(self.__dir)
+        return self.__dir
+
+    def __exit__(self, *_):
+        os.chdir(self.__cwd)
+        shutil.rmtree(self.__dir)
+
+
+def _parse(source: str, path: str):
+    return Parser().parse(Lex().lex(source, path), source, path, True)
+
+
+def test_import_graph():
+    with _Tree() as d:
+        main, a, b, py = (os.path.join(d, n)
+                          for n in ('main.ail', 'a.ail', 'b.ail', 'pymod.py'))
+        graph = ImportGraph()
+
+        # missing modules and repeated imports are left to the importer
+        new = graph.add_module(main, ['a', 'b', 'a', 'missing', 'pymod'])
+        assert new == [a, b]
+        assert graph.dependencies == {main: [a, b, py], py: []}
+
+        assert graph.add_module(a, ['b']) == [b]
+        assert graph.add_module(b, []) == []
+        assert graph.add_module(a, ['b']) == []
+
+        assert graph.get_dependents(b) == [main, a]
+        assert graph.get_dependents(main) == []
+
+
+def test_compile_module():
+    with _Tree() as d:
+        path = os.path.join(d, 'a.ail')
+        p, source, code, names = _compile_module(path)
+
+        assert (p, source, names) == (path, _TREE['a.ail'], ['b'])
+        assert marshal.loads(code).co_filename == path
+
+        for name in ('broken.ail', 'missing.ail'):
+            path = os.path.join(d, name)
+            assert _compile_module(path) == (path, None, None, [])
+
+
+def test_preload_imports():
+    with _Tree() as d:
+        main = os.path.join(d, 'main.ail')
+        graph = preload_imports(_parse(_TREE['main.ail'], main), main)
+
+        a, b = os.path.join(d, 'a.ail'), os.path.join(d, 'b.ail')
+        assert graph.dependencies == {main: [a, b], a: [b], b: []}
+
+        for path in (a, b):
+            with open(path) as f:
+                assert pyexec.get_cached_code(path, f.read()) is not None
+
+        # a changed source is not taken from the cache
+        assert pyexec.get_cached_code(b, 'y = 3\n') is None
+
+
+def test_modules_compiled_once():
+    compiled = []
+    compile_ail_source = pyexec.compile_ail_source
+
+    def counting(source: str, filename: str):
+        compiled.append(os.path.basename(filename))
+        return compile_ail_source(source, filename)
+
+    preload = aconfig.PRELOAD_IMPORTS
+    aconfig.PRELOAD_IMPORTS = True
+    pyexec.compile_ail_source = counting
+
+    try:
+        with _Tree() as d:
+            out = io.StringIO()
+            with redirect_stdout(out):
+                pyexec.exec_as_python(
+                    _TREE['main.ail'], os.path.join(d, 'main.ail'), dict())
+    finally:
+        pyexec.compile_ail_source = compile_ail_source
+        aconfig.PRELOAD_IMPORTS = preload
+
+    # a and b are compiled by the preloading workers, then imported from
+    # the compile cache
+    assert out.getvalue() == '5\n'
+    assert compiled == ['main.ail'], compiled
+
+
+def test_bad_imports():
+    with _Tree() as d:
+        main = os.path.join(d, 'main.ail')
+        source = 'import "a"\nimport "broken"\nimport "missing"\n'
+        graph = preload_imports(_parse(source, main), main)
+
+        a, broken = os.path.join(d, 'a.ail'), os.path.join(d, 'broken.ail')
+        assert graph.dependencies[main] == [a, broken]
+        assert pyexec.get_cached_code(a, _TREE['a.ail']) is not None
+        assert pyexec.get_cached_code(broken, _TREE['broken.ail']) is None
+
+        # the other modules load as usual
+        out = io.StringIO()
+        with redirect_stdout(out):
+            pyexec.exec_as_python(_TREE['main.ail'], main, dict())
+        assert out.getvalue() == '5\n'
+
+        # the broken module reports its error when it is imported
+        err = io.StringIO()
+        try:
+            with redirect_stdout(err), redirect_stderr(err):
+                pyexec.exec_as_python(
+                    'import "broken"\n', os.path.join(d, 'm.ail'), dict())
+        except SystemExit:
+            pass
+        else:
+            raise AssertionError('broken module imported')
+        assert 'SyntaxError' in err.getvalue()
+
+
+if __name__ == '__main__':
+    run_tests(globals())
@@ -0,0 +1,37 @@
+from ail.modules.range import (
+    StopIteration as STOP, rangeFromTo, rangeTo, range_
+)
+
+from _util import run_tests
+
+
+def test_next():
+    r = rangeFromTo(1, 4)
+    assert [r.next() for _ in range(4)] == [1, 2, 3, STOP]
+    assert r.next() is STOP
+
+
+def test_iterate_twice():
+    r = range_(0, 10, 3)
+    assert list(r) == [0, 3, 6, 9]
+    assert list(r) == [0, 3, 6, 9]
+    assert [(a, b) for a in r for b in r][:2] == [(0, 0), (0, 3)]
+
+
+def test_iterate_after_next():
+    # for-loops do not share the position of next()
+    r = rangeTo(3)
+    assert r.next() == 0
+    assert list(r) == [0, 1, 2]
+    assert r.next() == 1
+
+
+def test_sequence():
+    r = rangeTo(5)
+    assert len(r) == 5
+    assert r[-1] == 4
+    assert 3 in r and 5 not in r
+
+
+if __name__ == '__main__':
+    run_tests(globals())
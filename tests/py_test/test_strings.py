@@ -0,0 +1,99 @@
+from ail.modules.strings import (
+    StringBuilder, find, format, join, lines, replace, split, strcmp
+)
+
+from _util import expect, run_tests
+
+
+def test_string_builder():
+    sb = StringBuilder('a')
+    assert sb.size == len(sb) == 1
+
+    assert sb.append('bc').append(1).append(None) is sb
+    assert sb.toString() == 'abc1None'
+    assert sb.size == 8
+
+    sb.appendLine('x').appendLine()
+    assert str(sb) == 'abc1Nonex\n\n'
+    assert sb.size == 11
+
+    # toString() can be called again, and appending goes on after it
+    sb.append('y')
+    assert sb.toString() == 'abc1Nonex\n\ny'
+
+    sb.clear()
+    assert sb.toString() == '' and sb.size == 0
+    assert StringBuilder().toString() == ''
+
+
+def test_join_split():
+    assert join(', ', ['a', 1, None]) == 'a, 1, None'
+    assert join('', []) == ''
+    expect(TypeError, join, 1, ['a'])
+
+    assert split('a b  c') == ['a', 'b', 'c']
+    assert split('a,b,c', ',', 1) == ['a', 'b,c']
+    expect(TypeError, split, None)
+
+
+def test_replace_find():
+    assert replace('aaa', 'a', 'b') == 'bbb'
+    assert replace('aaa', 'a', 'b', 2) == 'bba'
+    expect(TypeError, replace, 1, 'a', 'b')
+
+    assert find('abcabc', 'c') == 2
+    assert find('abcabc', 'c', 3) == 5
+    assert find('abc', 'd') == -1
+    expect(TypeError, find, 1, 'a')
+
+
+def test_format():
+    assert format('%s=%d', 'x', 1) == 'x=1'
+    assert format('no items') == 'no items'
+    expect(TypeError, format, '%d', 'x')
+    expect(TypeError, format, None)
+
+
+def test_lines_of_string():
+    text = 'a\n\nb\nlast'
+    assert list(lines(text)) == ['a', '', 'b', 'last']
+    assert list(lines(text, True)) == ['a\n', '\n', 'b\n', 'last']
+
+    assert list(lines('a\n')) == ['a']
+    assert list(lines('a\n', True)) == ['a\n']
+    assert list(lines('')) == []
+
+
+def test_lines_of_chunks():
+    text = 'first\nsecond line\n\nlast'
+
+    # every way to cut the text in two gives the lines of the whole text
+    for i in range(len(text) + 1):
+        chunks = [text[:i], text[i:]]
+        assert list(lines(chunks)) == list(lines(text)), chunks
+        assert list(lines(chunks, True)) == list(lines(text, True)), chunks
+
+    chunks = iter(['a', 'b\nc', 'd', '\n', 'e'])
+    assert list(lines(chunks, True)) == ['ab\n', 'cd\n', 'e']
+    assert list(lines(['a\n', ''], True)) == ['a\n']
+    assert list(lines([])) == []
+
+    expect(TypeError, list, lines(['a', b'b\n']))
+
+
+def test_strcmp():
+    assert strcmp('a', 'b') == -1
+    assert strcmp('b', 'a') == 1
+    assert strcmp('abc', 'abc') == 0
+
+    # lexicographic, not by length
+    assert strcmp('b', 'aaa') == 1
+    assert strcmp('ab', 'abc') == -1
+    assert strcmp('', 'a') == -1
+
+    expect(TypeError, strcmp, 'a', 1)
+    expect(TypeError, strcmp, None, 'a')
+
+
+if __name__ == '__main__':
+    run_tests(globals())
@@ -0,0 +1,132 @@
+from ail.core.aobjects import convert_to_ail_object
+from ail.py_runtime.functions import (
+    bind_function, make_struct, new_struct_object
+)
+from ail.py_runtime.objects import AILArrayView, convert_object
+from ail.py_runtime.structarray import StructArray
+
+from _util import run_tests
+
+
+def _view(values: list) -> AILArrayView:
+    # an array got from an AIL object
+    view = convert_object(convert_to_ail_object(values))
+    assert type(view) is AILArrayView
+    return view
+
+
+def test_new():
+    point = make_struct('Point', ['x', 'y'], [])
+
+    p = new_struct_object(point, [1, 2])
+    assert (p.x, p.y) == (1, 2)
+
+    p = new_struct_object(point, {'y': 3})
+    assert (p.x, p.y) == (None, 3)
+
+    p = new_struct_object(point)
+    assert (p.x, p.y) == (None, None)
+
+
+def test_new_member_named_like_locals():
+    # the generated constructor must not mix up members with its locals
+    s = make_struct('S', ['obj', 'new'], [])
+
+    o = new_struct_object(s, [5, 6])
+    assert (o.obj, o.new) == (5, 6)
+
+    o = new_struct_object(s, {'obj': 7})
+    assert (o.obj, o.new) == (7, None)
+
+
+def _make_bird():
+    # the strategy pattern of tests/test_strategy.ail
+    bird = make_struct('bird', ['__fly', 'name'], [])
+
+    @bind_function('fly', bird)
+    def fly(this):
+        return this.__fly()
+
+    @bind_function('set_fly', bird)
+    def set_fly(this, f):
+        this.__fly = f
+
+    return bird
+
+
+def test_function_member_bound():
+    bird = _make_bird()
+
+    def rocket_fly(this):
+        return 'rocket', this.name
+
+    b = new_struct_object(bird, [rocket_fly, 'swallow'])
+    assert b.fly() == ('rocket', 'swallow')
+
+    b = new_struct_object(bird, {'name': 'eagle'})
+    b.set_fly(lambda this: this)
+    assert b.fly() is b
+
+
+def test_function_member_set_outside():
+    point = make_struct('Point', ['x'], [])
+
+    # only new() and the methods bind functions
+    p = new_struct_object(point)
+    p.x = len
+    assert p.x is len
+
+
+def test_private_member_from_nested_code():
+    counter = make_struct('Counter', ['__n', 'step'], ['step'])
+
+    @bind_function('add_all', counter)
+    def add_all(this, values):
+        def add(v):
+            this.__n = this.__n + v
+
+        for v in values:
+            add(v)
+
+        return [this.__n * k for k in (1, 2)]
+
+    @bind_function('getter', counter)
+    def getter(this):
+        return lambda: (this.__n, this.step)
+
+    c = new_struct_object(counter, [0, 1])
+    assert c.add_all([1, 2, 3]) == [6, 12]
+    assert c.getter()() == (6, 1)
+
+    for name, value in (('__n', 1), ('step', 2)):
+        try:
+            setattr(c, name, value)
+        except AttributeError:
+            pass
+        else:
+            raise AssertionError('%s is set from outside' % name)
+
+    try:
+        getattr(c, '__n')
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError('__n is read from outside')
+
+
+def test_array_views():
+    point = make_struct('Point', _view(['x', 'y']), _view([]),
+                        _view(['int', 'int']))
+    assert point.packed_size == 16
+
+    p = new_struct_object(point, _view([1, 2]))
+    assert (p.x, p.y) == (1, 2)
+
+    points = StructArray(point)
+    points.append(_view([3, 4]))
+    points[0] = _view([5, 6])
+    assert (points[0].x, points[0].y) == (5, 6)
+
+
+if __name__ == '__main__':
+    run_tests(globals())
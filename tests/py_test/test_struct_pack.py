@@ -0,0 +1,110 @@
+import struct
+
+from ail.py_runtime.functions import (
+    bind_function, make_struct, new_struct_object
+)
+
+from _util import expect, run_tests
+
+
+def _fields(o, members):
+    return tuple(getattr(o, m) for m in members)
+
+
+def test_pack_round_trip():
+    members = ['b', 'i', 'u', 'f', 'ok', 'raw', 'name']
+    rec = make_struct('Rec', members, [],
+                      ['i8', 'i32', 'u64', 'f64', 'bool', 'bytes(3)', 'str(6)'])
+    values = [-3, -70000, 2 ** 63, 0.25, True, b'ab\0', 'ail']
+
+    r = new_struct_object(rec, values)
+    data = r.pack()
+
+    assert len(data) == rec.packed_size == 1 + 4 + 8 + 8 + 1 + 3 + 6
+    assert _fields(rec.unpack(data), members) == tuple(values)
+
+
+def test_pack_into_and_offsets():
+    point = make_struct('Point', ['x', 'y'], [], ['i32', 'f32'])
+    size = point.packed_size
+    buf = bytearray(size * 3 + 1)
+
+    for i in range(3):
+        new_struct_object(point, [i, i + 0.5]).pack_into(buf, size * i + 1)
+
+    assert _fields(point.unpack(buf, size + 1), ['x', 'y']) == (1, 1.5)
+    assert point.unpack(memoryview(buf), size * 2 + 1).x == 2
+
+
+def test_iter_unpack():
+    point = make_struct('Point', ['x', 'y'], [], ['i32', 'f32'])
+    data = b''.join(new_struct_object(point, [i, i / 4]).pack()
+                    for i in range(5))
+
+    assert [_fields(p, ['x', 'y']) for p in point.iter_unpack(data)] == \
+        [(i, i / 4) for i in range(5)]
+
+    # a broken record at the end
+    expect(struct.error, point.iter_unpack, data[:-1])
+
+    # records with str members decode each of them
+    user = make_struct('User', ['id', 'name'], [], ['u16', 'str(4)'])
+    data = new_struct_object(user, [1, 'ab']).pack() + \
+        new_struct_object(user, [2, 'ñ']).pack()
+
+    assert [_fields(u, ['id', 'name']) for u in user.iter_unpack(data)] == \
+        [(1, 'ab'), (2, 'ñ')]
+
+
+def test_untyped_struct_has_no_codec():
+    s = make_struct('S', ['a', 'b'], [], ['i32', None])
+    assert not hasattr(s, 'pack')
+    assert not hasattr(s, 'packed_size')
+
+
+def test_str_member():
+    user = make_struct('User', ['id', 'name'], [], ['u32', 'str(8)'])
+
+    u = new_struct_object(user, [1, 'añb'])  # 4 bytes in UTF-8
+    assert user.unpack(u.pack()).name == 'añb'
+
+    # exactly 8 bytes, no room for padding
+    u = new_struct_object(user, [1, 'ñññ12'])
+    assert user.unpack(u.pack()).name == 'ñññ12'
+
+
+def test_str_member_too_long():
+    user = make_struct('User', ['id', 'name'], [], ['u32', 'str(8)'])
+
+    # 9 bytes in UTF-8, cutting it at 8 would split the last 'ñ'
+    u = new_struct_object(user, [1, '1234567ñ'])
+    expect(ValueError, u.pack)
+    expect(ValueError, u.pack_into, bytearray(user.packed_size))
+
+
+def test_str_member_invalid_utf8():
+    user = make_struct('User', ['id', 'name'], [], ['u32', 'str(8)'])
+    data = (1).to_bytes(4, 'little') + b'abc\xc3\0\0\0\0'
+
+    expect(UnicodeDecodeError, user.unpack, data)
+
+
+def test_codec_name_clash():
+    expect(TypeError, make_struct, 'S', ['pack', 'x'], [], ['i32', 'i32'])
+    expect(TypeError, make_struct, 'S', ['packed_size'], [], ['i32'])
+
+    # untyped structs have no codec, the names are free
+    s = make_struct('S', ['pack', 'x'], [])
+    assert new_struct_object(s, [1, 2]).pack == 1
+
+    point = make_struct('Point', ['x', 'y'], [], ['i32', 'i32'])
+
+    def unpack(this):
+        return this.x
+
+    expect(TypeError, bind_function('unpack', point), unpack)
+    assert point.unpack(new_struct_object(point, [1, 2]).pack()).x == 1
+
+
+if __name__ == '__main__':
+    run_tests(globals())
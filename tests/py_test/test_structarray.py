@@ -0,0 +1,156 @@
+from array import array
+
+from ail.py_runtime.functions import make_struct, new_struct_object
+from ail.py_runtime.structarray import StructArray, StructRow
+
+from _util import expect, run_tests
+
+
+def _make_point():
+    return make_struct('Point', ['x', 'y'], [])
+
+
+def test_new():
+    points = StructArray(_make_point(), 3)
+    assert len(points) == 3
+    assert [(p.x, p.y) for p in points] == [(0, 0)] * 3
+
+    expect(TypeError, StructArray, None)
+    expect(ValueError, StructArray, _make_point(), -1)
+
+
+def test_append():
+    point = _make_point()
+    points = StructArray(point)
+
+    points.append([1, 2])
+    points.append((3, 4))
+    points.append({'y': 6})
+    points.append(new_struct_object(point, [7, 8]))
+    points.append(points[0])
+
+    assert len(points) == 5
+    assert [(p.x, p.y) for p in points] == \
+        [(1, 2), (3, 4), (0, 6), (7, 8), (1, 2)]
+
+    # a bad row changes nothing
+    expect(ValueError, points.append, [1])
+    expect(AttributeError, points.append, {'z': 1})
+    expect(TypeError, points.append, new_struct_object(_make_point()))
+    expect(TypeError, points.append, 1)
+    assert len(points) == 5
+    assert len(points.column('x')) == 5
+
+
+def test_indexing():
+    points = StructArray(_make_point())
+    points.extend([[i, -i] for i in range(4)])
+
+    row = points[-1]
+    assert type(row) is StructRow
+    assert (row.x, row.y) == (3, -3)
+
+    expect(IndexError, points.__getitem__, 4)
+    expect(IndexError, points.__getitem__, -5)
+    expect(TypeError, points.__getitem__, '0')
+    expect(AttributeError, getattr, row, 'z')
+
+    points[1] = {'x': 10, 'y': 20}
+    assert (points[1].x, points[1].y) == (10, 20)
+
+
+def test_row_write_through():
+    point = _make_point()
+    points = StructArray(point, 2)
+
+    row = points[1]
+    row.x = 5
+    assert points.column('x')[1] == 5
+    assert points[1].x == 5
+
+    # to_object() copies the row
+    p = row.to_object()
+    assert type(p) is point
+    assert (p.x, p.y) == (5, 0)
+    p.x = 6
+    assert row.x == 5
+
+    expect(AttributeError, setattr, row, 'z', 1)
+
+
+def test_untyped_columns():
+    points = StructArray(_make_point())
+
+    points.append([1, 2])
+    assert points.column('x') == array('q', [1])
+
+    # an int column is upcast to float, other values make it a list
+    points.append([1.5, 2])
+    assert points.column('x') == array('d', [1.0, 1.5])
+    points[0].x = 'a'
+    assert points.column('x') == ['a', 1.5]
+
+    assert points.column('y') == array('q', [2, 2])
+    points.append([0, 1 << 64])
+    assert points.column('y') == [2, 2, 1 << 64]
+
+
+def test_typed_columns():
+    point = make_struct('Point', ['x', 'y', 'tag'], [],
+                        ['i16', 'float', None])
+    points = StructArray(point, 1)
+
+    assert points.column('x').typecode == 'h'
+    assert points.column('y').typecode == 'd'
+
+    points.append([1, 2, 'a'])
+    points.extend([[3, 4.5, None]])
+    assert points.column('x') == array('h', [0, 1, 3])
+    assert points.column('y') == array('d', [0.0, 2.0, 4.5])
+    assert points.column('tag') == [0, 'a', None]
+
+    # typed columns never change their type
+    expect(TypeError, setattr, points[0], 'x', 1.5)
+    expect(OverflowError, setattr, points[0], 'x', 1 << 20)
+    expect(TypeError, points.extend, [[0, 0.0, 0], ['a', 0.0, 0]])
+    assert len(points) == 3
+    assert points.column('x').typecode == 'h'
+    assert len(points.column('tag')) == 3
+
+
+def test_bad_row_changes_nothing():
+    point = make_struct('Point', ['tag', 'x', 'y'], [],
+                        [None, 'i32', 'i32'])
+    points = StructArray(point)
+    points.append(['a', 1, 2])
+
+    # a typed value after the first columns fails
+    expect(TypeError, points.append, ['b', 3, 'bad'])
+    expect(OverflowError, points.append, ['b', 1 << 40, 1])
+    assert len(points) == 1
+    assert [len(points.column(m)) for m in ('tag', 'x', 'y')] == [1, 1, 1]
+
+    points.append(['c', 7, 8])
+    assert [(p.tag, p.x, p.y) for p in points] == [('a', 1, 2), ('c', 7, 8)]
+
+    expect(TypeError, points.__setitem__, 0, ['d', 9, 'bad'])
+    expect(OverflowError, points.__setitem__, 1, {'tag': 'd', 'y': 1 << 40})
+    assert [(p.tag, p.x, p.y) for p in points] == [('a', 1, 2), ('c', 7, 8)]
+
+
+def test_sort_by():
+    points = StructArray(_make_point())
+    points.extend([[3, 'c'], [1, 'a'], [2, 'b']])
+
+    points.sort_by('x')
+    assert [(p.x, p.y) for p in points] == [(1, 'a'), (2, 'b'), (3, 'c')]
+    assert type(points.column('x')) is array
+
+    points.sort_by('y', True)
+    assert [p.y for p in points] == ['c', 'b', 'a']
+
+    expect(AttributeError, points.sort_by, 'z')
+
+
+if __name__ == '__main__':
+    run_tests(globals())
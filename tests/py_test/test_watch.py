@@ -0,0 +1,101 @@
+import io
+import os
+import shutil
+import tempfile
+
+from contextlib import redirect_stderr, redirect_stdout
+
+import ail.ail_main  # sets the module search paths
+
+from ail.core import pyexec
+from ail.core.awatch import Watcher
+from ail.py_runtime import shared as rt_shared
+
+from _util import run_tests
+
+
+# main imports a and c, a imports b
+_TREE = {
+    'main.ail': 'import "a"\nimport "c"\nprint a.x, c.z\n',
+    'a.ail': 'import "b"\nx = b.y + 1\n',
+    'b.ail': 'y = 1\n',
+    'c.ail': 'z = 0\n',
+}
+
+
+def _write(path: str, source: str):
+    with open(path, 'w') as f:
+        f.write(source)
+
+
+def _get_globals(path: str) -> dict:
+    return getattr(rt_shared.loaded_modules[path], '_$_module_globals')
+
+
+def _reload(watcher: Watcher, *paths: str) -> str:
+    """
+    :return: what reload_changed() reports
+    """
+    err = io.StringIO()
+    with redirect_stdout(err), redirect_stderr(err):
+        watcher.reload_changed(set(paths))
+    return err.getvalue()
+
+
+def test_reload_changed():
+    cwd = os.getcwd()
+    d = os.path.realpath(tempfile.mkdtemp())
+    main, a, b, c = (os.path.join(d, n + '.ail')
+                     for n in ('main', 'a', 'b', 'c'))
+
+    try:
+        for name, source in _TREE.items():
+            _write(os.path.join(d, name), source)
+        os.chdir(d)
+
+        out = io.StringIO()
+        with redirect_stdout(out):
+            pyexec.exec_as_python(_TREE['main.ail'], main, dict())
+        assert out.getvalue() == '2 0\n'
+
+        watcher = Watcher(main)
+        graph = watcher.get_graph()
+        assert graph.dependencies[main] == [a, c]
+        assert graph.dependencies[a] == [b]
+
+        # b and a, which imports b, are reloaded in dependency order
+        _write(b, 'y = 10\n')
+        _write(c, 'z = 1\n')
+        report = _reload(watcher, b)
+        assert report.startswith('[watch] reloaded b.ail, a.ail in '), report
+        assert _get_globals(a)['x'] == 11
+        assert _get_globals(c)['z'] == 0
+
+        # an error is reported, the modules after it are not reloaded
+        _write(b, 'y = 1 / 0\n')
+        report = _reload(watcher, b)
+        assert 'ZeroDivisionError' in report, report
+        assert "[watch] failed to reload '%s'" % b in report, report
+        assert _get_globals(a)['x'] == 11
+
+        _write(a, 'x = (\n')
+        report = _reload(watcher, a)
+        assert 'SyntaxError' in report, report
+        assert "[watch] failed to reload '%s'" % a in report, report
+
+        # the watcher goes on after the errors
+        _write(a, 'import "b"\nx = b.y + 2\n')
+        _write(b, 'y = 20\n')
+        report = _reload(watcher, a, b)
+        assert report.startswith('[watch] reloaded b.ail, a.ail in '), report
+        assert _get_globals(a)['x'] == 22
+
+        # the main module is run again by the watcher, not reloaded
+        assert _reload(watcher, main) == ''
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(d)
+
+
+if __name__ == '__main__':
+    run_tests(globals())